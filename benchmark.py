@@ -0,0 +1,285 @@
+# Arquivo [benchmark.py]
+
+"""
+Benchmarks dos operadores e do AG completo do projeto DRE.
+
+Mede, para cada cenário, o tempo de `calculate_fitness`, dos crossovers
+(`doac_cross`, `crossover_por_consenso`, `ffd_crossover`), da `swap_mutation`,
+da `robin_hood_mutation` e de uma execução completa do AG, sempre com uma
+medida de qualidade da solução ao lado do tempo. O resultado é um JSON
+que pode ser salvo como baseline e comparado com execuções futuras.
+
+Uso:
+    python -m dre bench                                   # Cenários padrão
+    python -m dre bench --cenarios desafiador,sintetico-100000 --saida bench.json
+    python -m dre bench --baseline bench.json             # Compara e aponta regressões
+
+Cenários: 'teste' (cenario_teste.json), 'desafiador' (cenario_desafiador.json),
+'vmware' (exportação CSV) e 'sintetico-N' (N VMs do `scenario_generator`, com semente fixa).
+
+Este módulo define:
+- CENARIOS_PADRAO: Os cenários medidos quando nenhum é informado.
+- carregar_cenario_benchmark: Carrega um cenário pelo nome.
+- executar_benchmarks: Executa os benchmarks e retorna o relatório (dict).
+- comparar_com_baseline: Compara um relatório com um baseline salvo.
+"""
+
+# Importando
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import random
+import time
+import numpy as np
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from datacenter_model import MaquinaVirtual, ServidorFisico
+from fitness_engine import construir_arrays_cenario, calculate_fitness_arrays, calculate_population_fitness, fitness_primario
+from genetic_algorithm import calculate_fitness, doac_cross, crossover_por_consenso, ffd_crossover, swap_mutation, robin_hood_mutation
+from lower_bounds import calcular_limite_inferior
+from population_init import gerar_populacao_inicial
+from ga_runner import GeneticAlgorithmRunner, carregar_datacenter
+from scenario_generator import gerar_cenario
+
+
+
+# ===[ 1. Cenários ]=====================================================================
+
+CENARIOS_PADRAO = ('teste', 'desafiador', 'vmware', 'sintetico-10000')
+
+# Os arquivos dos cenários ficam na raiz do projeto, ao lado deste módulo
+# (independente do diretório de onde o benchmark é executado).
+DIRETORIO_CENARIOS = os.path.dirname(os.path.abspath(__file__))
+
+ARQUIVOS_CENARIO = {
+    'teste': ('json', 'cenario_teste.json'),
+    'desafiador': ('json', 'cenario_desafiador.json'),
+    'vmware': ('vmware', ''),
+}
+
+# ffd_crossover percorre todos os servidores para cada VM (O(V x S)) e não pode ser
+# interrompido no meio: acima deste produto, a medição é pulada.
+LIMITE_FFD_VM_X_SERVIDOR = 5e7
+
+
+def _cenario_sintetico(num_vms: int, semente: int) -> Tuple[List[MaquinaVirtual], List[ServidorFisico]]:
+    """Cenário sintético do `scenario_generator` (tamanhos do catálogo, ~70% de ocupação)."""
+    return gerar_cenario(num_vms, aperto=0.7, semente=semente)
+
+
+def carregar_cenario_benchmark(nome: str, semente: int = 0) -> Tuple[List[MaquinaVirtual], List[ServidorFisico]]:
+    """Carrega um cenário pelo nome ('teste', 'desafiador', 'vmware' ou 'sintetico-N')."""
+    if nome.startswith('sintetico-'):
+        tamanho = nome.split('-', 1)[1]
+        if not tamanho.isdigit():
+            raise ValueError(f"Cenário '{nome}' inválido: use sintetico-N, com N inteiro.")
+        return _cenario_sintetico(int(tamanho), semente)
+    if nome not in ARQUIVOS_CENARIO:
+        raise ValueError(f"Cenário '{nome}' desconhecido. Use {', '.join(ARQUIVOS_CENARIO)} ou sintetico-N.")
+    origem, arquivo = ARQUIVOS_CENARIO[nome]
+    caminho = os.path.join(DIRETORIO_CENARIOS, arquivo) if arquivo else ''
+    with contextlib.redirect_stdout(io.StringIO()):
+        cenario = carregar_datacenter(origem, caminho, os.path.join(DIRETORIO_CENARIOS, 'ExportList--servidores.csv'),
+                                      os.path.join(DIRETORIO_CENARIOS, 'ExportList--VMs.csv'))
+    if cenario is None:
+        raise ValueError(f"Falha ao carregar o cenário '{nome}'.")
+    return cenario
+
+
+# ===[ 2. Medição ]======================================================================
+
+def _cronometrar(funcao: Callable, argumentos: Sequence[Tuple], orcamento_s: float, max_chamadas: int) -> Tuple[int, float, List]:
+    """
+    Chama `funcao` percorrendo `argumentos` em ciclo até esgotar o orçamento de tempo
+    ou o número máximo de chamadas (pelo menos uma chamada). Retorna
+    (chamadas, tempo_total, resultados). A saída (prints) dos operadores é descartada.
+    """
+    resultados = []
+    total = 0.0
+    chamadas = 0
+    with contextlib.redirect_stdout(io.StringIO()):
+        while chamadas < max(1, max_chamadas) and (chamadas == 0 or total < orcamento_s):
+            args = argumentos[chamadas % len(argumentos)]
+            inicio = time.perf_counter()
+            resultados.append(funcao(*args))
+            total += time.perf_counter() - inicio
+            chamadas += 1
+    return chamadas, total, resultados
+
+
+def _resumo_fitness(individuos: List[List[int]], cenario) -> Dict:
+    """Qualidade de um conjunto de soluções: melhor/média do nº de servidores e fração viável."""
+    fitness = calculate_population_fitness(np.asarray(individuos), cenario).fitness
+    viaveis = np.isfinite(fitness)
+    return {
+        'melhor_fitness': float(fitness.min()) if len(fitness) else None,
+        'fitness_medio': float(fitness[viaveis].mean()) if viaveis.any() else None,
+        'fracao_viavel': float(viaveis.mean()) if len(fitness) else 0.0,
+    }
+
+
+def _registro(cenario_nome: str, operacao: str, chamadas: int, total: float, qualidade: Dict) -> Dict:
+    return {
+        'cenario': cenario_nome,
+        'operacao': operacao,
+        'chamadas': chamadas,
+        'tempo_total_s': total,
+        'tempo_medio_s': total / chamadas if chamadas else None,
+        'qualidade': qualidade,
+    }
+
+
+def _benchmark_operadores(nome: str, vms, servidores, orcamento_s: float, max_chamadas: int, semente: int) -> List[Dict]:
+    """Mede cada operador sobre uma amostra de indivíduos da população inicial."""
+    cenario = construir_arrays_cenario(vms, servidores)
+    rng = np.random.default_rng(semente)
+    random.seed(semente)
+    with contextlib.redirect_stdout(io.StringIO()):
+        amostra = gerar_populacao_inicial(vms, servidores, 10, rng=rng, cenario=cenario)
+    pares = [(amostra[i], amostra[(i + 1) % len(amostra)]) for i in range(len(amostra))]
+    registros = []
+
+    # Fitness: o modelo "Lousa Limpa" e, para comparação, a versão em arrays.
+    chamadas, total, valores = _cronometrar(lambda ind: calculate_fitness(ind, vms, servidores), [(ind,) for ind in amostra], orcamento_s, max_chamadas)
+    registros.append(_registro(nome, 'calculate_fitness', chamadas, total, {'fitness_medio': float(np.mean([v for v in valores if np.isfinite(v)] or [np.nan]))}))
+    chamadas, total, _ = _cronometrar(lambda ind: calculate_fitness_arrays(ind, cenario), [(ind,) for ind in amostra], orcamento_s, max_chamadas)
+    registros.append(_registro(nome, 'calculate_fitness_arrays', chamadas, total, {}))
+
+    # Crossovers: qualidade dos filhos.
+    for operacao, funcao in (
+        ('doac_cross', lambda p1, p2: doac_cross(p1, p2, vms, servidores)),
+        ('crossover_por_consenso', lambda p1, p2: crossover_por_consenso(p1, p2, vms, servidores)),
+        ('ffd_crossover', lambda p1, p2: ffd_crossover(vms, servidores)),
+    ):
+        if operacao == 'ffd_crossover' and len(vms) * len(servidores) > LIMITE_FFD_VM_X_SERVIDOR:
+            registros.append(_registro(nome, operacao, 0, 0.0, {'pulado': f"V x S acima de {LIMITE_FFD_VM_X_SERVIDOR:.0e}"}))
+            continue
+        chamadas, total, filhos = _cronometrar(funcao, pares, orcamento_s, max_chamadas if operacao != 'ffd_crossover' else 1)
+        # A qualidade usa só a primeira passada pelos pares (determinística pela semente),
+        # e não o número de chamadas, que depende do tempo.
+        registros.append(_registro(nome, operacao, chamadas, total, _resumo_fitness([f for par in filhos[:len(pares)] for f in par], cenario)))
+
+    # Mutações (probabilidade 1.0, para medir o trabalho de cada chamada).
+    # A swap_mutation altera o cromossomo no lugar: as medições usam cópias e a
+    # qualidade é avaliada à parte, uma mutação por indivíduo da amostra.
+    for operacao, funcao in (
+        ('swap_mutation', lambda ind: swap_mutation(ind, vms, servidores, 1.0)),
+        ('robin_hood_mutation', lambda ind: robin_hood_mutation(ind, vms, servidores, 1.0)),
+    ):
+        chamadas, total, _ = _cronometrar(funcao, [(list(ind),) for ind in amostra], orcamento_s, max_chamadas)
+        with contextlib.redirect_stdout(io.StringIO()):
+            mutantes = [list(funcao(list(ind))) for ind in amostra]
+        qualidade = _resumo_fitness(mutantes, cenario)
+        qualidade['fracao_alterada'] = float(np.mean([m != ind for m, ind in zip(mutantes, amostra)]))
+        registros.append(_registro(nome, operacao, chamadas, total, qualidade))
+
+    return registros
+
+
+def _benchmark_ag(nome: str, vms, servidores, parametros_ag: Dict, semente: int) -> Dict:
+    """Executa o AG completo (sem relatórios nem interface) e registra tempo e qualidade."""
+    random.seed(semente)
+    inicio = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        runner = GeneticAlgorithmRunner(vms, servidores, **parametros_ag)
+        runner.executar(gerar_relatorios=False)
+    total = time.perf_counter() - inicio
+    estatisticas = runner.estatisticas()
+    return _registro(nome, 'ag_completo', 1, total, {
+        'melhor_fitness': fitness_primario(estatisticas['melhor_fitness']),
+        'limite_inferior': estatisticas['limite_inferior'],
+        'gap': estatisticas['gap'],
+        'geracoes': estatisticas['geracoes'],
+        'motivo_parada': estatisticas['motivo_parada'],
+        'tempo_fases': estatisticas['tempo_fases'],
+    })
+
+
+# ===[ 3. Execução e Comparação ]========================================================
+
+def executar_benchmarks(
+    cenarios: Sequence[str] = CENARIOS_PADRAO,
+    orcamento_s: float = 1.0,
+    max_chamadas: int = 200,
+    parametros_ag: Optional[Dict] = None,
+    semente: int = 0,
+    incluir_ag: bool = True
+) -> Dict:
+    """
+    Executa os benchmarks e retorna o relatório (serializável em JSON).
+
+    Args:
+        cenarios: Nomes dos cenários (ver carregar_cenario_benchmark).
+        orcamento_s (float): Tempo aproximado de medição de cada operador.
+        max_chamadas (int): Máximo de chamadas de cada operador.
+        parametros_ag (Optional[Dict]): Parâmetros do GeneticAlgorithmRunner na
+            execução completa. Padrão: população 50, 100 gerações, prazo de 60 s.
+        semente (int): Semente dos cenários sintéticos, das amostras e do AG.
+        incluir_ag (bool): Se False, mede apenas os operadores.
+    """
+    parametros_ag = dict({'population_size': 50, 'n_generations': 100, 'time_limit': 60.0}, **(parametros_ag or {}))
+    relatorio = {
+        'versao': 1,
+        'data': datetime.datetime.now().isoformat(timespec='seconds'),
+        'ambiente': {'python': platform.python_version(), 'numpy': np.__version__, 'plataforma': platform.platform()},
+        'parametros': {'orcamento_s': orcamento_s, 'max_chamadas': max_chamadas, 'semente': semente, 'ag': parametros_ag},
+        'cenarios': {},
+        'resultados': [],
+    }
+
+    for nome in cenarios:
+        print(f"--- Benchmark: cenário '{nome}' ---")
+        vms, servidores = carregar_cenario_benchmark(nome, semente)
+        cenario = construir_arrays_cenario(vms, servidores)
+        relatorio['cenarios'][nome] = {
+            'num_vms': len(vms),
+            'num_servidores': len(servidores),
+            'limite_inferior': calcular_limite_inferior(cenario).valor,
+        }
+        registros = _benchmark_operadores(nome, vms, servidores, orcamento_s, max_chamadas, semente)
+        if incluir_ag:
+            registros.append(_benchmark_ag(nome, vms, servidores, parametros_ag, semente))
+        for registro in registros:
+            relatorio['resultados'].append(registro)
+            tempo = registro['tempo_medio_s']
+            texto_tempo = f"{tempo * 1000:10.3f} ms" if tempo is not None else "    (pulado)"
+            print(f"  {registro['operacao']:<26} {texto_tempo}  {registro['qualidade']}")
+
+    return relatorio
+
+
+def comparar_com_baseline(relatorio: Dict, baseline: Dict, tolerancia: float = 0.25) -> List[str]:
+    """
+    Compara o relatório com um baseline salvo. Retorna a lista de regressões:
+    tempo médio acima de (1 + tolerancia) x o baseline, ou melhor fitness pior.
+    """
+    anteriores = {(r['cenario'], r['operacao']): r for r in baseline.get('resultados', [])}
+    regressoes = []
+    for registro in relatorio['resultados']:
+        anterior = anteriores.get((registro['cenario'], registro['operacao']))
+        if anterior is None or not registro['chamadas'] or not anterior['chamadas']:
+            continue
+        rotulo = f"{registro['cenario']}/{registro['operacao']}"
+        tempo, tempo_anterior = registro['tempo_medio_s'], anterior['tempo_medio_s']
+        if tempo_anterior and tempo > tempo_anterior * (1 + tolerancia):
+            regressoes.append(f"{rotulo}: tempo {tempo * 1000:.3f} ms vs {tempo_anterior * 1000:.3f} ms no baseline ({tempo / tempo_anterior - 1:+.0%})")
+        fitness, fitness_anterior = registro['qualidade'].get('melhor_fitness'), anterior['qualidade'].get('melhor_fitness')
+        if fitness is not None and fitness_anterior is not None and fitness > fitness_anterior:
+            regressoes.append(f"{rotulo}: melhor fitness {fitness} vs {fitness_anterior} no baseline")
+    return regressoes
+
+
+def salvar_relatorio(relatorio: Dict, caminho: str):
+    """Salva o relatório em JSON (pode ser usado depois como baseline)."""
+    with open(caminho, 'w', encoding='utf-8') as f:
+        json.dump(relatorio, f, indent=2, ensure_ascii=False, default=float)
+    print(f"Relatório de benchmark salvo em '{caminho}'.")
+
+
+def carregar_relatorio(caminho: str) -> Dict:
+    """Carrega um relatório (ou baseline) salvo por `salvar_relatorio`."""
+    with open(caminho, 'r', encoding='utf-8') as f:
+        return json.load(f)
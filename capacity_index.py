@@ -0,0 +1,184 @@
+# Arquivo [capacity_index.py]
+
+"""
+Índice de capacidade livre para os reparos do projeto DRE.
+
+Os crossovers, quando uma VM não cabe no servidor proposto, procuravam um novo
+lar com `sorted(servidores, key=lambda srv: srv.ram_disponivel, reverse=True)`,
+ordenando o datacenter inteiro para cada VM. O IndiceCapacidade mantém os
+servidores agrupados em "baldes" pela RAM disponível e é atualizado a cada
+alocação, respondendo "qual servidor comporta esta VM, maior RAM livre
+primeiro" sem reordenar nada.
+
+A ordem da busca é a mesma do `sorted(..., reverse=True)`: RAM livre
+decrescente e, no empate, a posição original do servidor na lista.
+"""
+
+# Importando
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Sequence
+from datacenter_model import MaquinaVirtual, ServidorFisico
+
+
+
+class IndiceCapacidade:
+    """
+    Índice dos servidores por RAM disponível, com a maior CPU livre de cada
+    balde, para descartar baldes inteiros que não comportam a VM.
+    As alocações feitas através do índice também são aplicadas nos objetos.
+    """
+    def __init__(self, servidores: List[ServidorFisico]):
+        """
+        Args:
+            servidores (List[ServidorFisico]): Os servidores candidatos, no estado
+                atual. A ordem da lista define o desempate.
+        """
+        self.servidores = list(servidores)
+        self._ids = [s.id for s in self.servidores]
+        self._posicao: Dict[int, int] = {s_id: i for i, s_id in enumerate(self._ids)}
+        # Os baldes só são montados na primeira busca: enquanto nenhum reparo
+        # for necessário, alocar() custa o mesmo que ServidorFisico.alocar_vm.
+        self._construido = False
+        self.buscas = 0
+        self.atualizacoes = 0
+
+    @classmethod
+    def de_capacidades(cls, ids: Sequence[int], cpu_livre: Sequence[int], ram_livre: Sequence[int]) -> 'IndiceCapacidade':
+        """
+        Cria um índice sobre capacidades livres "puras", sem objetos ServidorFisico
+        (ex.: as cargas de um EstadoIndividuo). Neste modo use encontrar_id/ajustar.
+        """
+        indice = cls([])
+        indice._ids = list(ids)
+        indice._posicao = {s_id: i for i, s_id in enumerate(indice._ids)}
+        indice._montar_baldes(list(cpu_livre), list(ram_livre))
+        return indice
+
+    def _construir(self):
+        """Monta os baldes a partir do estado atual dos objetos."""
+        self._montar_baldes([s.cpu_disponivel for s in self.servidores], [s.ram_disponivel for s in self.servidores])
+
+    def _montar_baldes(self, cpu_livre: List[int], ram_livre: List[int]):
+        self._cpu_livre = cpu_livre
+        self._ram_livre = ram_livre
+
+        # Baldes: RAM livre -> posições (ordenadas) dos servidores com essa RAM livre.
+        self._baldes: Dict[int, List[int]] = {}
+        self._cpu_max_balde: Dict[int, int] = {}
+        for i, ram in enumerate(self._ram_livre):
+            self._baldes.setdefault(ram, []).append(i)
+        for ram, posicoes in self._baldes.items():
+            self._cpu_max_balde[ram] = max(self._cpu_livre[i] for i in posicoes)
+        self._chaves = sorted(self._baldes) # Valores de RAM livre, em ordem crescente.
+        self._construido = True
+
+    def __len__(self) -> int:
+        return len(self._posicao)
+
+    def __contains__(self, servidor_id: int) -> bool:
+        return servidor_id in self._posicao
+
+    # --- Manutenção dos baldes ---------------------------------------------------------
+
+    def _remover_do_balde(self, i: int):
+        ram = self._ram_livre[i]
+        posicoes = self._baldes[ram]
+        del posicoes[bisect_left(posicoes, i)]
+        if not posicoes:
+            del self._baldes[ram]
+            del self._cpu_max_balde[ram]
+            del self._chaves[bisect_left(self._chaves, ram)]
+        elif self._cpu_livre[i] == self._cpu_max_balde[ram]:
+            self._cpu_max_balde[ram] = max(self._cpu_livre[p] for p in posicoes)
+
+    def _inserir_no_balde(self, i: int):
+        ram = self._ram_livre[i]
+        posicoes = self._baldes.get(ram)
+        if posicoes is None:
+            self._baldes[ram] = [i]
+            self._cpu_max_balde[ram] = self._cpu_livre[i]
+            insort(self._chaves, ram)
+        else:
+            insort(posicoes, i)
+            if self._cpu_livre[i] > self._cpu_max_balde[ram]:
+                self._cpu_max_balde[ram] = self._cpu_livre[i]
+
+    def ajustar(self, servidor_id: int, delta_cpu: int, delta_ram: int):
+        """Altera a capacidade livre de um servidor e o move para o balde correto."""
+        i = self._posicao[servidor_id]
+        self._remover_do_balde(i)
+        self._cpu_livre[i] += delta_cpu
+        self._ram_livre[i] += delta_ram
+        self._inserir_no_balde(i)
+        self.atualizacoes += 1
+
+    def remover(self, servidor_id: int):
+        """Retira um servidor do índice (ex.: um servidor esvaziado, que não deve ser reaberto)."""
+        if not self._construido:
+            self._construir()
+        i = self._posicao.pop(servidor_id)
+        self._remover_do_balde(i)
+        self.atualizacoes += 1
+
+    # --- Consultas ------------------------------------------------------------------------
+
+    def encontrar_id(self, cpu_req: int, ram_req: int, excluir: Optional[int] = None) -> Optional[int]:
+        """
+        Retorna o ID do servidor com mais RAM livre que comporta os requisitos
+        (CPU e RAM), ou None se nenhum comportar.
+
+        Args:
+            cpu_req, ram_req (int): Requisitos da VM.
+            excluir (Optional[int]): ID de um servidor a ser ignorado na busca.
+        """
+        self.buscas += 1
+        if not self._construido:
+            self._construir()
+        posicao_excluida = self._posicao.get(excluir, -1) if excluir is not None else -1
+        # Percorre os baldes da maior RAM livre para a menor, parando quando a RAM não basta.
+        for k in range(len(self._chaves) - 1, -1, -1):
+            ram = self._chaves[k]
+            if ram < ram_req:
+                break
+            if self._cpu_max_balde[ram] < cpu_req:
+                continue
+            for i in self._baldes[ram]:
+                if i != posicao_excluida and self._cpu_livre[i] >= cpu_req:
+                    return self._ids[i]
+        return None
+
+    def encontrar(self, vm: MaquinaVirtual, excluir: Optional[int] = None) -> Optional[ServidorFisico]:
+        """
+        Retorna o servidor (objeto) com mais RAM livre que comporta a VM,
+        ou None se nenhum comportar.
+        """
+        servidor_id = self.encontrar_id(vm.cpu_req, vm.ram_req, excluir)
+        return None if servidor_id is None else self.servidores[self._posicao[servidor_id]]
+
+    # --- Alocação -------------------------------------------------------------------------
+
+    def alocar(self, servidor: ServidorFisico, vm: MaquinaVirtual):
+        """Aloca a VM no servidor (objeto) e atualiza o índice, se o servidor fizer parte dele."""
+        servidor.alocar_vm(vm)
+        if self._construido and servidor.id in self._posicao:
+            self.ajustar(servidor.id, -vm.cpu_req, -vm.ram_req)
+
+    def desalocar(self, servidor: ServidorFisico, vm: MaquinaVirtual):
+        """Remove a VM do servidor (objeto) e atualiza o índice, se o servidor fizer parte dele."""
+        cpu_antes, ram_antes = servidor.cpu_usada, servidor.ram_usada
+        servidor.desalocar_vm(vm)
+        if self._construido and servidor.id in self._posicao:
+            # Usa a variação real: desalocar_vm apenas avisa se a VM não estava lá.
+            self.ajustar(servidor.id, cpu_antes - servidor.cpu_usada, ram_antes - servidor.ram_usada)
+
+    def alocar_melhor(self, vm: MaquinaVirtual, excluir: Optional[int] = None) -> Optional[ServidorFisico]:
+        """Encontra o servidor com mais RAM livre que comporta a VM e a aloca nele."""
+        servidor = self.encontrar(vm, excluir)
+        if servidor is not None:
+            self.alocar(servidor, vm)
+        return servidor
+
+    def __repr__(self) -> str:
+        """Retorna uma representação em string do objeto, útil para debug."""
+        baldes = len(self._chaves) if self._construido else 0
+        return f"IndiceCapacidade(Servidores: {len(self._ids)}, Baldes: {baldes})"
@@ -11,7 +11,7 @@ Este arquivo define as classes para:
 
 # Importando
 import json, csv
-from typing import List, Dict, Any, Optional
+from typing import Dict, Any, Optional
 
 
 
@@ -22,6 +22,9 @@ class MaquinaVirtual:
     Representa uma única Máquina Virtual (VM).
     Funciona como um "item" a ser alocado no problema de Bin Packing.
     """
+    # __slots__ elimina o __dict__ de cada instância (menos memória em inventários grandes).
+    __slots__ = ('id', 'cpu_req', 'ram_req', 'nome_real')
+
     def __init__(self, vm_id: int, cpu_req: int, ram_req: int, nome_real: Optional[str] = None):
         """
         Inicializa uma VM.
@@ -47,58 +50,78 @@ class ServidorFisico:
     """
     Representa um único Servidor Físico (Host).
     VERSÃO ATUALIZADA: Inclui métodos para desalocar e resetar VMs.
+    Os totais de CPU/RAM em uso são mantidos incrementalmente por
+    alocar_vm/desalocar_vm/resetar, tornando as checagens de capacidade O(1).
     """
+    __slots__ = ('id', 'cpu_total', 'ram_total', 'nome_real', '_vms_por_id', '_cpu_usada', '_ram_usada')
+
     def __init__(self, servidor_id: int, cpu_total: int, ram_total: int, nome_real: Optional[str] = None):
         self.id = servidor_id
         self.cpu_total = cpu_total
         self.ram_total = ram_total
         self.nome_real = nome_real if nome_real else f"Servidor_{servidor_id}"
-        self.vms_hospedadas: List[MaquinaVirtual] = []
+        # VMs hospedadas indexadas pelo ID (mantém a ordem de alocação).
+        self._vms_por_id: Dict[int, MaquinaVirtual] = {}
+        self._cpu_usada = 0
+        self._ram_usada = 0
+
+    @property
+    def vms_hospedadas(self):
+        """Retorna uma visão (somente leitura) das VMs hospedadas, na ordem de alocação."""
+        return self._vms_por_id.values()
 
     @property
     def cpu_usada(self) -> int:
-        """Calcula e retorna a quantidade de CPU atualmente em uso."""
-        return sum(vm.cpu_req for vm in self.vms_hospedadas)
+        """Retorna a quantidade de CPU atualmente em uso."""
+        return self._cpu_usada
 
     @property
     def ram_usada(self) -> int:
-        """Calcula e retorna a quantidade de RAM atualmente em uso."""
-        return sum(vm.ram_req for vm in self.vms_hospedadas)
+        """Retorna a quantidade de RAM atualmente em uso."""
+        return self._ram_usada
 
     @property
     def cpu_disponivel(self) -> int:
-        """Calcula e retorna a quantidade de CPU ainda disponível."""
-        return self.cpu_total - self.cpu_usada
+        """Retorna a quantidade de CPU ainda disponível."""
+        return self.cpu_total - self._cpu_usada
 
     @property
     def ram_disponivel(self) -> int:
-        """Calcula e retorna a quantidade de RAM ainda disponível."""
-        return self.ram_total - self.ram_usada
+        """Retorna a quantidade de RAM ainda disponível."""
+        return self.ram_total - self._ram_usada
 
     def pode_hospedar(self, vm: MaquinaVirtual) -> bool:
         """Verifica se há recursos suficientes para hospedar uma determinada VM."""
-        return vm.cpu_req <= self.cpu_disponivel and vm.ram_req <= self.ram_disponivel
+        return vm.cpu_req <= self.cpu_total - self._cpu_usada and vm.ram_req <= self.ram_total - self._ram_usada
 
     def alocar_vm(self, vm: MaquinaVirtual):
         """Aloca uma VM neste servidor, se houver capacidade."""
+        if vm.id in self._vms_por_id:
+            raise ValueError(f"A VM {vm.id} já está alocada no Servidor {self.id}.")
         if self.pode_hospedar(vm):
-            self.vms_hospedadas.append(vm)
+            self._vms_por_id[vm.id] = vm
+            self._cpu_usada += vm.cpu_req
+            self._ram_usada += vm.ram_req
         else:
             raise ValueError(f"Servidor {self.id} não tem capacidade para a VM {vm.id}.")
 
     # --- NOVO MÉTODO ---
     def desalocar_vm(self, vm: MaquinaVirtual):
         """Remove uma VM deste servidor."""
-        try:
-            self.vms_hospedadas.remove(vm)
-        except ValueError:
+        vm_removida = self._vms_por_id.pop(vm.id, None)
+        if vm_removida is None:
             # Opcional: Avisar se a VM não foi encontrada, útil para debug.
             print(f"AVISO: Tentativa de remover a VM {vm.id} do Servidor {self.id}, mas ela não estava lá.")
+            return
+        self._cpu_usada -= vm_removida.cpu_req
+        self._ram_usada -= vm_removida.ram_req
 
     # --- NOVO MÉTODO ---
     def resetar(self):
         """Remove todas as VMs deste servidor, deixando-o vazio."""
-        self.vms_hospedadas.clear()
+        self._vms_por_id.clear()
+        self._cpu_usada = 0
+        self._ram_usada = 0
 
     def __repr__(self) -> str:
         """Retorna uma representação em string do objeto, útil para debug."""
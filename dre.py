@@ -0,0 +1,279 @@
+# Arquivo [dre.py]
+
+'''
+Interface de linha de comando do D.R.E.
+
+Uso:
+    python -m dre run --headless                       # Cenário VMware, sem interface gráfica
+    python -m dre run --headless --cenario json --cenario-file cenario_teste.json
+    python -m dre run --population-size 200 --crossover cpc   # Com interface gráfica
+    python -m dre run --headless --instrumentacao --perfil 10:20  # Tempo por fase, contadores e cProfile
+    python -m dre run --headless --ilhas 4 --ilhas-crossovers doac,cpc  # Modelo de ilhas (ver island_model.py)
+    python -m dre bench --saida bench.json                 # Benchmarks (ver benchmark.py)
+    python -m dre bench --baseline bench.json              # Compara com um baseline salvo
+    python -m dre gerar --vms 100000 --saida cenario_100k.json   # Cenário sintético (ver scenario_generator.py)
+
+No modo --headless o Tkinter e o matplotlib não são importados, então o
+comando roda em servidores sem display e o AG executa em velocidade máxima.
+'''
+
+import argparse
+import random
+import sys
+from typing import Dict, List, Optional, Tuple
+
+import ga_runner
+from ga_runner import GeneticAlgorithmRunner, carregar_datacenter, CROSSOVERS
+from fitness_engine import SECUNDARIOS
+from population_init import INICIALIZADORES
+from scenario_generator import DISTRIBUICOES, tipos_de_host, escrever_cenario
+from instrumentation import Instrumentacao, SaidaConsole, SaidaJSONL
+from island_model import TOPOLOGIAS, INTERVALO_MIGRACAO, N_MIGRANTES, executar_ilhas
+
+
+
+def _mistura(texto: str) -> Dict[str, float]:
+    """Converte 'ffd=1,best_fit_decrescente=3' (ou apenas 'round_robin') na mistura da população inicial."""
+    mistura = {}
+    for parte in texto.split(','):
+        nome, _, peso = parte.strip().partition('=')
+        if nome not in INICIALIZADORES:
+            raise argparse.ArgumentTypeError(f"inicializador '{nome}' desconhecido (use {', '.join(INICIALIZADORES)})")
+        try:
+            mistura[nome] = float(peso) if peso else 1.0
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"peso inválido para '{nome}': '{peso}'")
+    return mistura
+
+
+def _tipos(texto: str) -> Dict[str, float]:
+    """Converte 'cs-01-host=2,s-hpbl=1' nos pesos dos modelos de servidor do cenário sintético."""
+    tipos = {}
+    for parte in texto.split(','):
+        nome, _, peso = parte.strip().partition('=')
+        if nome not in tipos_de_host():
+            raise argparse.ArgumentTypeError(f"modelo de host '{nome}' desconhecido (use {', '.join(tipos_de_host())})")
+        try:
+            tipos[nome] = float(peso) if peso else 1.0
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"peso inválido para '{nome}': '{peso}'")
+    return tipos
+
+
+def _intervalo_geracoes(texto: str) -> Tuple[int, int]:
+    """Converte '10:20' (ou apenas '10') no intervalo de gerações do perfil."""
+    primeira, _, ultima = texto.partition(':')
+    try:
+        intervalo = (int(primeira), int(ultima) if ultima else int(primeira))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"intervalo de gerações inválido: '{texto}' (use PRIMEIRA:ULTIMA)")
+    if intervalo[0] < 0 or intervalo[1] < intervalo[0]:
+        raise argparse.ArgumentTypeError(f"intervalo de gerações inválido: '{texto}'")
+    return intervalo
+
+
+def _criar_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m dre", description="DRE - Datacenter Resource Emulator")
+    subcomandos = parser.add_subparsers(dest="comando", required=True)
+
+    run = subcomandos.add_parser("run", help="Executa o Algoritmo Genético.")
+    run.add_argument("--headless", action="store_true", help="Executa sem interface gráfica (não importa Tkinter/matplotlib).")
+
+    cenario = run.add_argument_group("cenário")
+    cenario.add_argument("--cenario", choices=("vmware", "json"), default="vmware", help="Origem do cenário (padrão: vmware).")
+    cenario.add_argument("--cenario-file", default="cenario_desafiador.json", help="Arquivo JSON (ou .npz do scenario_generator) do cenário (com --cenario json).")
+    cenario.add_argument("--servidores-csv", default="ExportList--servidores.csv", help="CSV de servidores exportado do VMware.")
+    cenario.add_argument("--vms-csv", default="ExportList--VMs.csv", help="CSV de VMs exportado do VMware.")
+    cenario.add_argument("--sem-cache-cenario", action="store_true", help="Relê os CSVs do VMware sem usar (nem gravar) o cenário compilado em .dre_cache/.")
+
+    ag = run.add_argument_group("algoritmo genético")
+    ag.add_argument("--population-size", type=int, default=ga_runner.POPULATION_SIZE)
+    ag.add_argument("--generations", type=int, default=ga_runner.N_GENERATIONS)
+    ag.add_argument("--max-stagnation", type=int, default=ga_runner.MAX_GENS_NO_IMPROVEMENT, help="Gerações sem melhoria antes de parar.")
+    ag.add_argument("--mutation-rate", type=float, default=ga_runner.MUTATION_PROBABILITY)
+    ag.add_argument("--elitism", type=int, default=ga_runner.ELITISM_SIZE)
+    ag.add_argument("--crossover", choices=CROSSOVERS, default="doac")
+    ag.add_argument("--fitness-secundario", choices=SECUNDARIOS + ('nenhum',), default='nenhum', help="Critério de desempate entre soluções com o mesmo número de servidores.")
+    ag.add_argument("--populacao-inicial", type=_mistura, default=ga_runner.INITIAL_POPULATION_MIX, metavar="HEURISTICA[=PESO],...", help=f"Mistura de heurísticas da população inicial ({', '.join(INICIALIZADORES)}).")
+    ag.add_argument("--cache-size", type=int, default=ga_runner.FITNESS_CACHE_SIZE, help="Tamanho do cache de fitness.")
+    ag.add_argument("--busca-local", type=int, default=ga_runner.LOCAL_SEARCH_ELITES, help="Melhores soluções que passam pela busca local a cada geração (0 = desativada).")
+    ag.add_argument("--busca-local-movimentos", type=int, default=ga_runner.LOCAL_SEARCH_MAX_MOVES, help="Máximo de VMs movidas pela busca local por indivíduo.")
+    ag.add_argument("--busca-local-tempo", type=float, default=ga_runner.LOCAL_SEARCH_TIME_LIMIT, help="Tempo máximo (s) da busca local por indivíduo.")
+    ag.add_argument("--ignorar-limite-inferior", action="store_true", help="Não para quando o melhor fitness alcança o limite inferior.")
+    ag.add_argument("--tempo-limite", type=float, default=ga_runner.TIME_LIMIT, help="Prazo (s) da execução; ao esgotar, retorna a melhor solução encontrada.")
+    ag.add_argument("--seed", type=int, default=None, help="Semente para execuções reprodutíveis.")
+
+    execucao = run.add_argument_group("execução")
+    execucao.add_argument("--engine", choices=("serial", "paralelo"), default="serial")
+    execucao.add_argument("--workers", type=int, default=None, help="Processos no modo paralelo (padrão: todos os núcleos).")
+    execucao.add_argument("--sem-relatorios", action="store_true", help="Não gera os relatórios JSON/Excel ao final.")
+
+    ilhas = run.add_argument_group("modelo de ilhas (apenas --headless)")
+    ilhas.add_argument("--ilhas", type=int, nargs="?", const=0, default=None, metavar="N", help="Executa N populações em processos separados, com migração (padrão de N: todos os núcleos). A população é dividida entre as ilhas.")
+    ilhas.add_argument("--ilhas-crossovers", default="doac,cpc", help="Crossovers das ilhas, em rodízio (padrão: doac,cpc).")
+    ilhas.add_argument("--migracao", type=int, default=INTERVALO_MIGRACAO, help="Gerações entre migrações (0 = ilhas isoladas).")
+    ilhas.add_argument("--migrantes", type=int, default=N_MIGRANTES, help="Soluções enviadas a cada vizinha por migração.")
+    ilhas.add_argument("--topologia", choices=TOPOLOGIAS, default="anel")
+
+    instrumentacao = run.add_argument_group("instrumentação")
+    instrumentacao.add_argument("--instrumentacao", type=int, nargs="?", const=10, default=None, metavar="N", help="Mostra o tempo por fase e os contadores a cada N gerações (padrão: 10) e o resumo ao final.")
+    instrumentacao.add_argument("--instrumentacao-jsonl", default=None, metavar="ARQUIVO", help="Grava o tempo por fase e os contadores de cada geração em JSONL.")
+    instrumentacao.add_argument("--perfil", type=_intervalo_geracoes, default=None, metavar="PRIMEIRA:ULTIMA", help="Executa o cProfile nas gerações indicadas.")
+    instrumentacao.add_argument("--perfil-arquivo", default=None, help="Grava o perfil (formato pstats) em vez de imprimi-lo.")
+
+    bench = subcomandos.add_parser("bench", help="Mede os operadores e o AG completo em vários cenários.")
+    bench.add_argument("--cenarios", default=None, help="Lista separada por vírgulas: teste, desafiador, vmware, sintetico-N (padrão: teste,desafiador,vmware,sintetico-10000).")
+    bench.add_argument("--orcamento", type=float, default=1.0, help="Tempo aproximado (s) de medição de cada operador.")
+    bench.add_argument("--max-chamadas", type=int, default=200, help="Máximo de chamadas de cada operador.")
+    bench.add_argument("--population-size", type=int, default=50, help="População do AG completo.")
+    bench.add_argument("--generations", type=int, default=100, help="Gerações do AG completo.")
+    bench.add_argument("--tempo-limite", type=float, default=60.0, help="Prazo (s) do AG completo em cada cenário.")
+    bench.add_argument("--sem-ag", action="store_true", help="Mede apenas os operadores.")
+    bench.add_argument("--seed", type=int, default=0)
+    bench.add_argument("--saida", default=None, help="Arquivo JSON onde salvar os resultados.")
+    bench.add_argument("--baseline", default=None, help="JSON de uma execução anterior para comparação.")
+    bench.add_argument("--tolerancia", type=float, default=0.25, help="Aumento de tempo tolerado antes de apontar regressão (0.25 = 25%%).")
+
+    gerar = subcomandos.add_parser("gerar", help="Gera um cenário sintético (JSON ou .npz).")
+    gerar.add_argument("--vms", type=int, required=True, help="Número de VMs.")
+    gerar.add_argument("--servidores", type=int, default=None, help="Número fixo de servidores (padrão: calculado pelo --aperto).")
+    gerar.add_argument("--aperto", type=float, default=0.8, help="Demanda / capacidade na dimensão mais apertada, em (0, 1] (padrão: 0.8).")
+    gerar.add_argument("--distribuicao", choices=DISTRIBUICOES, default="catalogo", help="Distribuição dos tamanhos das VMs.")
+    gerar.add_argument("--tipos", type=_tipos, default=None, metavar="MODELO[=PESO],...", help=f"Modelos de servidor do HARDWARE_MAP ({', '.join(tipos_de_host())}).")
+    gerar.add_argument("--seed", type=int, default=0)
+    gerar.add_argument("--saida", required=True, help="Arquivo de saída (.json no esquema de carregar_cenario, ou .npz binário).")
+    return parser
+
+
+def _comando_run(args: argparse.Namespace) -> int:
+    if args.seed is not None:
+        random.seed(args.seed)
+    if args.fitness_secundario == 'nenhum':
+        args.fitness_secundario = None
+
+    cenario = carregar_datacenter(args.cenario, args.cenario_file, args.servidores_csv, args.vms_csv, not args.sem_cache_cenario)
+    if cenario is None:
+        return 1
+    vms, servidores = cenario
+
+    instrumentacao = None
+    if args.instrumentacao is not None or args.instrumentacao_jsonl or args.perfil:
+        saidas = []
+        if args.instrumentacao is not None:
+            saidas.append(SaidaConsole(args.instrumentacao))
+        if args.instrumentacao_jsonl:
+            saidas.append(SaidaJSONL(args.instrumentacao_jsonl))
+        instrumentacao = Instrumentacao(saidas, args.perfil, args.perfil_arquivo)
+
+    parametros_ag = dict(
+        population_size=args.population_size,
+        n_generations=args.generations,
+        max_gens_no_improvement=args.max_stagnation,
+        mutation_probability=args.mutation_rate,
+        elitism_size=args.elitism,
+        crossover=args.crossover,
+        fitness_cache_size=args.cache_size,
+        fitness_secundario=args.fitness_secundario,
+        initial_population_mix=args.populacao_inicial,
+        local_search_elites=args.busca_local,
+        local_search_max_moves=args.busca_local_movimentos,
+        local_search_time_limit=args.busca_local_tempo,
+        stop_at_lower_bound=not args.ignorar_limite_inferior,
+        time_limit=args.tempo_limite,
+        instrumentacao=instrumentacao,
+    )
+
+    if args.ilhas is not None:
+        if not args.headless:
+            print("ERRO: O modelo de ilhas só está disponível com --headless.")
+            return 1
+        if args.engine == 'paralelo' or instrumentacao is not None:
+            print("AVISO: --engine paralelo e a instrumentação são ignorados no modelo de ilhas.")
+        from relatorio import relatorio_json, relatorio_logico_json, gerar_relatorio_excel
+        crossovers = [nome.strip() for nome in args.ilhas_crossovers.split(',') if nome.strip()]
+        parametros_ag.pop('instrumentacao')
+        parametros_ag.pop('crossover') # Cada ilha usa um de --ilhas-crossovers.
+        try:
+            resultado = executar_ilhas(vms, servidores, args.ilhas or None, crossovers, args.migracao, args.migrantes,
+                                       args.topologia, args.seed, **parametros_ag)
+        except ValueError as e:
+            print(f"ERRO: {e}")
+            return 1
+        if resultado.melhor_solucao and not args.sem_relatorios:
+            relatorio_json(resultado.melhor_solucao, vms, servidores, "solucao_final_detalhada.json")
+            relatorio_logico_json(resultado.melhor_solucao, "solucao_final_logica.json")
+            gerar_relatorio_excel(resultado.melhor_solucao, servidores, vms)
+        return 0
+
+    if not args.headless:
+        # Importado apenas aqui para que o modo headless não dependa do Tkinter.
+        from main import executar_gui
+        return 0 if executar_gui(vms, servidores, engine_mode=args.engine, n_workers=args.workers, **parametros_ag) else 1
+
+    engine = None
+    if args.engine == 'paralelo':
+        from parallel_engine import ParallelGenerationEngine
+        try:
+            engine = ParallelGenerationEngine(vms, servidores, args.workers, args.crossover, args.cache_size, args.fitness_secundario)
+        except ValueError as e:
+            print(f"ERRO: {e}")
+            return 1
+
+    runner = GeneticAlgorithmRunner(vms, servidores, engine=engine, **parametros_ag)
+    runner.executar(gerar_relatorios=not args.sem_relatorios)
+    return 0
+
+
+def _comando_bench(args: argparse.Namespace) -> int:
+    import benchmark
+    cenarios = args.cenarios.split(',') if args.cenarios else benchmark.CENARIOS_PADRAO
+    try:
+        relatorio = benchmark.executar_benchmarks(
+            cenarios,
+            orcamento_s=args.orcamento,
+            max_chamadas=args.max_chamadas,
+            parametros_ag={'population_size': args.population_size, 'n_generations': args.generations, 'time_limit': args.tempo_limite},
+            semente=args.seed,
+            incluir_ag=not args.sem_ag,
+        )
+    except ValueError as e: # Cenário desconhecido ou que não pôde ser carregado.
+        print(f"ERRO: {e}")
+        return 1
+    if args.saida:
+        benchmark.salvar_relatorio(relatorio, args.saida)
+    if args.baseline:
+        regressoes = benchmark.comparar_com_baseline(relatorio, benchmark.carregar_relatorio(args.baseline), args.tolerancia)
+        if regressoes:
+            print(f"--- {len(regressoes)} regressão(ões) em relação a '{args.baseline}' ---")
+            for regressao in regressoes:
+                print(f"  {regressao}")
+            return 1
+        print(f"--- Nenhuma regressão em relação a '{args.baseline}' ---")
+    return 0
+
+
+def _comando_gerar(args: argparse.Namespace) -> int:
+    try:
+        resumo = escrever_cenario(args.saida, args.vms, args.aperto, args.distribuicao, args.seed, args.servidores, args.tipos)
+    except ValueError as e:
+        print(f"ERRO: {e}")
+        return 1
+    print(f"Cenário '{args.saida}' gerado: {resumo['vms']} VMs, {resumo['servidores']} servidores "
+          f"(CPU {resumo['cpu_demanda']}/{resumo['cpu_capacidade']}, RAM {resumo['ram_demanda']}/{resumo['ram_capacidade']}).")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _criar_parser().parse_args(argv)
+    if args.comando == "run":
+        return _comando_run(args)
+    if args.comando == "bench":
+        return _comando_bench(args)
+    if args.comando == "gerar":
+        return _comando_gerar(args)
+    return 2
+
+
+# --- Ponto de Entrada do Programa ---
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,577 @@
+# Arquivo [fitness_engine.py]
+
+"""
+Módulo de avaliação de fitness baseada em arrays para o projeto DRE.
+
+Ao contrário de `calculate_fitness` (modelo "Lousa Limpa"), que reseta os
+objetos `ServidorFisico` e simula a alocação VM por VM, as funções deste
+arquivo trabalham sobre arrays pré-calculados de requisitos e capacidades.
+A carga de cada servidor é acumulada em uma única passada (bincount), sem
+tocar nos objetos compartilhados do datacenter.
+
+Este arquivo define:
+- CenarioArrays: Requisitos das VMs e capacidades dos servidores em arrays NumPy.
+- construir_arrays_cenario: Converte as listas de objetos em um CenarioArrays.
+- tipo_genes: O tipo compacto (int16/int32) da matriz da população.
+- calculate_fitness_arrays: Fitness de um indivíduo, equivalente a `calculate_fitness`.
+- calculate_population_fitness: Avalia a população inteira (matriz indivíduos x VMs) de uma vez.
+- atualizar_fitness: Reavalia linhas de uma avaliação a partir das cargas alteradas.
+- fitness_primario: Extrai o número de servidores de um fitness composto.
+- FitnessCache: Cache LRU de fitness, indexado por um hash compacto do cromossomo.
+- EstadoIndividuo: Cromossomo + cargas por servidor, para avaliar movimentos em O(1).
+"""
+
+# Importando
+import hashlib
+import numpy as np
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from datacenter_model import MaquinaVirtual, ServidorFisico
+
+
+
+# ===[ 1. Representação do Cenário em Arrays ]===========================================
+
+class CenarioArrays:
+    """
+    Guarda o cenário (VMs e servidores) em arrays NumPy contíguos.
+    O índice do array de VMs é a posição da VM na lista `vms` (o gene) e o
+    índice do array de servidores é o ID do servidor (o valor do gene).
+    """
+    def __init__(self, cpu_req: np.ndarray, ram_req: np.ndarray, cpu_total: np.ndarray, ram_total: np.ndarray):
+        """
+        Args:
+            cpu_req (np.ndarray): CPU requerida por cada VM.
+            ram_req (np.ndarray): RAM (GB) requerida por cada VM.
+            cpu_total (np.ndarray): Capacidade de CPU de cada servidor.
+            ram_total (np.ndarray): Capacidade de RAM (GB) de cada servidor.
+        """
+        self.cpu_req = np.ascontiguousarray(cpu_req, dtype=np.int64)
+        self.ram_req = np.ascontiguousarray(ram_req, dtype=np.int64)
+        self.cpu_total = np.ascontiguousarray(cpu_total, dtype=np.int64)
+        self.ram_total = np.ascontiguousarray(ram_total, dtype=np.int64)
+
+    @property
+    def num_vms(self) -> int:
+        return len(self.cpu_req)
+
+    @property
+    def num_servidores(self) -> int:
+        return len(self.cpu_total)
+
+    @property
+    def tipo_genes(self) -> np.dtype:
+        """O tipo compacto dos genes deste cenário (ver `tipo_genes`)."""
+        return tipo_genes(self.num_servidores)
+
+    def __repr__(self) -> str:
+        """Retorna uma representação em string do objeto, útil para debug."""
+        return f"CenarioArrays(VMs: {self.num_vms}, Servidores: {self.num_servidores})"
+
+
+def tipo_genes(num_servidores: int) -> np.dtype:
+    """
+    O menor inteiro com sinal que guarda os genes: os IDs de servidor e o -1
+    das VMs não alocadas. int16 (2 bytes por gene) até 32767 servidores; int32 acima.
+    """
+    return np.dtype(np.int16) if num_servidores <= np.iinfo(np.int16).max else np.dtype(np.int32)
+
+
+def construir_arrays_cenario(vms: List[MaquinaVirtual], servidores: List[ServidorFisico]) -> CenarioArrays:
+    """
+    Constrói o CenarioArrays a partir das listas de objetos do datacenter_model.
+    Os servidores são indexados pelo seu ID, como nos cromossomos.
+    """
+    num_servidores = max((s.id for s in servidores), default=-1) + 1
+    cpu_total = np.zeros(num_servidores, dtype=np.int64)
+    ram_total = np.zeros(num_servidores, dtype=np.int64)
+    for s in servidores:
+        cpu_total[s.id] = s.cpu_total
+        ram_total[s.id] = s.ram_total
+
+    cpu_req = np.fromiter((vm.cpu_req for vm in vms), dtype=np.int64, count=len(vms))
+    ram_req = np.fromiter((vm.ram_req for vm in vms), dtype=np.int64, count=len(vms))
+
+    return CenarioArrays(cpu_req, ram_req, cpu_total, ram_total)
+
+
+# ===[ 2. Função de Fitness Baseada em Arrays ]==========================================
+
+# Critérios secundários do fitness composto (lexicográfico). O fitness passa a ser
+# "servidores usados + termo", com o termo em [0, 0.5]: o número de servidores
+# continua decidindo e o termo apenas desempata soluções com o mesmo número.
+# - 'concentracao': 1 - média da utilização ao quadrado dos servidores usados
+#   (premia concentrar a carga em poucos servidores).
+# - 'menor_servidor': a utilização do servidor usado mais vazio (premia deixar
+#   um servidor quase vazio, prestes a ser liberado).
+SECUNDARIOS = ('concentracao', 'menor_servidor')
+PESO_SECUNDARIO = 0.5
+
+
+def fitness_primario(fitness: float) -> float:
+    """Retorna o número de servidores usados contido em um fitness (simples ou composto)."""
+    return float(np.floor(fitness))
+
+
+def _validar_secundario(secundario: Optional[str]):
+    if secundario is not None and secundario not in SECUNDARIOS:
+        raise ValueError(f"Fitness secundário '{secundario}' desconhecido. Use um de {SECUNDARIOS}.")
+
+
+def _termo_secundario(cpu_usada: np.ndarray, ram_usada: np.ndarray, vms_por_servidor: np.ndarray, cenario: CenarioArrays, secundario: str) -> np.ndarray:
+    """
+    Calcula o termo secundário (em [0, PESO_SECUNDARIO]) a partir das cargas já
+    acumuladas (matrizes P x S). Menor é melhor, como o fitness.
+    """
+    _validar_secundario(secundario)
+    # Utilização de cada servidor: média das frações de CPU e RAM ocupadas.
+    cpu_total = np.maximum(cenario.cpu_total, 1)
+    ram_total = np.maximum(cenario.ram_total, 1)
+    utilizacao = np.minimum((cpu_usada / cpu_total + ram_usada / ram_total) / 2.0, 1.0)
+    usado = vms_por_servidor > 0
+    num_usados = usado.sum(axis=1)
+
+    if secundario == 'concentracao':
+        soma_quadrados = np.where(usado, utilizacao * utilizacao, 0.0).sum(axis=1)
+        termo = 1.0 - soma_quadrados / np.maximum(num_usados, 1)
+    else:
+        termo = np.where(usado, utilizacao, np.inf).min(axis=1)
+    termo = np.where(num_usados > 0, termo, 0.0)
+    return PESO_SECUNDARIO * np.clip(termo, 0.0, 1.0)
+
+
+def calculate_fitness_arrays(individual: Sequence[int], cenario: CenarioArrays, secundario: Optional[str] = None) -> float:
+    """
+    Calcula o fitness de um indivíduo sem simular a alocação nos objetos.
+    1. Valida os IDs de servidor do cromossomo.
+    2. Acumula a carga de CPU/RAM por servidor em uma única passada.
+    3. Retorna o número de servidores usados ou infinito se a solução for inválida.
+       Com `secundario` (um de SECUNDARIOS), soma o termo de desempate.
+    """
+    genes = np.asarray(individual, dtype=np.int64)
+    num_servidores = cenario.num_servidores
+
+    # PASSO 1: Checagem de segurança para IDs inválidos (inclui -1, VM não alocada)
+    if genes.size and (genes.min() < 0 or genes.max() >= num_servidores):
+        return float('inf')
+
+    # PASSO 2: Carga de cada servidor
+    cpu_usada = np.bincount(genes, weights=cenario.cpu_req, minlength=num_servidores)
+    ram_usada = np.bincount(genes, weights=cenario.ram_req, minlength=num_servidores)
+
+    # Validação: algum servidor ultrapassou a capacidade?
+    if np.any(cpu_usada > cenario.cpu_total) or np.any(ram_usada > cenario.ram_total):
+        return float('inf') # Penalidade máxima para soluções inválidas
+
+    # PASSO 3: O fitness é o número de servidores com pelo menos uma VM.
+    vms_por_servidor = np.bincount(genes, minlength=num_servidores)
+    servidores_usados = np.count_nonzero(vms_por_servidor)
+
+    if secundario is not None:
+        termo = _termo_secundario(cpu_usada[None, :], ram_usada[None, :], vms_por_servidor[None, :], cenario, secundario)
+        return float(servidores_usados + termo[0])
+    return float(servidores_usados)
+
+
+# ===[ 3. Avaliação da População Inteira ]===============================================
+
+class AvaliacaoPopulacao:
+    """
+    Resultado da avaliação vetorizada de uma população.
+    Todos os arrays têm uma linha por indivíduo, na mesma ordem da matriz avaliada.
+    """
+    def __init__(self, fitness: np.ndarray, viavel: np.ndarray, cpu_usada: np.ndarray, ram_usada: np.ndarray, vms_por_servidor: np.ndarray, ids_validos: Optional[np.ndarray] = None):
+        """
+        Args:
+            fitness (np.ndarray): Fitness de cada indivíduo, shape (P,). Infinito se inválido.
+            viavel (np.ndarray): True se o indivíduo respeita todas as capacidades, shape (P,).
+            cpu_usada (np.ndarray): Carga de CPU por servidor, shape (P, S).
+            ram_usada (np.ndarray): Carga de RAM por servidor, shape (P, S).
+            vms_por_servidor (np.ndarray): Número de VMs em cada servidor, shape (P, S).
+            ids_validos (Optional[np.ndarray]): True se todos os genes do indivíduo são
+                IDs de servidor válidos, shape (P,). Padrão: todos válidos.
+        """
+        self.fitness = fitness
+        self.viavel = viavel
+        self.cpu_usada = cpu_usada
+        self.ram_usada = ram_usada
+        self.vms_por_servidor = vms_por_servidor
+        self.ids_validos = ids_validos if ids_validos is not None else np.ones(len(fitness), dtype=bool)
+
+    def __repr__(self) -> str:
+        """Retorna uma representação em string do objeto, útil para debug."""
+        return f"AvaliacaoPopulacao(Indivíduos: {len(self.fitness)}, Viáveis: {int(self.viavel.sum())})"
+
+
+def calculate_population_fitness(population: np.ndarray, cenario: CenarioArrays, secundario: Optional[str] = None) -> AvaliacaoPopulacao:
+    """
+    Avalia todos os indivíduos de uma população em passadas vetorizadas.
+
+    A matriz (indivíduos x VMs) é deslocada linha a linha por `i * S`, de forma
+    que um único bincount sobre a matriz achatada devolva a carga de todos os
+    servidores de todos os indivíduos (matriz P x S).
+
+    Args:
+        population (np.ndarray): Matriz de inteiros (P x V) com os IDs de servidor.
+        cenario (CenarioArrays): O cenário em arrays.
+        secundario (Optional[str]): Critério de desempate (um de SECUNDARIOS),
+            calculado sobre as mesmas cargas. None = apenas o número de servidores.
+
+    Returns:
+        AvaliacaoPopulacao: Fitness, viabilidade e cargas por servidor.
+    """
+    genes = np.asarray(population, dtype=np.int64)
+    if genes.ndim != 2:
+        genes = genes.reshape(-1, cenario.num_vms)
+    num_individuos, num_vms = genes.shape
+    num_servidores = cenario.num_servidores
+
+    # PASSO 1: Indivíduos com IDs de servidor inválidos (inclui -1) são marcados
+    # e seus genes são zerados apenas para não quebrar o bincount.
+    genes_invalidos = (genes < 0) | (genes >= num_servidores)
+    ids_validos = ~genes_invalidos.any(axis=1)
+    if not ids_validos.all():
+        genes = np.where(genes_invalidos, 0, genes)
+
+    # PASSO 2: Carga de todos os servidores de todos os indivíduos.
+    deslocamento = (np.arange(num_individuos, dtype=np.int64) * num_servidores)[:, None]
+    indices = (genes + deslocamento).ravel()
+    tamanho = num_individuos * num_servidores
+    formato = (num_individuos, num_servidores)
+
+    cpu_usada = np.bincount(indices, weights=np.tile(cenario.cpu_req, num_individuos), minlength=tamanho)
+    ram_usada = np.bincount(indices, weights=np.tile(cenario.ram_req, num_individuos), minlength=tamanho)
+    vms_por_servidor = np.bincount(indices, minlength=tamanho).reshape(formato)
+    cpu_usada = cpu_usada.astype(np.int64).reshape(formato)
+    ram_usada = ram_usada.astype(np.int64).reshape(formato)
+
+    # PASSO 3: Viabilidade e fitness (número de servidores com pelo menos uma VM).
+    viavel = ids_validos & np.all(cpu_usada <= cenario.cpu_total, axis=1) & np.all(ram_usada <= cenario.ram_total, axis=1)
+    fitness = np.count_nonzero(vms_por_servidor, axis=1).astype(np.float64)
+    if secundario is not None:
+        fitness += _termo_secundario(cpu_usada, ram_usada, vms_por_servidor, cenario, secundario)
+    fitness[~viavel] = np.inf
+
+    return AvaliacaoPopulacao(fitness, viavel, cpu_usada, ram_usada, vms_por_servidor, ids_validos)
+
+
+def atualizar_fitness(avaliacao: AvaliacaoPopulacao, linhas: np.ndarray, cenario: CenarioArrays, secundario: Optional[str] = None):
+    """
+    Recalcula a viabilidade e o fitness das `linhas` de uma AvaliacaoPopulacao
+    a partir das cargas, depois que elas foram alteradas no lugar (ex.: pelas
+    trocas da swap_mutation_populacao). Custa O(linhas x S), sem repassar os genes.
+    `vms_por_servidor` deve estar atualizado (uma troca não o altera).
+    """
+    linhas = np.asarray(linhas, dtype=np.int64)
+    if linhas.size == 0:
+        return
+    cpu_usada, ram_usada = avaliacao.cpu_usada[linhas], avaliacao.ram_usada[linhas]
+    vms_por_servidor = avaliacao.vms_por_servidor[linhas]
+    viavel = avaliacao.ids_validos[linhas] & np.all(cpu_usada <= cenario.cpu_total, axis=1) & np.all(ram_usada <= cenario.ram_total, axis=1)
+    fitness = np.count_nonzero(vms_por_servidor, axis=1).astype(np.float64)
+    if secundario is not None:
+        fitness += _termo_secundario(cpu_usada, ram_usada, vms_por_servidor, cenario, secundario)
+    fitness[~viavel] = np.inf
+    avaliacao.viavel[linhas] = viavel
+    avaliacao.fitness[linhas] = fitness
+
+
+# ===[ 4. Cache de Fitness (LRU) ]=======================================================
+
+def chave_cromossomo(individual: Sequence[int]) -> bytes:
+    """
+    Gera uma chave compacta (16 bytes) para um cromossomo.
+    O mesmo cromossomo gera a mesma chave, seja ele uma lista ou um array.
+    """
+    genes = np.ascontiguousarray(individual, dtype=np.int32)
+    return hashlib.blake2b(genes.tobytes(), digest_size=16).digest()
+
+
+class FitnessCache:
+    """
+    Cache de fitness de tamanho limitado, com descarte do item usado há mais
+    tempo (LRU). Deve ser compartilhado pelo runner e pelos operadores de
+    crossover, de forma que indivíduos repetidos (elites, cópias do
+    Round-Robin, pais reavaliados) custem apenas uma consulta ao dicionário.
+    """
+    def __init__(self, cenario: CenarioArrays, max_size: int = 50000, secundario: Optional[str] = None):
+        """
+        Args:
+            cenario (CenarioArrays): O cenário usado para calcular o fitness nos "misses".
+            max_size (int): Número máximo de cromossomos guardados no cache.
+            secundario (Optional[str]): Critério de desempate do fitness composto
+                (um de SECUNDARIOS). None = apenas o número de servidores.
+        """
+        _validar_secundario(secundario)
+        self.cenario = cenario
+        self.secundario = secundario
+        self.max_size = max(1, max_size)
+        self._entradas: "OrderedDict[bytes, float]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entradas)
+
+    def _consultar(self, chave: bytes):
+        """Retorna o fitness guardado (ou None), atualizando a ordem LRU e os contadores."""
+        fitness = self._entradas.get(chave)
+        if fitness is None:
+            self.misses += 1
+            return None
+        self._entradas.move_to_end(chave)
+        self.hits += 1
+        return fitness
+
+    def _guardar(self, chave: bytes, fitness: float):
+        """Guarda um fitness no cache, descartando o item mais antigo se necessário."""
+        self._entradas[chave] = fitness
+        self._entradas.move_to_end(chave)
+        if len(self._entradas) > self.max_size:
+            self._entradas.popitem(last=False)
+            self.evictions += 1
+
+    def get_fitness(self, individual: Sequence[int]) -> float:
+        """Retorna o fitness de um indivíduo, calculando-o apenas se não estiver no cache."""
+        chave = chave_cromossomo(individual)
+        fitness = self._consultar(chave)
+        if fitness is None:
+            fitness = calculate_fitness_arrays(individual, self.cenario, self.secundario)
+            self._guardar(chave, fitness)
+        return fitness
+
+    def consultar_populacao(self, population: np.ndarray) -> Tuple[np.ndarray, Dict[bytes, List[int]]]:
+        """
+        Consulta o cache para cada linha de uma população (matriz P x V).
+        Retorna o vetor de fitness (NaN nas linhas ausentes) e, para cada
+        cromossomo ausente, as linhas em que ele aparece: duplicatas dentro da
+        própria população contam como acertos e são avaliadas uma única vez.
+        """
+        genes = np.ascontiguousarray(population, dtype=np.int32)
+        fitness = np.full(len(genes), np.nan)
+        pendentes: Dict[bytes, List[int]] = {}
+        for i in range(len(genes)):
+            chave = hashlib.blake2b(genes[i].tobytes(), digest_size=16).digest()
+            if chave in pendentes:
+                self.hits += 1
+                pendentes[chave].append(i)
+                continue
+            valor = self._consultar(chave)
+            if valor is None:
+                pendentes[chave] = [i]
+            else:
+                fitness[i] = valor
+        return fitness, pendentes
+
+    def guardar_pendentes(self, pendentes: Dict[bytes, List[int]], valores: np.ndarray, fitness: np.ndarray):
+        """
+        Guarda o fitness (`valores`, na ordem de `pendentes`) dos cromossomos
+        ausentes retornados por `consultar_populacao` e o copia para todas as
+        linhas de cada um em `fitness`.
+        """
+        for (chave, indices), valor in zip(pendentes.items(), valores):
+            fitness[indices] = valor
+            self._guardar(chave, float(valor))
+
+    def avaliar_populacao(self, population: np.ndarray, avaliador: Optional[Callable[[np.ndarray], np.ndarray]] = None) -> np.ndarray:
+        """
+        Retorna o vetor de fitness de uma população (matriz P x V).
+        Os indivíduos que não estão no cache são avaliados juntos, em uma
+        única chamada a `calculate_population_fitness` ou ao `avaliador`
+        informado (ex.: o motor paralelo), que recebe a matriz dos "misses"
+        e retorna o vetor de fitness (com o mesmo critério secundário do cache).
+        """
+        fitness, pendentes = self.consultar_populacao(population)
+        if pendentes:
+            genes = np.asarray(population)[[indices[0] for indices in pendentes.values()]].astype(np.int32, copy=False)
+            if avaliador is None:
+                valores = calculate_population_fitness(genes, self.cenario, self.secundario).fitness
+            else:
+                valores = avaliador(genes)
+            self.guardar_pendentes(pendentes, valores, fitness)
+        return fitness
+
+    def registrar_populacao(self, population: np.ndarray, fitness: np.ndarray):
+        """
+        Guarda no cache o fitness de indivíduos avaliados fora dele (ex.: os filhos,
+        avaliados junto com a mutação). Cada cromossomo novo conta como uma avaliação.
+        """
+        genes = np.ascontiguousarray(population, dtype=np.int32)
+        for i in range(len(genes)):
+            chave = hashlib.blake2b(genes[i].tobytes(), digest_size=16).digest()
+            if chave not in self._entradas:
+                self.misses += 1
+            self._guardar(chave, float(fitness[i]))
+
+    @property
+    def taxa_acerto(self) -> float:
+        """Fração das consultas atendidas pelo cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def estatisticas(self) -> Dict[str, float]:
+        """Retorna os contadores do cache em um dicionário."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'tamanho': len(self._entradas),
+            'taxa_acerto': self.taxa_acerto,
+        }
+
+    def limpar(self):
+        """Esvazia o cache e zera os contadores."""
+        self._entradas.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def __repr__(self) -> str:
+        """Retorna uma representação em string do objeto, útil para debug."""
+        return (f"FitnessCache(Tamanho: {len(self._entradas)}/{self.max_size}, "
+                f"Hits: {self.hits}, Misses: {self.misses}, Evictions: {self.evictions})")
+
+
+# ===[ 5. Fitness Incremental (Delta) ]==================================================
+
+class EstadoIndividuo:
+    """
+    Mantém um cromossomo junto com a carga (CPU, RAM e nº de VMs) de cada
+    servidor. Mover ou trocar VMs só altera dois servidores, então a
+    viabilidade e o novo fitness de um movimento são calculados em O(1),
+    e um movimento aceito é aplicado incrementalmente.
+
+    O cromossomo (`individual`) é a própria lista recebida, alterada no lugar.
+
+    O `fitness` daqui é apenas o primário (servidores usados): o termo secundário
+    (ver SECUNDARIOS) depende de todos os servidores e não é mantido. Com o fitness
+    composto ativo, quem compara movimentos por este estado (ex.: a busca local)
+    os compara só pelo número de servidores; o runner reavalia o resultado pelo
+    FitnessCache, já com o termo.
+    """
+    def __init__(self, individual: List[int], cenario: CenarioArrays):
+        """
+        Args:
+            individual (List[int]): O cromossomo. Deve conter apenas IDs válidos.
+            cenario (CenarioArrays): O cenário em arrays.
+        """
+        self.individual = individual
+        self.cenario = cenario
+        genes = np.asarray(individual, dtype=np.int64)
+        num_servidores = cenario.num_servidores
+        if genes.size and (genes.min() < 0 or genes.max() >= num_servidores):
+            raise ValueError("EstadoIndividuo requer um cromossomo com IDs de servidor válidos.")
+
+        # Listas Python: o acesso a um único elemento é mais rápido que em arrays NumPy.
+        self.cpu_req = cenario.cpu_req.tolist()
+        self.ram_req = cenario.ram_req.tolist()
+        self.cpu_total = cenario.cpu_total.tolist()
+        self.ram_total = cenario.ram_total.tolist()
+        self.cpu_usada = np.bincount(genes, weights=cenario.cpu_req, minlength=num_servidores).astype(np.int64).tolist()
+        self.ram_usada = np.bincount(genes, weights=cenario.ram_req, minlength=num_servidores).astype(np.int64).tolist()
+        self.vms_por_servidor = np.bincount(genes, minlength=num_servidores).tolist()
+
+        self.servidores_usados = sum(1 for n in self.vms_por_servidor if n)
+        self.sobrecarregados = sum(1 for s in range(num_servidores) if self._sobrecarregado(s))
+
+    def _sobrecarregado(self, s: int) -> bool:
+        return self.cpu_usada[s] > self.cpu_total[s] or self.ram_usada[s] > self.ram_total[s]
+
+    @property
+    def fitness(self) -> float:
+        """Número de servidores usados, ou infinito se algum servidor estiver sobrecarregado."""
+        return float('inf') if self.sobrecarregados else float(self.servidores_usados)
+
+    # --- Movimento: uma VM para outro servidor ---------------------------------------------
+
+    def avaliar_move(self, vm_idx: int, destino: int) -> Tuple[bool, float]:
+        """
+        Avalia mover a VM `vm_idx` para o servidor `destino`, sem aplicar.
+        Retorna (viável, novo_fitness). "Viável" significa que o indivíduo
+        resultante respeita todas as capacidades.
+        """
+        origem = self.individual[vm_idx]
+        if origem == destino:
+            return self.sobrecarregados == 0, self.fitness
+        cpu, ram = self.cpu_req[vm_idx], self.ram_req[vm_idx]
+
+        sobrecarregados = self.sobrecarregados
+        sobrecarregados -= self._sobrecarregado(origem) + self._sobrecarregado(destino)
+        sobrecarregados += (self.cpu_usada[origem] - cpu > self.cpu_total[origem] or
+                            self.ram_usada[origem] - ram > self.ram_total[origem])
+        sobrecarregados += (self.cpu_usada[destino] + cpu > self.cpu_total[destino] or
+                            self.ram_usada[destino] + ram > self.ram_total[destino])
+
+        usados = self.servidores_usados
+        usados -= self.vms_por_servidor[origem] == 1
+        usados += self.vms_por_servidor[destino] == 0
+
+        viavel = sobrecarregados == 0
+        return viavel, float(usados) if viavel else float('inf')
+
+    def aplicar_move(self, vm_idx: int, destino: int):
+        """Move a VM `vm_idx` para o servidor `destino`, atualizando as cargas."""
+        origem = self.individual[vm_idx]
+        if origem == destino:
+            return
+        cpu, ram = self.cpu_req[vm_idx], self.ram_req[vm_idx]
+        self.sobrecarregados -= self._sobrecarregado(origem) + self._sobrecarregado(destino)
+
+        self.cpu_usada[origem] -= cpu; self.ram_usada[origem] -= ram
+        self.cpu_usada[destino] += cpu; self.ram_usada[destino] += ram
+        self.vms_por_servidor[origem] -= 1
+        self.vms_por_servidor[destino] += 1
+        self.servidores_usados -= self.vms_por_servidor[origem] == 0
+        self.servidores_usados += self.vms_por_servidor[destino] == 1
+
+        self.sobrecarregados += self._sobrecarregado(origem) + self._sobrecarregado(destino)
+        self.individual[vm_idx] = destino
+
+    # --- Troca: duas VMs trocam de servidor --------------------------------------------------
+
+    def avaliar_swap(self, vm_a: int, vm_b: int) -> Tuple[bool, float]:
+        """
+        Avalia trocar os servidores das VMs `vm_a` e `vm_b`, sem aplicar.
+        Uma troca não altera o número de servidores usados; retorna (viável, novo_fitness).
+        """
+        s_a, s_b = self.individual[vm_a], self.individual[vm_b]
+        if s_a == s_b:
+            return self.sobrecarregados == 0, self.fitness
+        delta_cpu = self.cpu_req[vm_b] - self.cpu_req[vm_a]
+        delta_ram = self.ram_req[vm_b] - self.ram_req[vm_a]
+
+        sobrecarregados = self.sobrecarregados
+        sobrecarregados -= self._sobrecarregado(s_a) + self._sobrecarregado(s_b)
+        sobrecarregados += (self.cpu_usada[s_a] + delta_cpu > self.cpu_total[s_a] or
+                            self.ram_usada[s_a] + delta_ram > self.ram_total[s_a])
+        sobrecarregados += (self.cpu_usada[s_b] - delta_cpu > self.cpu_total[s_b] or
+                            self.ram_usada[s_b] - delta_ram > self.ram_total[s_b])
+
+        viavel = sobrecarregados == 0
+        return viavel, float(self.servidores_usados) if viavel else float('inf')
+
+    def swap_cabe(self, vm_a: int, vm_b: int) -> bool:
+        """Verifica se, após a troca, os dois servidores envolvidos respeitam suas capacidades."""
+        s_a, s_b = self.individual[vm_a], self.individual[vm_b]
+        delta_cpu = self.cpu_req[vm_b] - self.cpu_req[vm_a]
+        delta_ram = self.ram_req[vm_b] - self.ram_req[vm_a]
+        return (self.cpu_usada[s_a] + delta_cpu <= self.cpu_total[s_a] and
+                self.ram_usada[s_a] + delta_ram <= self.ram_total[s_a] and
+                self.cpu_usada[s_b] - delta_cpu <= self.cpu_total[s_b] and
+                self.ram_usada[s_b] - delta_ram <= self.ram_total[s_b])
+
+    def aplicar_swap(self, vm_a: int, vm_b: int):
+        """Troca os servidores das VMs `vm_a` e `vm_b`, atualizando as cargas."""
+        s_a, s_b = self.individual[vm_a], self.individual[vm_b]
+        if s_a == s_b:
+            return
+        delta_cpu = self.cpu_req[vm_b] - self.cpu_req[vm_a]
+        delta_ram = self.ram_req[vm_b] - self.ram_req[vm_a]
+        self.sobrecarregados -= self._sobrecarregado(s_a) + self._sobrecarregado(s_b)
+        self.cpu_usada[s_a] += delta_cpu; self.ram_usada[s_a] += delta_ram
+        self.cpu_usada[s_b] -= delta_cpu; self.ram_usada[s_b] -= delta_ram
+        self.sobrecarregados += self._sobrecarregado(s_a) + self._sobrecarregado(s_b)
+        self.individual[vm_a], self.individual[vm_b] = s_b, s_a
+
+    def __repr__(self) -> str:
+        """Retorna uma representação em string do objeto, útil para debug."""
+        return f"EstadoIndividuo(Fitness: {self.fitness}, Servidores usados: {self.servidores_usados}, Sobrecarregados: {self.sobrecarregados})"
@@ -0,0 +1,545 @@
+# Arquivo [ga_runner.py]
+
+"""
+Orquestração do Algoritmo Genético do projeto DRE, independente de interface.
+
+O runner executa uma geração por chamada de `executar_geracao()`. Tanto a
+interface Tkinter (main.py, em uma thread separada) quanto o modo headless
+(dre.py) rodam o laço direto, em velocidade máxima; a interface apenas
+recebe as gerações pelo callback `on_generation`. Este módulo não importa
+Tkinter nem matplotlib.
+"""
+
+# Importando
+import random
+import time
+import numpy as np
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from datacenter_model import MaquinaVirtual, ServidorFisico, carregar_cenario
+from scenario_generator import EXTENSAO_BINARIA, carregar_cenario_binario
+from scenario_cache import carregar_cenario_vmware_compilado
+from vmware_loader import carregar_cenario_vmware_colunar
+from genetic_algorithm import (
+    swap_mutation_populacao,
+    ffd_crossover,
+    crossover_por_consenso,
+    doac_cross,
+    select_parents
+)
+from fitness_engine import construir_arrays_cenario, calculate_population_fitness, atualizar_fitness, chave_cromossomo, fitness_primario, FitnessCache
+from local_search import esvaziar_servidores
+from lower_bounds import calcular_limite_inferior
+from population_init import gerar_populacao_inicial
+from instrumentation import Instrumentacao, contar, coletar_contadores
+from relatorio import relatorio_json, relatorio_logico_json, gerar_relatorio_excel
+
+#===[ Valores Padrão ]====================================================================
+POPULATION_SIZE = 100
+N_GENERATIONS = 1000
+MAX_GENS_NO_IMPROVEMENT = 200
+MUTATION_PROBABILITY = 0.2
+ELITISM_SIZE = 2
+FITNESS_CACHE_SIZE = 50000
+# Mistura de heurísticas da população inicial (ver population_init). None = MISTURA_PADRAO.
+INITIAL_POPULATION_MIX = None
+# Critério secundário (desempate) do fitness, opcional: None, 'concentracao' ou 'menor_servidor'.
+# 'concentracao' dá à seleção um gradiente entre soluções com o mesmo número de servidores.
+FITNESS_SECUNDARIO = None
+# Busca local (esvaziamento de servidores) aplicada às melhores soluções de cada geração.
+LOCAL_SEARCH_ELITES = 0 # 0 = desativada (ex.: 1 = só a melhor solução).
+LOCAL_SEARCH_MAX_MOVES = 1000
+LOCAL_SEARCH_TIME_LIMIT = None # Segundos por indivíduo. None = sem limite.
+
+TIME_LIMIT = None # Prazo (segundos) da execução inteira. None = sem prazo.
+
+# Fases cronometradas de cada execução. 'callback' é o tempo gasto no on_generation (interface).
+FASES = ('inicializacao', 'avaliacao', 'ordenacao', 'busca_local', 'selecao', 'crossover', 'mutacao', 'callback')
+
+# 'doac': D.O.A.C. | 'cpc': Crossover por Consenso | 'ffd': First Fit Decreasing
+CROSSOVERS = ('doac', 'cpc', 'ffd')
+
+#===[ Carregamento do Cenário ]==========================================================
+def carregar_datacenter(cenario_ativo: str, cenario_file: str, arquivo_servidores: str, arquivo_vms: str, usar_cache: bool = True) -> Optional[Tuple[List[MaquinaVirtual], List[ServidorFisico]]]:
+    """
+    Carrega o cenário ('vmware', arquivo JSON ou arquivo binário .npz do
+    scenario_generator) e ordena VMs e servidores por ID,
+    como esperado pelos cromossomos. Retorna None se o carregamento falhar.
+    Com `usar_cache`, o cenário VMware vem do cache compilado (ver scenario_cache).
+    """
+    print("--- Carregando Cenário ---")
+    if cenario_ativo == 'vmware' and usar_cache:
+        datacenter_info = carregar_cenario_vmware_compilado(arquivo_servidores, arquivo_vms)
+    elif cenario_ativo == 'vmware':
+        colunar = carregar_cenario_vmware_colunar(arquivo_servidores, arquivo_vms)
+        datacenter_info = colunar.para_objetos() if colunar is not None else None
+    elif cenario_file.endswith(EXTENSAO_BINARIA):
+        datacenter_info = carregar_cenario_binario(cenario_file)
+    else:
+        datacenter_info = carregar_cenario(cenario_file)
+
+    if not datacenter_info or not datacenter_info.get('servidores'):
+        print("Falha ao carregar o cenário. Encerrando o programa.")
+        return None
+
+    vms = datacenter_info['vms']
+    servidores = datacenter_info['servidores']
+    servidores.sort(key=lambda s: s.id)
+    vms.sort(key=lambda vm: vm.id)
+    print("--- Cenário Carregado com Sucesso ---\n")
+    return vms, servidores
+
+#===[ Classe para Orquestrar o Algoritmo Genético ]=======================================
+class GeneticAlgorithmRunner:
+    """
+    Esta classe encapsula toda a lógica e o estado da simulação do AG.
+    """
+    def __init__(
+        self,
+        vms: List[MaquinaVirtual],
+        servidores: List[ServidorFisico],
+        population_size: int = POPULATION_SIZE,
+        n_generations: int = N_GENERATIONS,
+        max_gens_no_improvement: int = MAX_GENS_NO_IMPROVEMENT,
+        mutation_probability: float = MUTATION_PROBABILITY,
+        elitism_size: int = ELITISM_SIZE,
+        crossover: str = 'doac',
+        fitness_cache_size: int = FITNESS_CACHE_SIZE,
+        fitness_secundario: Optional[str] = FITNESS_SECUNDARIO,
+        initial_population_mix: Optional[Dict[str, float]] = INITIAL_POPULATION_MIX,
+        local_search_elites: int = LOCAL_SEARCH_ELITES,
+        local_search_max_moves: Optional[int] = LOCAL_SEARCH_MAX_MOVES,
+        local_search_time_limit: Optional[float] = LOCAL_SEARCH_TIME_LIMIT,
+        stop_at_lower_bound: bool = True,
+        time_limit: Optional[float] = TIME_LIMIT,
+        engine=None,
+        on_generation: Optional[Callable[[List[int], int, float, List[float]], None]] = None,
+        instrumentacao: Optional[Instrumentacao] = None
+    ):
+        """
+        Args:
+            vms, servidores: O cenário a ser otimizado.
+            population_size, n_generations, max_gens_no_improvement,
+            mutation_probability, elitism_size: Parâmetros do AG.
+            crossover (str): Um de CROSSOVERS.
+            fitness_cache_size (int): Tamanho do cache de fitness.
+            fitness_secundario (Optional[str]): Um de SECUNDARIOS. O fitness passa a
+                ser "servidores usados + desempate" (ver fitness_engine). None = desativado.
+            initial_population_mix (Optional[Dict[str, float]]): Heurística -> peso
+                na população inicial (ex.: {'round_robin': 1}). None = MISTURA_PADRAO.
+            local_search_elites (int): Quantas das melhores soluções passam pela
+                busca local a cada geração. 0 = desativada.
+            local_search_max_moves, local_search_time_limit: Orçamento da busca
+                local por indivíduo (VMs movidas / segundos). None = sem limite.
+            stop_at_lower_bound (bool): Para assim que o melhor fitness alcança o
+                limite inferior do número de servidores (ótimo comprovado).
+            time_limit (Optional[float]): Prazo, em segundos, contado a partir da
+                criação do runner (inclui a população inicial). O prazo é verificado
+                entre as fases de cada geração; ao esgotá-lo, o AG para e a melhor
+                solução viável encontrada até ali é a resposta. None = sem prazo.
+            engine: ParallelGenerationEngine opcional. None = modo serial.
+            on_generation: Chamado ao fim de cada geração com
+                (melhor_solucao, geracao, melhor_fitness, historico).
+            instrumentacao (Optional[Instrumentacao]): Recebe o tempo das fases e
+                os contadores de cada geração (ver instrumentation). None = desativada.
+        """
+        if crossover not in CROSSOVERS:
+            raise ValueError(f"Crossover '{crossover}' desconhecido. Use um de {CROSSOVERS}.")
+        self.vms = vms
+        self.servidores = servidores
+        self.population_size = population_size
+        self.n_generations = n_generations
+        self.max_gens_no_improvement = max_gens_no_improvement
+        self.mutation_probability = mutation_probability
+        self.elitism_size = elitism_size
+        self.crossover = crossover
+        self.local_search_elites = local_search_elites
+        self.local_search_max_moves = local_search_max_moves
+        self.local_search_time_limit = local_search_time_limit
+        self.stop_at_lower_bound = stop_at_lower_bound
+        self.time_limit = time_limit
+        # Relógio da execução: o prazo e o tempo de cada fase são medidos a partir daqui.
+        self._inicio = time.perf_counter()
+        self._prazo = self._inicio + time_limit if time_limit is not None else None
+        self.tempo_fases: Dict[str, float] = {fase: 0.0 for fase in FASES}
+        self.engine = engine
+        self.on_generation = on_generation
+        self.instrumentacao = instrumentacao
+        # Descarta contadores de execuções anteriores no mesmo processo.
+        coletar_contadores()
+        # Gerador NumPy da mutação vetorizada, semeado pelo 'random' global para
+        # que random.seed(...) continue tornando a execução reprodutível.
+        self.rng = np.random.default_rng(random.getrandbits(64))
+
+        # Cenário em arrays para avaliar o fitness sem tocar nos objetos 'servidores'.
+        self.cenario = construir_arrays_cenario(vms, servidores)
+        # Cache de fitness compartilhado pelo runner e pelos operadores de crossover.
+        self.fitness_secundario = fitness_secundario
+        self.fitness_cache = FitnessCache(self.cenario, fitness_cache_size, fitness_secundario)
+        # Limite inferior do número de servidores: nenhuma solução usa menos que isso.
+        self.limite_inferior = calcular_limite_inferior(self.cenario)
+
+        # Inicializa o estado do AG
+        # NOTE: Gerando a população inicial:
+        # A população é uma matriz contígua (indivíduos x VMs) de int16/int32
+        # (ver fitness_engine.tipo_genes): 2 a 4 bytes por gene, e copiar um
+        # indivíduo ou a população inteira é uma cópia de memória. O prazo da
+        # execução também limita a inicialização.
+        self.population = np.asarray(
+            gerar_populacao_inicial(self.vms, self.servidores, self.population_size, initial_population_mix, self.rng, self.cenario,
+                                    prazo=self._prazo),
+            dtype=self.cenario.tipo_genes,
+        )
+        inicio = self._registrar_fase('inicializacao', self._inicio)
+        self.generation_count = 0
+        self.last_best_fitness = float('inf')
+        self.generations_without_improvement = 0
+        self.best_solution_final = self.population[0].tolist()
+        self.best_fitness_history = []
+        # Fitness da população atual, quando já conhecido (os filhos são avaliados
+        # na mutação); None = a próxima geração consulta o cache.
+        # A população inicial é avaliada já aqui e a melhor solução viável fica
+        # registrada: se o prazo se esgotar antes da primeira geração, o resultado
+        # é essa solução, e não um indivíduo nunca avaliado.
+        avaliador = self.engine.avaliar_fitness if self.engine else None
+        self._fitness_populacao: Optional[np.ndarray] = self.fitness_cache.avaliar_populacao(self.population, avaliador)
+        self._registrar_fase('avaliacao', inicio)
+        melhor = int(np.argmin(self._fitness_populacao))
+        if np.isfinite(self._fitness_populacao[melhor]):
+            self.last_best_fitness = float(self._fitness_populacao[melhor])
+            self.best_solution_final = self.population[melhor].tolist()
+        self._parada_solicitada = False
+        # Chaves dos cromossomos em que a busca local já não encontra melhoria.
+        self._otimos_locais = set()
+        self.servidores_esvaziados = 0
+        # Estatísticas do cache na última coleta dos contadores.
+        self._cache_coletado = (self.fitness_cache.hits, self.fitness_cache.misses)
+
+    def start(self):
+        """Anuncia o início da simulação."""
+        print("--- Iniciando Simulação do Algoritmo Genético ---")
+        print(f"Limite inferior do número de servidores: {self.limite_inferior.valor} {self.limite_inferior.limites}")
+        if self.otimo_comprovado():
+            print(f"População inicial: Fitness {fitness_primario(self.last_best_fitness):.0f} alcançou o limite inferior. Solução ótima, encerrando.")
+
+    def parar(self):
+        """Solicita a parada do AG ao fim da geração atual (ex.: janela fechada)."""
+        self._parada_solicitada = True
+
+    def terminou(self) -> bool:
+        """Verifica os critérios de parada."""
+        return (self._parada_solicitada or
+                self.otimo_comprovado() or
+                self.prazo_esgotado() or
+                self.generation_count >= self.n_generations or
+                self.generations_without_improvement >= self.max_gens_no_improvement)
+
+    def otimo_comprovado(self) -> bool:
+        """Verifica se o melhor fitness já alcançou o limite inferior (e a parada no ótimo está ativa)."""
+        return self.stop_at_lower_bound and self.limite_inferior.otimo(fitness_primario(self.last_best_fitness))
+
+    def prazo_esgotado(self) -> bool:
+        """Verifica se o prazo (time_limit) da execução já passou."""
+        return self._prazo is not None and time.perf_counter() >= self._prazo
+
+    def tempo_restante(self) -> Optional[float]:
+        """Segundos até o prazo (nunca negativo), ou None se não houver prazo."""
+        if self._prazo is None:
+            return None
+        return max(0.0, self._prazo - time.perf_counter())
+
+    def _somar_fase(self, fase: str, segundos: float):
+        """Soma `segundos` ao tempo da fase (e à instrumentação, se houver)."""
+        self.tempo_fases[fase] += segundos
+        if self.instrumentacao is not None:
+            self.instrumentacao.registrar_fase(fase, segundos)
+
+    def _registrar_fase(self, fase: str, inicio: float) -> float:
+        """Soma o tempo decorrido desde `inicio` à fase e retorna o instante atual."""
+        agora = time.perf_counter()
+        self._somar_fase(fase, agora - inicio)
+        return agora
+
+    def _coletar_contadores(self) -> Dict[str, int]:
+        """Os contadores desde a última coleta, incluindo as avaliações e acertos do cache do runner."""
+        acertos, faltas = self._cache_coletado
+        contar('acertos_cache', self.fitness_cache.hits - acertos)
+        contar('avaliacoes', self.fitness_cache.misses - faltas)
+        self._cache_coletado = (self.fitness_cache.hits, self.fitness_cache.misses)
+        return coletar_contadores()
+
+    def motivo_parada(self) -> Optional[str]:
+        """O critério de parada atingido, ou None se o AG ainda não terminou."""
+        if self._parada_solicitada:
+            return 'parada_solicitada'
+        if self.otimo_comprovado():
+            return 'otimo_comprovado'
+        if self.prazo_esgotado():
+            return 'prazo'
+        if self.generation_count >= self.n_generations:
+            return 'geracoes'
+        if self.generations_without_improvement >= self.max_gens_no_improvement:
+            return 'estagnacao'
+        return None
+
+    def estatisticas(self) -> Dict:
+        """Resumo da execução: melhor fitness, gap, motivo da parada e tempo por fase."""
+        return {
+            'melhor_fitness': self.last_best_fitness,
+            'servidores_usados': fitness_primario(self.last_best_fitness),
+            'limite_inferior': self.limite_inferior.valor,
+            'gap': self.limite_inferior.gap(fitness_primario(self.last_best_fitness)),
+            'geracoes': self.generation_count,
+            'motivo_parada': self.motivo_parada(),
+            'tempo_total': time.perf_counter() - self._inicio,
+            'tempo_fases': dict(self.tempo_fases),
+        }
+
+    def _texto_fitness(self, fitness: float) -> str:
+        """Fitness (servidores usados e, se ativo, o desempate) e gap de otimalidade, formatados para os logs."""
+        servidores = fitness_primario(fitness)
+        texto = f"{servidores:.0f}"
+        if self.fitness_secundario is not None and np.isfinite(fitness):
+            texto += f" (+{fitness - servidores:.4f} {self.fitness_secundario})"
+        return f"{texto} (Limite = {self.limite_inferior.valor}, Gap = {self.limite_inferior.gap(servidores):.1%})"
+
+    def melhores_individuos(self, quantidade: int) -> np.ndarray:
+        """As `quantidade` melhores soluções viáveis da população atual (cópia, uma por linha), da melhor para a pior."""
+        fitness = self.fitness_cache.avaliar_populacao(self.population)
+        ordem = np.argsort(fitness, kind='stable')[:quantidade]
+        return self.population[ordem[np.isfinite(fitness[ordem])]]
+
+    def receber_migrantes(self, migrantes: Sequence[Sequence[int]]) -> int:
+        """
+        Substitui os piores indivíduos da população pelos migrantes (modelo de
+        ilhas). Migrantes já presentes na população são ignorados.
+        Retorna quantos foram inseridos.
+        """
+        presentes = {chave_cromossomo(individuo) for individuo in self.population}
+        novos = []
+        for migrante in migrantes:
+            chave = chave_cromossomo(migrante)
+            if chave not in presentes:
+                presentes.add(chave)
+                novos.append(migrante)
+        novos = novos[:max(0, len(self.population) - self.elitism_size)]
+        if not novos:
+            return 0
+        fitness = self.fitness_cache.avaliar_populacao(self.population)
+        piores = np.argsort(-fitness, kind='stable')[:len(novos)]
+        for i, migrante in zip(piores, novos):
+            self.population[i] = migrante
+        self._fitness_populacao = None
+        return len(novos)
+
+    def _cruzar(self, parent1: np.ndarray, parent2: np.ndarray):
+        """
+        Aplica o operador de crossover configurado a duas linhas da população.
+        Os operadores percorrem os genes um a um em Python, o que é mais rápido
+        em listas: cada pai é convertido uma vez (uma cópia em C, O(V)).
+        """
+        parent1, parent2 = parent1.tolist(), parent2.tolist()
+        if self.crossover == 'cpc':
+            return crossover_por_consenso(parent1, parent2, self.vms, self.servidores)
+        if self.crossover == 'ffd':
+            return ffd_crossover(self.vms, self.servidores)
+        # HACK: Crossover DOAC (Dominant Optimal Anti-Cancer - Anticâncer Ótimo Dominante):
+        return doac_cross(parent1, parent2, self.vms, self.servidores, self.fitness_cache)
+
+    def _busca_local_elites(self, population_fitness: np.ndarray, ordem: np.ndarray) -> bool:
+        """
+        Aplica a busca local às melhores soluções viáveis, no lugar (população e fitness).
+        Retorna True se alguma delas melhorou.
+        """
+        melhorou = False
+        for i in ordem[:self.local_search_elites]:
+            if not np.isfinite(population_fitness[i]) or self.prazo_esgotado():
+                break
+            chave = chave_cromossomo(self.population[i])
+            if chave in self._otimos_locais:
+                continue
+            # A busca local nunca ultrapassa o prazo da execução.
+            tempo_limite = self.local_search_time_limit
+            restante = self.tempo_restante()
+            if restante is not None:
+                tempo_limite = restante if tempo_limite is None else min(tempo_limite, restante)
+            resultado = esvaziar_servidores(self.population[i].tolist(), self.cenario, self.local_search_max_moves, tempo_limite)
+            if resultado.esvaziados:
+                self.population[i] = resultado.individual
+                # Reavaliado pelo cache: com o fitness composto, o desempate também muda.
+                population_fitness[i] = self.fitness_cache.get_fitness(resultado.individual)
+                self.servidores_esvaziados += resultado.esvaziados
+                melhorou = True
+            else:
+                if len(self._otimos_locais) >= 10000:
+                    self._otimos_locais.clear()
+                self._otimos_locais.add(chave)
+        return melhorou
+
+    def executar_geracao(self) -> bool:
+        """
+        Executa uma única geração do AG.
+        Retorna False quando um critério de parada já foi atingido.
+        O prazo é verificado entre as fases: a melhor solução já está
+        registrada antes da reprodução, então interromper ali não perde nada.
+        """
+        if self.terminou():
+            return False
+        if self.instrumentacao is None:
+            return self._executar_geracao()
+
+        geracao = self.generation_count
+        self.instrumentacao.iniciar_geracao(geracao)
+        continua = self._executar_geracao()
+        melhor = self.best_fitness_history[-1] if self.best_fitness_history else float('inf')
+        self.instrumentacao.finalizar_geracao(geracao, melhor, self._coletar_contadores())
+        return continua
+
+    def _executar_geracao(self) -> bool:
+        """O corpo de `executar_geracao` (sem a verificação inicial de parada)."""
+        # NOTE: Calculando o fitness:
+        # Indivíduos repetidos (elites, cópias) são atendidos pelo cache.
+        inicio = time.perf_counter()
+        if self._fitness_populacao is not None:
+            # Filhos avaliados junto com a mutação da geração anterior (e elites já avaliadas).
+            population_fitness, self._fitness_populacao = self._fitness_populacao, None
+        else:
+            avaliador = self.engine.avaliar_fitness if self.engine else None
+            population_fitness = self.fitness_cache.avaliar_populacao(self.population, avaliador)
+        inicio = self._registrar_fase('avaliacao', inicio)
+        ordem = np.argsort(population_fitness, kind='stable')
+        inicio = self._registrar_fase('ordenacao', inicio)
+
+        # NOTE: Busca local (memética) nas melhores soluções:
+        melhorou = self.local_search_elites > 0 and self._busca_local_elites(population_fitness, ordem)
+        inicio = self._registrar_fase('busca_local', inicio)
+        if melhorou:
+            ordem = np.argsort(population_fitness, kind='stable')
+        sorted_population = self.population[ordem]
+        self._registrar_fase('ordenacao', inicio)
+
+        best_solution_this_gen = sorted_population[0].tolist()
+        best_fitness_this_gen = float(population_fitness[ordem[0]])
+        self.best_fitness_history.append(best_fitness_this_gen)
+
+        if self.generation_count % 10 == 0:
+            print(f"Geração {self.generation_count}: Melhor Fitness = {self._texto_fitness(best_fitness_this_gen)} | {self.fitness_cache}")
+
+        # A geração 0 parte da população inicial, já registrada: não conta como estagnação.
+        if best_fitness_this_gen < self.last_best_fitness or self.generation_count == 0:
+            self.last_best_fitness = best_fitness_this_gen
+            self.best_solution_final = best_solution_this_gen
+            self.generations_without_improvement = 0
+            if self.otimo_comprovado():
+                print(f"Geração {self.generation_count}: Fitness {fitness_primario(best_fitness_this_gen):.0f} alcançou o limite inferior. Solução ótima, encerrando.")
+        else:
+            self.generations_without_improvement += 1
+
+        if self.on_generation:
+            inicio = time.perf_counter()
+            self.on_generation(best_solution_this_gen, self.generation_count, best_fitness_this_gen, self.best_fitness_history)
+            self._registrar_fase('callback', inicio)
+
+        if self.otimo_comprovado() or self.prazo_esgotado():
+            # Ótimo comprovado (nada a melhorar) ou prazo esgotado: não produz os filhos.
+            self.generation_count += 1
+            return False
+
+        # NOTE: Elitismo:
+        # A nova população é preenchida no lugar: elites no topo, filhos em seguida.
+        n_elites = min(self.elitism_size, self.population_size)
+        new_population = np.empty((self.population_size, self.cenario.num_vms), dtype=self.population.dtype)
+        new_population[:n_elites] = sorted_population[:n_elites]
+        n_filhos = self.population_size - n_elites
+
+        # NOTE: Crossover:
+        inicio = time.perf_counter()
+        if self.engine:
+            # NOTE: Modo paralelo: os pares são sorteados aqui e os filhos
+            # são produzidos nos workers (a mutação é feita abaixo, em bloco).
+            # Os pais são sorteados por índice: os workers os leem da memória compartilhada.
+            indices = np.arange(len(sorted_population))
+            pares = [select_parents(indices) for _ in range(-(-n_filhos // 2))]
+            inicio = self._registrar_fase('selecao', inicio)
+            filhos = self.engine.produzir_filhos(sorted_population, pares, 0.0)[:n_filhos]
+            new_population[n_elites:n_elites + len(filhos)] = filhos
+            produzidos = len(filhos)
+            inicio = self._registrar_fase('crossover', inicio)
+        else:
+            produzidos = 0
+            tempo_selecao = 0.0
+            while produzidos < n_filhos:
+                if self.prazo_esgotado():
+                    break # A geração incompleta é descartada logo abaixo.
+                antes = time.perf_counter()
+                parent1, parent2 = select_parents(sorted_population)
+                tempo_selecao += time.perf_counter() - antes
+                child1, child2 = self._cruzar(parent1, parent2)
+                new_population[n_elites + produzidos] = child1
+                produzidos += 1
+                if produzidos < n_filhos:
+                    new_population[n_elites + produzidos] = child2
+                    produzidos += 1
+            # A seleção é descontada do tempo do crossover.
+            self._somar_fase('selecao', tempo_selecao)
+            agora = time.perf_counter()
+            self._somar_fase('crossover', agora - inicio - tempo_selecao)
+            inicio = agora
+
+        if self.prazo_esgotado():
+            # A melhor solução desta geração já foi registrada; os filhos são descartados.
+            self.generation_count += 1
+            return False
+
+        # NOTE: Mutação (vetorizada sobre os filhos novos de uma vez, no lugar):
+        # Filhos já vistos (cópias de elites, de pais ou de outros filhos) são
+        # atendidos pelo cache e seguem sem mutação. Os novos são avaliados uma
+        # única vez, aqui: as cargas dessa avaliação alimentam a mutação (cada
+        # troca é checada e aplicada contra elas), o fitness das linhas trocadas
+        # é refeito a partir das cargas, e o resultado é a avaliação da próxima geração.
+        filhos = new_population[n_elites:n_elites + produzidos]
+        fitness_filhos, pendentes = self.fitness_cache.consultar_populacao(filhos)
+        if pendentes:
+            novos = np.array([linhas[0] for linhas in pendentes.values()])
+            genes = filhos[novos]
+            avaliacao = calculate_population_fitness(genes, self.cenario, self.fitness_secundario)
+            self.fitness_cache.guardar_pendentes(pendentes, avaliacao.fitness, fitness_filhos)
+            trocadas = np.flatnonzero(swap_mutation_populacao(
+                genes, self.cenario, self.mutation_probability, self.rng, avaliacao.cpu_usada, avaliacao.ram_usada))
+            atualizar_fitness(avaliacao, trocadas, self.cenario, self.fitness_secundario)
+            filhos[novos[trocadas]] = genes[trocadas]
+            fitness_filhos[novos[trocadas]] = avaliacao.fitness[trocadas]
+            self.fitness_cache.registrar_populacao(genes[trocadas], avaliacao.fitness[trocadas])
+        self._registrar_fase('mutacao', inicio)
+
+        self.population = new_population[:n_elites + produzidos]
+        self._fitness_populacao = np.concatenate([population_fitness[ordem[:n_elites]], fitness_filhos])
+        self.generation_count += 1
+        return not self.terminou()
+
+    def finalizar(self, gerar_relatorios: bool = True):
+        """Encerra a simulação, mostrando o resultado e gerando os relatórios."""
+        print("\n--- Simulação Finalizada ---")
+        print(f"Melhor solução final encontrada com fitness de: {self._texto_fitness(self.last_best_fitness)}")
+        print(f"Cache de fitness: {self.fitness_cache.estatisticas()}")
+        if self.local_search_elites > 0:
+            print(f"Servidores esvaziados pela busca local: {self.servidores_esvaziados}")
+        estatisticas = self.estatisticas()
+        fases = ", ".join(f"{fase}: {segundos:.2f}s" for fase, segundos in estatisticas['tempo_fases'].items())
+        print(f"Motivo da parada: {estatisticas['motivo_parada']} | Tempo total: {estatisticas['tempo_total']:.2f}s ({fases})")
+        if self.instrumentacao is not None:
+            self.instrumentacao.encerrar()
+        if self.engine:
+            self.engine.encerrar()
+        if gerar_relatorios:
+            relatorio_json(self.best_solution_final, self.vms, self.servidores, "solucao_final_detalhada.json")
+            relatorio_logico_json(self.best_solution_final, "solucao_final_logica.json")
+            gerar_relatorio_excel(self.best_solution_final, self.servidores, self.vms)
+
+    def executar(self, gerar_relatorios: bool = True) -> List[int]:
+        """Roda o AG do início ao fim, sem interface (velocidade máxima)."""
+        self.start()
+        while self.executar_geracao():
+            pass
+        self.finalizar(gerar_relatorios)
+        return self.best_solution_final
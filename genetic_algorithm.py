@@ -8,14 +8,18 @@ Este arquivo define as funções para:
 - Calcular o fitness de uma solução.
 - Selecionar os pais para reprodução.
 - Realizar o crossover entre os pais.
-- Aplicar mutação em um indivíduo.
+- Aplicar mutação em um indivíduo ou na população inteira (vetorizada).
 """
 
 # Importando
 import random
 import copy
-from typing import List, Tuple
+import numpy as np
+from typing import List, Optional, Sequence, Tuple
 from datacenter_model import MaquinaVirtual, ServidorFisico
+from fitness_engine import CenarioArrays, FitnessCache, calculate_population_fitness
+from capacity_index import IndiceCapacidade
+from instrumentation import contar
 
 
 
@@ -105,10 +109,12 @@ def calculate_fitness(individual: List[int], vms: List[MaquinaVirtual], servidor
 
 # ===[ 3. Seleção dos Pais ]=============================================================
 
-def select_parents(population: List[List[int]],  num_parents: int = 2) -> List[List[int]]:
+def select_parents(population: Sequence[Sequence[int]],  num_parents: int = 2) -> List[Sequence[int]]:
     """
     Seleciona os pais da população para o crossover.
     Uma forma simples é a seleção por torneio.
+    A população pode ser uma lista de listas ou a matriz (P x V) do runner;
+    neste caso os pais são linhas (views) da matriz.
     """
     # Para simplificar, vamos usar uma seleção elitista: escolher aleatoriamente
     # entre os 10% melhores da população.
@@ -118,29 +124,32 @@ def select_parents(population: List[List[int]],  num_parents: int = 2) -> List[L
         pool_size = 2 # Garante que tenhamos pelo menos 2 no pool
 
     selection_pool = population[:pool_size]
-    
-    parents = random.sample(selection_pool, k=num_parents)
+
+    # Sorteia as posições (os mesmos sorteios de random.sample(selection_pool, ...),
+    # que não aceita arrays NumPy).
+    parents = [selection_pool[i] for i in random.sample(range(len(selection_pool)), k=num_parents)]
     return parents
 
 
 # ===[ 4. Crossover ]===================================================================
 
-def doac_cross(parent1: List[int], parent2: List[int], vms: List[MaquinaVirtual], servidores: List[ServidorFisico]) -> Tuple[List[int], List[int]]:
+def doac_cross(parent1: List[int], parent2: List[int], vms: List[MaquinaVirtual], servidores: List[ServidorFisico], cache: Optional[FitnessCache] = None) -> Tuple[List[int], List[int]]:
     """
     Dominant Optimal Anti-Cancer
     Função principal do Crossover DOAC v4.
     Orquestra a criação de dois filhos, cada um baseado em um dos pais,
+    Se um `cache` de fitness for informado, os pais são avaliados por ele.
     """
     # Cria o primeiro filho usando o Pai 1 como referência principal
-    child1 = _criar_filho_doac(parent1, parent2, vms, servidores)
+    child1 = _criar_filho_doac(parent1, parent2, vms, servidores, cache)
     
     # Cria o segundo filho invertendo os papéis para gerar diversidade
-    child2 = _criar_filho_doac(parent2, parent1, vms, servidores)
+    child2 = _criar_filho_doac(parent2, parent1, vms, servidores, cache)
 
     return child1, child2
 
 
-def _criar_filho_doac(pai: List[int], mae: List[int], vms: List[MaquinaVirtual], servidores: List[ServidorFisico]) -> List[int]:
+def _criar_filho_doac(pai: List[int], mae: List[int], vms: List[MaquinaVirtual], servidores: List[ServidorFisico], cache: Optional[FitnessCache] = None) -> List[int]:
     """
     Cria um filho usando a lógica DOAC (Dominant Optimal Anti-Cancer)
     seguindo o modelo "Lousa Limpa" - VERSÃO FINAL E ROBUSTA.
@@ -148,8 +157,12 @@ def _criar_filho_doac(pai: List[int], mae: List[int], vms: List[MaquinaVirtual],
     num_vms = len(vms)
     
     # PASSO 1: Identifica o melhor dos pais
-    fitness_pai = calculate_fitness(pai, vms, servidores)
-    fitness_mae = calculate_fitness(mae, vms, servidores)
+    if cache is not None:
+        fitness_pai = cache.get_fitness(pai)
+        fitness_mae = cache.get_fitness(mae)
+    else:
+        fitness_pai = calculate_fitness(pai, vms, servidores)
+        fitness_mae = calculate_fitness(mae, vms, servidores)
     melhor_pai = pai if fitness_pai <= fitness_mae else mae
 
     # --- Início da Construção do Filho ---
@@ -158,6 +171,8 @@ def _criar_filho_doac(pai: List[int], mae: List[int], vms: List[MaquinaVirtual],
     # Limpa os servidores para iniciar a construção do zero ("Lousa Limpa").
     for s in servidores:
         s.resetar()
+    # Índice de capacidade livre, atualizado a cada alocação, para os reparos.
+    indice = IndiceCapacidade(servidores)
             
     # PASSO 2: Aplica o Gene Dominante
     servidores_ativos_melhor_pai = {s_id for s_id in melhor_pai if s_id != -1}
@@ -165,7 +180,7 @@ def _criar_filho_doac(pai: List[int], mae: List[int], vms: List[MaquinaVirtual],
         id_servidor_dominante = max(servidores_ativos_melhor_pai, key=lambda s_id: servidores[s_id].cpu_total + servidores[s_id].ram_total)
         for vm_idx, s_id in enumerate(melhor_pai):
             if s_id == id_servidor_dominante:
-                servidores[id_servidor_dominante].alocar_vm(vms[vm_idx])
+                indice.alocar(servidores[id_servidor_dominante], vms[vm_idx])
                 filho[vm_idx] = id_servidor_dominante
 
     # PASSO 3: Construção Alternada do Restante do Filho
@@ -175,14 +190,16 @@ def _criar_filho_doac(pai: List[int], mae: List[int], vms: List[MaquinaVirtual],
             servidor_proposto_id = genitor[i]
             vm_a_alocar = vms[i]
             if 0 <= servidor_proposto_id < len(servidores) and servidores[servidor_proposto_id].pode_hospedar(vm_a_alocar):
-                servidores[servidor_proposto_id].alocar_vm(vm_a_alocar)
+                indice.alocar(servidores[servidor_proposto_id], vm_a_alocar)
                 filho[i] = servidor_proposto_id
             else:
-                for s in sorted(servidores, key=lambda srv: srv.ram_disponivel, reverse=True):
-                    if s.pode_hospedar(vm_a_alocar):
-                        s.alocar_vm(vm_a_alocar)
-                        filho[i] = s.id
-                        break
+                # Reparo: servidor com mais RAM livre que comporta a VM.
+                contar('reparos')
+                novo_lar = indice.alocar_melhor(vm_a_alocar)
+                if novo_lar is not None:
+                    filho[i] = novo_lar.id
+                else:
+                    contar('buscas_fallback')
     
     # PASSO 4: Tratamento Anti-Câncer (Lógica Robusta)
     servidores_ativos_filho = {s_id for s_id in filho if s_id != -1}
@@ -190,22 +207,20 @@ def _criar_filho_doac(pai: List[int], mae: List[int], vms: List[MaquinaVirtual],
         id_cancer = min(servidores_ativos_filho, key=lambda s_id: servidores[s_id].cpu_total + servidores[s_id].ram_total)
         servidor_cancer = servidores[id_cancer]
         vms_no_cancer_idx = [i for i, s_id in enumerate(filho) if s_id == id_cancer]
-        servidores_alvo = sorted([s for s in servidores if s.id in servidores_ativos_filho and s.id != id_cancer], key=lambda srv: srv.ram_disponivel, reverse=True)
+        indice_alvo = IndiceCapacidade([s for s in servidores if s.id in servidores_ativos_filho and s.id != id_cancer])
         
         filho_reparado = list(filho)
         sucesso_reparo_total = True
         
         for vm_idx in vms_no_cancer_idx:
             vm_a_mover_obj = vms[vm_idx]
-            alocado = False
-            for novo_lar in servidores_alvo:
-                if novo_lar.pode_hospedar(vm_a_mover_obj):
-                    servidor_cancer.desalocar_vm(vm_a_mover_obj)
-                    novo_lar.alocar_vm(vm_a_mover_obj)
-                    filho_reparado[vm_idx] = novo_lar.id
-                    alocado = True
-                    break
-            if not alocado:
+            novo_lar = indice_alvo.encontrar(vm_a_mover_obj)
+            if novo_lar is not None:
+                servidor_cancer.desalocar_vm(vm_a_mover_obj)
+                indice_alvo.alocar(novo_lar, vm_a_mover_obj)
+                filho_reparado[vm_idx] = novo_lar.id
+            else:
+                contar('buscas_fallback')
                 sucesso_reparo_total = False
                 break
         
@@ -229,6 +244,7 @@ def _criar_filho_doac(pai: List[int], mae: List[int], vms: List[MaquinaVirtual],
         s.resetar()
         
     if -1 in filho:
+        contar('filhos_descartados')
         return melhor_pai
     else:
         return filho
@@ -283,6 +299,7 @@ def _criar_filho_cpc(pai_base: List[int], pai_guia: List[int], vms: List[Maquina
     # 1. Prepara a "Lousa Limpa"
     for s in servidores:
         s.resetar()
+    indice = IndiceCapacidade(servidores)
 
     # 2. Particionamento: Encontra o consenso e o conflito.
     vms_consenso_indices = {i for i in range(num_vms) if pai_base[i] == pai_guia[i]}
@@ -294,7 +311,7 @@ def _criar_filho_cpc(pai_base: List[int], pai_guia: List[int], vms: List[Maquina
         servidor_id = pai_base[vm_idx]
         if 0 <= servidor_id < len(servidores):
             filho[vm_idx] = servidor_id
-            servidores[servidor_id].alocar_vm(vms[vm_idx])
+            indice.alocar(servidores[servidor_id], vms[vm_idx])
 
     # 4. Alocação Inteligente do Conflito
     for vm_idx in vms_conflito_indices:
@@ -304,22 +321,23 @@ def _criar_filho_cpc(pai_base: List[int], pai_guia: List[int], vms: List[Maquina
         sugestao_pai1 = pai_base[vm_idx]
         if 0 <= sugestao_pai1 < len(servidores) and servidores[sugestao_pai1].pode_hospedar(vm_a_alocar):
             filho[vm_idx] = sugestao_pai1
-            servidores[sugestao_pai1].alocar_vm(vm_a_alocar)
+            indice.alocar(servidores[sugestao_pai1], vm_a_alocar)
             alocado = True
         
         if not alocado:
             sugestao_pai2 = pai_guia[vm_idx]
             if 0 <= sugestao_pai2 < len(servidores) and servidores[sugestao_pai2].pode_hospedar(vm_a_alocar):
                 filho[vm_idx] = sugestao_pai2
-                servidores[sugestao_pai2].alocar_vm(vm_a_alocar)
+                indice.alocar(servidores[sugestao_pai2], vm_a_alocar)
                 alocado = True
 
         if not alocado:
-            for servidor in sorted(servidores, key=lambda s: s.ram_disponivel, reverse=True):
-                if servidor.pode_hospedar(vm_a_alocar):
-                    filho[vm_idx] = servidor.id
-                    servidor.alocar_vm(vm_a_alocar)
-                    break
+            contar('reparos')
+            novo_lar = indice.alocar_melhor(vm_a_alocar)
+            if novo_lar is not None:
+                filho[vm_idx] = novo_lar.id
+            else:
+                contar('buscas_fallback')
     
     # 5. Limpeza Final
     for s in servidores:
@@ -349,13 +367,13 @@ def crossover_por_consenso(parent1: List[int], parent2: List[int], vms: List[Maq
             vms_para_mover = list(servidor_a_esvaziar.vms_hospedadas)
             servidor_a_esvaziar.resetar()
             
-            outros_servidores = [s for s in servidores_em_uso if s.id != servidor_a_esvaziar.id]
+            indice_outros = IndiceCapacidade([s for s in servidores_em_uso if s.id != servidor_a_esvaziar.id])
             for vm_obj in vms_para_mover:
-                for outro_servidor in sorted(outros_servidores, key=lambda s: s.ram_disponivel, reverse=True):
-                    if outro_servidor.pode_hospedar(vm_obj):
-                        outro_servidor.alocar_vm(vm_obj)
-                        filho_mutante[vm_obj.id] = outro_servidor.id
-                        break
+                outro_servidor = indice_outros.alocar_melhor(vm_obj)
+                if outro_servidor is not None:
+                    filho_mutante[vm_obj.id] = outro_servidor.id
+                else:
+                    contar('buscas_fallback')
         
         for s in servidores:
             s.resetar()
@@ -376,68 +394,68 @@ def robin_hood_mutation(individual: List[int], vms: List[MaquinaVirtual], servid
     Esta é uma mutação agressiva.
     Tenta consolidar o servidor menos utilizado ("pobre") movendo suas VMs
     para os servidores mais utilizados ("ricos").
+    As cargas são simuladas em listas simples (os objetos 'servidores' não são
+    tocados). Para a busca local completa, veja local_search.esvaziar_servidores.
     """
     if random.random() > probability:
         return individual
 
     # 1. Simula o estado e identifica servidores ativos e suas cargas
-    temp_servidores = [ServidorFisico(s.id, s.cpu_total, s.ram_total) for s in servidores]
-    servidores_em_uso = {} # {id_servidor: [lista de vms]}
+    num_servidores = len(servidores)
+    cpu_livre = [s.cpu_total for s in servidores]
+    ram_livre = [s.ram_total for s in servidores]
+    servidores_em_uso = {} # {id_servidor: [índices das vms]}
     for vm_idx, s_id in enumerate(individual):
-        if s_id not in servidores_em_uso: servidores_em_uso[s_id] = []
-        servidores_em_uso[s_id].append(vms[vm_idx])
-        temp_servidores[s_id].alocar_vm(vms[vm_idx])
+        if not 0 <= s_id < num_servidores:
+            return individual # VMs não alocadas (-1) ou IDs inválidos: nada a consolidar
+        servidores_em_uso.setdefault(s_id, []).append(vm_idx)
+        cpu_livre[s_id] -= vms[vm_idx].cpu_req
+        ram_livre[s_id] -= vms[vm_idx].ram_req
 
-    active_server_ids = [s_id for s_id, vms_list in servidores_em_uso.items() if vms_list]
+    active_server_ids = list(servidores_em_uso)
     if len(active_server_ids) < 2: return individual
 
     # PASSO 1: Identifica o servidor de menor capacidade/carga ("pobre") para esvaziar
     # O servidor "pobre" é o que tem menos VMs. Em caso de empate, o com menos carga.
-    servidor_pobre_id = min(active_server_ids, key=lambda s_id: (len(servidores_em_uso[s_id]), temp_servidores[s_id].cpu_usada + temp_servidores[s_id].ram_usada))
-    
+    def carga(s_id):
+        return (len(servidores_em_uso[s_id]),
+                (servidores[s_id].cpu_total - cpu_livre[s_id]) + (servidores[s_id].ram_total - ram_livre[s_id]))
+    servidor_pobre_id = min(active_server_ids, key=carga)
+
     # Lista de VMs a serem movidas
-    vms_para_mover = sorted(servidores_em_uso[servidor_pobre_id], key=lambda vm: vm.cpu_req + vm.ram_req, reverse=True)
-    
+    vms_para_mover = sorted(servidores_em_uso[servidor_pobre_id], key=lambda i: vms[i].cpu_req + vms[i].ram_req, reverse=True)
+
     # Lista de servidores que podem receber as VMs ("ricos" em espaço)
     servidores_alvo_ids = [s_id for s_id in active_server_ids if s_id != servidor_pobre_id]
 
     # Cria uma cópia do indivíduo para aplicar a mutação
     mutated_individual = list(individual)
-    
-    # PASSO 2 & 3: Tenta alocar as VMs do servidor pobre nos outros servidores
-    sucesso_total = True
-    for vm_a_mover in vms_para_mover:
-        vm_idx = vms.index(vm_a_mover)
-        vm_alocada = False
 
-        # Heurística "Worst Fit": ordena os alvos pelo maior espaço livre
-        alvos_ordenados = sorted(servidores_alvo_ids, key=lambda s_id: temp_servidores[s_id].ram_disponivel + temp_servidores[s_id].cpu_disponivel, reverse=True)
-        
-        for alvo_id in alvos_ordenados:
-            if temp_servidores[alvo_id].pode_hospedar(vm_a_mover):
-                # Sucesso! Atualiza o estado temporário para a próxima iteração
-                temp_servidores[alvo_id].alocar_vm(vm_a_mover)
-                mutated_individual[vm_idx] = alvo_id
-                vm_alocada = True
-                break
-        
-        if not vm_alocada:
-            sucesso_total = False
-            break # Se uma VM não couber, a consolidação falha
+    # PASSO 2 & 3: Tenta alocar as VMs do servidor pobre nos outros servidores
+    for vm_idx in vms_para_mover:
+        vm_a_mover = vms[vm_idx]
+        # Heurística "Worst Fit": o alvo com maior espaço livre que comporta a VM
+        alvos = [s_id for s_id in servidores_alvo_ids
+                 if cpu_livre[s_id] >= vm_a_mover.cpu_req and ram_livre[s_id] >= vm_a_mover.ram_req]
+        if not alvos:
+            # Se uma VM não couber, a consolidação falha e o indivíduo original é mantido
+            return individual
+        alvo_id = max(alvos, key=lambda s_id: ram_livre[s_id] + cpu_livre[s_id])
+        cpu_livre[alvo_id] -= vm_a_mover.cpu_req
+        ram_livre[alvo_id] -= vm_a_mover.ram_req
+        mutated_individual[vm_idx] = alvo_id
 
-    # PASSO 4: Se todas as VMs foram movidas, a mutação é bem-sucedida
-    if sucesso_total:
-        print(f"--- Mutação de Consolidação (Robin Hood) bem-sucedida! Servidor {servidor_pobre_id} esvaziado. ---")
-        return mutated_individual
-    else:
-        # Se falhou, retorna o indivíduo original sem alterações
-        return individual
+    # PASSO 4: Todas as VMs foram movidas: a mutação é bem-sucedida
+    return mutated_individual
 
 
 def swap_mutation(individual: List[int], vms: List[MaquinaVirtual], servidores: List[ServidorFisico], probability: float) -> List[int]:
     """
-    Realiza a mutação de troca (swap) entre duas VMs, garantindo a validade da solução
-    e seguindo o modelo "Lousa Limpa".
+    Realiza a mutação de troca (swap) entre duas VMs, garantindo a validade da solução.
+    A viabilidade da troca só depende dos dois servidores envolvidos, então apenas
+    a carga deles é calculada (os objetos 'servidores' não são tocados). Sem as
+    cargas prontas, somá-las exige uma passada pelo cromossomo (O(V)); o runner
+    usa a swap_mutation_populacao, que checa as trocas contra as cargas da avaliação.
     """
     if random.random() < probability and len(vms) >= 2:
         # PASSO 1: Sorteia dois índices de VM diferentes para a troca
@@ -449,34 +467,101 @@ def swap_mutation(individual: List[int], vms: List[MaquinaVirtual], servidores:
         # Não faz sentido trocar VMs que já estão no mesmo servidor
         if server_id_1 == server_id_2:
             return individual
+        # VMs não alocadas (-1) ou IDs inválidos não participam da troca
+        if not (0 <= server_id_1 < len(servidores) and 0 <= server_id_2 < len(servidores)):
+            return individual
 
-        # PASSO 2: Prepara a "Lousa Limpa" e constrói o estado atual
-        # Limpamos todos os servidores e depois alocamos as VMs conforme o 'individual'
-        for s in servidores:
-            s.resetar()
+        # PASSO 2: Carga atual apenas dos dois servidores envolvidos
+        cpu_1 = ram_1 = cpu_2 = ram_2 = 0
         for i, s_id in enumerate(individual):
-            if s_id != -1:
-                servidores[s_id].alocar_vm(vms[i])
-        
-        # Pega os objetos relevantes
+            if s_id == server_id_1:
+                cpu_1 += vms[i].cpu_req; ram_1 += vms[i].ram_req
+            elif s_id == server_id_2:
+                cpu_2 += vms[i].cpu_req; ram_2 += vms[i].ram_req
+
+        # PASSO 3: Simula a troca (sai uma VM, entra a outra) e verifica as capacidades
         vm1 = vms[vm_index_1]
         vm2 = vms[vm_index_2]
         servidor1 = servidores[server_id_1]
         servidor2 = servidores[server_id_2]
-
-        # PASSO 3: Simula a troca DESALOCANDO as VMs de suas posições atuais
-        servidor1.desalocar_vm(vm1)
-        servidor2.desalocar_vm(vm2)
-
-        # PASSO 4: Verifica se a troca é válida nos servidores agora "vazios"
-        if servidor1.pode_hospedar(vm2) and servidor2.pode_hospedar(vm1):
+        if (cpu_1 - vm1.cpu_req + vm2.cpu_req <= servidor1.cpu_total and
+                ram_1 - vm1.ram_req + vm2.ram_req <= servidor1.ram_total and
+                cpu_2 - vm2.cpu_req + vm1.cpu_req <= servidor2.cpu_total and
+                ram_2 - vm2.ram_req + vm1.ram_req <= servidor2.ram_total):
             # A troca é válida. Aplica a mutação no cromossomo.
             individual[vm_index_1] = server_id_2
             individual[vm_index_2] = server_id_1
-        
-        # PASSO 5: Limpa a "bancada" para a próxima função
-        # Independentemente de a mutação ter ocorrido ou não, resetamos os servidores.
-        for s in servidores:
-            s.resetar()
 
     return individual
+
+
+def swap_mutation_populacao(
+    population: np.ndarray,
+    cenario: CenarioArrays,
+    probability: float,
+    rng: np.random.Generator,
+    cpu_usada: Optional[np.ndarray] = None,
+    ram_usada: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Versão vetorizada da swap_mutation para a população inteira (matriz P x V).
+
+    Cada indivíduo é sorteado para mutação com a mesma `probability` da
+    swap_mutation; para os sorteados, um par de VMs distintas é escolhido e a
+    troca é aceita se as VMs estão em servidores diferentes e os dois
+    servidores comportam a troca. Tudo é feito com operações de array contra
+    as matrizes de carga (P x S), e as trocas aceitas são aplicadas de uma vez.
+
+    Args:
+        population (np.ndarray): Matriz da população. É alterada no lugar.
+        cenario (CenarioArrays): O cenário em arrays.
+        probability (float): Probabilidade de mutação de cada indivíduo.
+        rng (np.random.Generator): Gerador de números aleatórios.
+        cpu_usada, ram_usada (Optional[np.ndarray]): Matrizes de carga (P x S),
+            por exemplo as da AvaliacaoPopulacao. Se informadas, são atualizadas
+            no lugar; se não, são calculadas aqui.
+
+    Returns:
+        np.ndarray: Máscara (P,) dos indivíduos que tiveram uma troca aplicada.
+    """
+    num_individuos, num_vms = population.shape
+    aceitas = np.zeros(num_individuos, dtype=bool)
+    if num_vms < 2 or num_individuos == 0:
+        return aceitas
+
+    # PASSO 1: Sorteia quem sofre mutação e o par de VMs (distintas) de cada um.
+    linhas = np.flatnonzero(rng.random(num_individuos) < probability)
+    if linhas.size == 0:
+        return aceitas
+    vm_a = rng.integers(0, num_vms, size=linhas.size)
+    vm_b = rng.integers(0, num_vms - 1, size=linhas.size)
+    vm_b += vm_b >= vm_a
+
+    if cpu_usada is None or ram_usada is None:
+        avaliacao = calculate_population_fitness(population, cenario)
+        cpu_usada, ram_usada = avaliacao.cpu_usada, avaliacao.ram_usada
+
+    # PASSO 2: Servidores envolvidos; VMs não alocadas (-1) ou IDs inválidos ficam de fora.
+    num_servidores = cenario.num_servidores
+    s_a = population[linhas, vm_a]
+    s_b = population[linhas, vm_b]
+    candidatas = (s_a != s_b) & (s_a >= 0) & (s_a < num_servidores) & (s_b >= 0) & (s_b < num_servidores)
+    linhas, vm_a, vm_b, s_a, s_b = linhas[candidatas], vm_a[candidatas], vm_b[candidatas], s_a[candidatas], s_b[candidatas]
+
+    # PASSO 3: Checa a capacidade dos dois servidores após a troca (a sai, b entra em s_a).
+    delta_cpu = cenario.cpu_req[vm_b] - cenario.cpu_req[vm_a]
+    delta_ram = cenario.ram_req[vm_b] - cenario.ram_req[vm_a]
+    cabe = ((cpu_usada[linhas, s_a] + delta_cpu <= cenario.cpu_total[s_a]) &
+            (ram_usada[linhas, s_a] + delta_ram <= cenario.ram_total[s_a]) &
+            (cpu_usada[linhas, s_b] - delta_cpu <= cenario.cpu_total[s_b]) &
+            (ram_usada[linhas, s_b] - delta_ram <= cenario.ram_total[s_b]))
+    linhas, vm_a, vm_b, s_a, s_b = linhas[cabe], vm_a[cabe], vm_b[cabe], s_a[cabe], s_b[cabe]
+    delta_cpu, delta_ram = delta_cpu[cabe], delta_ram[cabe]
+
+    # PASSO 4: Aplica as trocas aceitas em bloco (uma por linha, então não há colisões).
+    population[linhas, vm_a] = s_b
+    population[linhas, vm_b] = s_a
+    cpu_usada[linhas, s_a] += delta_cpu; ram_usada[linhas, s_a] += delta_ram
+    cpu_usada[linhas, s_b] -= delta_cpu; ram_usada[linhas, s_b] -= delta_ram
+    aceitas[linhas] = True
+    return aceitas
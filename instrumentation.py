@@ -0,0 +1,280 @@
+# Arquivo [instrumentation.py]
+
+"""
+Instrumentação do laço do Algoritmo Genético do projeto DRE.
+
+O runner já cronometra cada fase da geração (`tempo_fases`), mas só imprime o
+melhor fitness a cada 10 gerações: não dá para saber, geração a geração, se
+uma execução lenta gasta o tempo no fitness, no crossover, na mutação, na
+ordenação ou na interface. Este módulo recebe do runner, a cada geração, o
+tempo de cada fase e os contadores, e os entrega a saídas plugáveis.
+
+Contadores:
+- Os operadores chamam `contar(nome)` (um incremento em um dict do processo;
+  custo desprezível). O runner coleta e zera os contadores ao fim de cada
+  geração. No modo paralelo, os workers devolvem os seus junto com os filhos.
+- 'avaliacoes' e 'acertos_cache' vêm do FitnessCache do runner.
+
+Saídas (qualquer objeto com `registrar(registro)` e `encerrar(resumo)`):
+- SaidaConsole: Uma linha a cada N gerações e o resumo ao final.
+- SaidaJSONL: Um JSON por linha (uma linha por geração e uma de resumo).
+- SaidaCallback: Chama uma função com cada registro (ex.: testes, interface).
+
+Perfil (opcional): `Instrumentacao(perfil_geracoes=(10, 20))` liga o cProfile
+da geração 10 até a 20 (inclusive) e, ao final, imprime as funções mais caras
+ou grava o perfil (`arquivo_perfil`, lido por `pstats`/snakeviz). Um
+perfilador por amostragem pode ser usado no lugar do cProfile, desde que
+tenha `enable()` e `disable()`.
+
+Uso:
+    python -m dre run --headless --instrumentacao --perfil 10:20
+    python -m dre run --headless --instrumentacao-jsonl geracoes.jsonl
+
+Este módulo define:
+- CONTADORES: Os contadores conhecidos.
+- contar / coletar_contadores / somar_contadores: Os contadores do processo.
+- SaidaConsole, SaidaJSONL, SaidaCallback: As saídas.
+- Instrumentacao: Agrega fases e contadores por geração e aciona o perfil.
+"""
+
+# Importando
+import cProfile
+import io
+import json
+import pstats
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+
+# ===[ 1. Contadores ]===================================================================
+
+# 'avaliacoes': Fitness calculados (faltas no cache de fitness).
+# 'acertos_cache': Fitness atendidos pelo cache.
+# 'reparos': VMs cujo servidor proposto pelos pais não as comporta (o crossover
+#     recorre ao reparo pelo IndiceCapacidade).
+# 'buscas_fallback': Buscas de servidor substituto (reparos, anticâncer e
+#     anti-gêmeos) em que o IndiceCapacidade não encontrou nenhum servidor que
+#     comporte a VM (a VM fica sem servidor ou a evacuação é desfeita).
+# 'filhos_descartados': Filhos do D.O.A.C. com VMs sem servidor (o melhor pai é devolvido).
+# 'servidores_esvaziados': Servidores esvaziados pela busca local.
+CONTADORES = ('avaliacoes', 'acertos_cache', 'reparos', 'buscas_fallback', 'filhos_descartados', 'servidores_esvaziados')
+
+_contadores: Dict[str, int] = {}
+
+
+def contar(nome: str, quantidade: int = 1):
+    """Soma `quantidade` ao contador `nome` do processo."""
+    _contadores[nome] = _contadores.get(nome, 0) + quantidade
+
+
+def coletar_contadores() -> Dict[str, int]:
+    """Retorna os contadores do processo e os zera."""
+    coletados = dict(_contadores)
+    _contadores.clear()
+    return coletados
+
+
+def somar_contadores(contadores: Dict[str, int]):
+    """Soma contadores coletados em outro processo (workers) aos deste processo."""
+    for nome, quantidade in contadores.items():
+        contar(nome, quantidade)
+
+
+# ===[ 2. Saídas ]=======================================================================
+
+class SaidaConsole:
+    """
+    Imprime as fases e os contadores a cada `intervalo` gerações e o resumo ao final.
+    """
+    def __init__(self, intervalo: int = 10):
+        """
+        Args:
+            intervalo (int): Imprime uma a cada `intervalo` gerações.
+        """
+        self.intervalo = max(1, intervalo)
+
+    def registrar(self, registro: Dict):
+        if registro['geracao'] % self.intervalo == 0:
+            fases = " ".join(f"{fase}={segundos * 1000:.1f}ms" for fase, segundos in registro['fases'].items() if segundos)
+            contadores = " ".join(f"{nome}={valor}" for nome, valor in registro['contadores'].items() if valor)
+            print(f"[Instrumentação] Geração {registro['geracao']}: {registro['tempo'] * 1000:.1f}ms | {fases} | {contadores}")
+
+    def encerrar(self, resumo: Dict):
+        total = resumo['tempo'] or 1.0
+        print(f"--- Instrumentação: {resumo['geracoes']} gerações em {resumo['tempo']:.2f}s ---")
+        for fase, segundos in sorted(resumo['fases'].items(), key=lambda item: item[1], reverse=True):
+            print(f"  {fase:<14} {segundos:9.3f}s ({segundos / total:6.1%})")
+        if resumo.get('preparacao'):
+            print("  Preparação: " + " ".join(f"{fase}={segundos:.3f}s" for fase, segundos in resumo['preparacao'].items()))
+        for nome, valor in resumo['contadores'].items():
+            print(f"  {nome:<22} {valor}")
+
+    def __repr__(self) -> str:
+        """Retorna uma representação em string do objeto, útil para debug."""
+        return f"SaidaConsole(Intervalo: {self.intervalo})"
+
+
+class SaidaJSONL:
+    """
+    Grava um registro JSON por linha: um por geração e, ao final, o resumo
+    (com "tipo": "resumo").
+    """
+    def __init__(self, caminho: str):
+        """
+        Args:
+            caminho (str): Arquivo de saída (sobrescrito).
+        """
+        self.caminho = caminho
+        self._arquivo = open(caminho, 'w', encoding='utf-8')
+
+    def registrar(self, registro: Dict):
+        self._arquivo.write(json.dumps({'tipo': 'geracao', **registro}) + "\n")
+
+    def encerrar(self, resumo: Dict):
+        if self._arquivo.closed:
+            return
+        self._arquivo.write(json.dumps({'tipo': 'resumo', **resumo}) + "\n")
+        self._arquivo.close()
+
+    def __repr__(self) -> str:
+        """Retorna uma representação em string do objeto, útil para debug."""
+        return f"SaidaJSONL(Caminho: {self.caminho})"
+
+
+class SaidaCallback:
+    """
+    Entrega cada registro (e o resumo) a funções do usuário.
+    """
+    def __init__(self, ao_registrar: Callable[[Dict], None], ao_encerrar: Optional[Callable[[Dict], None]] = None):
+        """
+        Args:
+            ao_registrar: Chamada com o registro de cada geração.
+            ao_encerrar: Chamada com o resumo ao final (opcional).
+        """
+        self.ao_registrar = ao_registrar
+        self.ao_encerrar = ao_encerrar
+
+    def registrar(self, registro: Dict):
+        self.ao_registrar(registro)
+
+    def encerrar(self, resumo: Dict):
+        if self.ao_encerrar is not None:
+            self.ao_encerrar(resumo)
+
+    def __repr__(self) -> str:
+        """Retorna uma representação em string do objeto, útil para debug."""
+        return f"SaidaCallback(Função: {getattr(self.ao_registrar, '__name__', self.ao_registrar)})"
+
+
+# ===[ 3. Instrumentação ]===============================================================
+
+class Instrumentacao:
+    """
+    Agrega, por geração, o tempo de cada fase e os contadores e os entrega às
+    saídas. Opcionalmente, liga um perfilador em um intervalo de gerações.
+    """
+    def __init__(
+        self,
+        saidas: Optional[List] = None,
+        perfil_geracoes: Optional[Tuple[int, int]] = None,
+        arquivo_perfil: Optional[str] = None,
+        perfil_linhas: int = 25,
+        perfilador=None
+    ):
+        """
+        Args:
+            saidas (Optional[List]): Saídas dos registros. Padrão: [SaidaConsole()].
+            perfil_geracoes (Optional[Tuple[int, int]]): Gerações (primeira, última,
+                inclusive) sob o perfilador. None = sem perfil.
+            arquivo_perfil (Optional[str]): Onde gravar o perfil (formato pstats).
+                None = imprime as `perfil_linhas` funções de maior tempo acumulado.
+            perfilador: Objeto com `enable()`/`disable()`. Padrão: cProfile.Profile().
+        """
+        self.saidas = saidas if saidas is not None else [SaidaConsole()]
+        self.perfil_geracoes = perfil_geracoes
+        self.arquivo_perfil = arquivo_perfil
+        self.perfil_linhas = perfil_linhas
+        self.perfilador = perfilador
+        if perfil_geracoes is not None and perfilador is None:
+            self.perfilador = cProfile.Profile()
+        self._perfil_ativo = False
+        self._perfil_usado = False
+
+        self.geracoes = 0
+        self.tempo_total = 0.0
+        self.fases_total: Dict[str, float] = {}
+        self.contadores_total: Dict[str, int] = {nome: 0 for nome in CONTADORES}
+        # Fases registradas fora de uma geração (a inicialização do runner).
+        self.fases_preparacao: Dict[str, float] = {}
+        self._fases: Dict[str, float] = {}
+        self._inicio_geracao: Optional[float] = None
+
+    def iniciar_geracao(self, geracao: int):
+        """Marca o início de uma geração (e liga o perfilador, se for a primeira do intervalo)."""
+        self._fases = {}
+        self._inicio_geracao = time.perf_counter()
+        if self.perfil_geracoes is not None and not self._perfil_ativo and self.perfil_geracoes[0] <= geracao <= self.perfil_geracoes[1]:
+            self.perfilador.enable()
+            self._perfil_ativo = self._perfil_usado = True
+
+    def registrar_fase(self, fase: str, segundos: float):
+        """
+        Soma `segundos` à fase na geração atual. Fora de uma geração (antes da
+        primeira), o tempo vai para a preparação, mostrada no resumo.
+        """
+        fases = self._fases if self._inicio_geracao is not None else self.fases_preparacao
+        fases[fase] = fases.get(fase, 0.0) + segundos
+
+    def finalizar_geracao(self, geracao: int, melhor_fitness: float, contadores: Dict[str, int]):
+        """
+        Fecha a geração: monta o registro, entrega às saídas e desliga o
+        perfilador ao fim do intervalo.
+        """
+        if self._perfil_ativo and geracao >= self.perfil_geracoes[1]:
+            self.perfilador.disable()
+            self._perfil_ativo = False
+        tempo = time.perf_counter() - self._inicio_geracao if self._inicio_geracao is not None else sum(self._fases.values())
+        registro = {
+            'geracao': geracao,
+            'melhor_fitness': melhor_fitness,
+            'tempo': tempo,
+            'fases': dict(self._fases),
+            'contadores': {nome: contadores.get(nome, 0) for nome in sorted(set(CONTADORES) | set(contadores))},
+        }
+        self.geracoes += 1
+        self.tempo_total += tempo
+        for fase, segundos in self._fases.items():
+            self.fases_total[fase] = self.fases_total.get(fase, 0.0) + segundos
+        for nome, valor in contadores.items():
+            self.contadores_total[nome] = self.contadores_total.get(nome, 0) + valor
+        for saida in self.saidas:
+            saida.registrar(registro)
+        self._inicio_geracao = None
+
+    def resumo(self) -> Dict:
+        """Totais da execução: gerações, tempo, tempo por fase, preparação e contadores."""
+        return {'geracoes': self.geracoes, 'tempo': self.tempo_total, 'fases': dict(self.fases_total),
+                'preparacao': dict(self.fases_preparacao), 'contadores': dict(self.contadores_total)}
+
+    def encerrar(self):
+        """Desliga o perfilador, grava/imprime o perfil e encerra as saídas."""
+        if self._perfil_ativo:
+            self.perfilador.disable()
+            self._perfil_ativo = False
+        if self._perfil_usado and isinstance(self.perfilador, cProfile.Profile):
+            if self.arquivo_perfil:
+                self.perfilador.dump_stats(self.arquivo_perfil)
+                print(f"Perfil das gerações {self.perfil_geracoes[0]}-{self.perfil_geracoes[1]} gravado em '{self.arquivo_perfil}'.")
+            else:
+                texto = io.StringIO()
+                pstats.Stats(self.perfilador, stream=texto).sort_stats('cumulative').print_stats(self.perfil_linhas)
+                print(f"--- Perfil das gerações {self.perfil_geracoes[0]}-{self.perfil_geracoes[1]} ---")
+                print(texto.getvalue())
+        resumo = self.resumo()
+        for saida in self.saidas:
+            saida.encerrar(resumo)
+
+    def __repr__(self) -> str:
+        """Retorna uma representação em string do objeto, útil para debug."""
+        return f"Instrumentacao(Saídas: {len(self.saidas)}, Gerações: {self.geracoes}, Perfil: {self.perfil_geracoes})"
@@ -0,0 +1,252 @@
+# Arquivo [island_model.py]
+
+"""
+Modelo de ilhas do Algoritmo Genético do projeto DRE.
+
+Uma única população com seleção entre os 10% melhores (`select_parents`)
+converge cedo e passa a girar em torno da mesma solução. No modelo de ilhas,
+N populações evoluem de forma independente, cada uma em um processo (todos os
+núcleos trabalham) e cada uma com o seu crossover, e de tempos em tempos
+trocam as melhores soluções (migração):
+
+- A cada `intervalo_migracao` gerações, cada ilha envia cópias das suas
+  `n_migrantes` melhores soluções às vizinhas da topologia e insere, no lugar
+  das suas piores, os migrantes que já chegaram.
+- Topologias: 'anel' (a ilha i envia para i + 1), 'todos' (envia para todas) e
+  'aleatoria' (a cada migração, para uma ilha sorteada).
+- A migração é assíncrona, por filas (multiprocessing.Queue): nenhuma ilha
+  espera pelas outras, e migrantes ainda não entregues são simplesmente
+  aproveitados na migração seguinte.
+- Quando uma ilha comprova o ótimo (limite inferior) todas param; o prazo
+  (`time_limit`) vale para a execução inteira.
+
+`population_size` é o total, dividido entre as ilhas, para que a comparação com
+uma população única use o mesmo número de avaliações por geração.
+
+Uso:
+    python -m dre run --headless --ilhas 4 --ilhas-crossovers doac,cpc --migracao 10
+
+Este módulo define:
+- TOPOLOGIAS: As topologias de migração.
+- ResultadoIlhas: O resultado de uma execução.
+- executar_ilhas: Executa o modelo de ilhas e retorna a melhor solução.
+"""
+
+# Importando
+import io
+import os
+import queue
+import random
+import time
+import contextlib
+import multiprocessing
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from datacenter_model import MaquinaVirtual, ServidorFisico
+from fitness_engine import construir_arrays_cenario
+from ga_runner import GeneticAlgorithmRunner, POPULATION_SIZE, CROSSOVERS
+from shared_buffers import ArrayCompartilhado, CenarioCompartilhado, anexar_cenario
+
+
+
+# ===[ 1. Parâmetros ]===================================================================
+
+TOPOLOGIAS = ('anel', 'todos', 'aleatoria')
+
+INTERVALO_MIGRACAO = 10 # Gerações entre migrações.
+N_MIGRANTES = 2         # Soluções enviadas a cada vizinha por migração.
+
+
+def _destinos(ilha: int, n_ilhas: int, topologia: str, rng: random.Random) -> List[int]:
+    """As ilhas que recebem os migrantes de `ilha` nesta migração."""
+    if n_ilhas < 2:
+        return []
+    if topologia == 'anel':
+        return [(ilha + 1) % n_ilhas]
+    if topologia == 'todos':
+        return [outra for outra in range(n_ilhas) if outra != ilha]
+    return [rng.choice([outra for outra in range(n_ilhas) if outra != ilha])]
+
+
+# ===[ 2. Processo de Cada Ilha ]========================================================
+
+def _executar_ilha(ilha: int, n_ilhas: int, descritor_cenario: Tuple, descritor_ids: Tuple, parametros_ag: Dict,
+                   semente: int, prazo: Optional[float], topologia: str, intervalo_migracao: int, n_migrantes: int,
+                   filas, resultados, parar, verbose: bool):
+    """Evolui uma ilha até um critério de parada, migrando pelas filas."""
+    # Os migrantes que ficarem nas filas ao final não devem impedir o processo de terminar.
+    for fila in filas:
+        fila.cancel_join_thread()
+
+    random.seed(semente)
+    rng = random.Random(semente)
+    # O cenário vem da memória compartilhada (sem serializar as listas de objetos).
+    # É copiado e desanexado logo: a ilha pode usá-lo até o fim sem manter os blocos abertos.
+    cenario, _ = anexar_cenario(descritor_cenario, copiar=True)
+    ids_vms = ArrayCompartilhado.anexar(descritor_ids)
+    vms = [MaquinaVirtual(vm_id, cpu, ram) for vm_id, cpu, ram in zip(ids_vms.array.tolist(), cenario.cpu_req.tolist(), cenario.ram_req.tolist())]
+    servidores = [ServidorFisico(s_id, cpu, ram) for s_id, (cpu, ram) in enumerate(zip(cenario.cpu_total.tolist(), cenario.ram_total.tolist()))]
+    ids_vms.fechar()
+
+    # Só a ilha 'verbose' mostra o log do runner; as demais ficariam intercaladas.
+    saida = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+    with saida:
+        # O prazo é absoluto (time.time) para descontar o tempo de criação dos processos.
+        time_limit = max(0.0, prazo - time.time()) if prazo is not None else None
+        runner = GeneticAlgorithmRunner(vms, servidores, time_limit=time_limit, **parametros_ag)
+        runner.start()
+        enviados = recebidos = 0
+        while not parar.is_set() and runner.executar_geracao():
+            if intervalo_migracao > 0 and runner.generation_count % intervalo_migracao == 0:
+                # Recebe primeiro: os migrantes que chegaram desde a última migração.
+                migrantes = []
+                while True:
+                    try:
+                        migrantes.extend(filas[ilha].get_nowait())
+                    except queue.Empty:
+                        break
+                recebidos += runner.receber_migrantes(migrantes)
+                melhores = runner.melhores_individuos(n_migrantes)
+                if len(melhores):
+                    # Linhas da matriz compacta da população: baratas de serializar.
+                    for destino in _destinos(ilha, n_ilhas, topologia, rng):
+                        filas[destino].put(melhores)
+                        enviados += len(melhores)
+        if runner.otimo_comprovado():
+            parar.set()
+        elif parar.is_set():
+            runner.parar() # Outra ilha comprovou o ótimo.
+        runner.finalizar(gerar_relatorios=False)
+
+    resultados.put({
+        'ilha': ilha,
+        'crossover': runner.crossover,
+        'melhor_solucao': runner.best_solution_final,
+        'melhor_fitness': runner.last_best_fitness,
+        'enviados': enviados,
+        'recebidos': recebidos,
+        'estatisticas': runner.estatisticas(),
+    })
+
+
+# ===[ 3. Execução ]=====================================================================
+
+class ResultadoIlhas:
+    """
+    O resultado de `executar_ilhas`: a melhor solução de todas as ilhas e o resumo de cada uma.
+    """
+    def __init__(self, melhor_solucao: List[int], melhor_fitness: float, ilhas: List[Dict], tempo_total: float):
+        """
+        Args:
+            melhor_solucao (List[int]): O melhor cromossomo encontrado.
+            melhor_fitness (float): O fitness dele.
+            ilhas (List[Dict]): Resumo de cada ilha (crossover, fitness, migrantes, estatísticas).
+            tempo_total (float): Duração da execução, em segundos.
+        """
+        self.melhor_solucao = melhor_solucao
+        self.melhor_fitness = melhor_fitness
+        self.ilhas = ilhas
+        self.tempo_total = tempo_total
+
+    def __repr__(self) -> str:
+        """Retorna uma representação em string do objeto, útil para debug."""
+        return f"ResultadoIlhas(Melhor Fitness: {self.melhor_fitness}, Ilhas: {len(self.ilhas)}, Tempo: {self.tempo_total:.2f}s)"
+
+
+def executar_ilhas(
+    vms: List[MaquinaVirtual],
+    servidores: List[ServidorFisico],
+    n_ilhas: Optional[int] = None,
+    crossovers: Sequence[str] = ('doac', 'cpc'),
+    intervalo_migracao: int = INTERVALO_MIGRACAO,
+    n_migrantes: int = N_MIGRANTES,
+    topologia: str = 'anel',
+    semente: Optional[int] = None,
+    **parametros_ag
+) -> ResultadoIlhas:
+    """
+    Executa o AG no modelo de ilhas, uma ilha por processo.
+
+    Args:
+        vms, servidores: O cenário (ordenados por ID).
+        n_ilhas (Optional[int]): Número de ilhas. Padrão: todos os núcleos (mínimo 2).
+        crossovers (Sequence[str]): Crossover de cada ilha, em rodízio (ilha i usa
+            crossovers[i % len(crossovers)]).
+        intervalo_migracao (int): Gerações entre migrações. 0 = ilhas isoladas.
+        n_migrantes (int): Soluções enviadas a cada vizinha por migração.
+        topologia (str): Uma de TOPOLOGIAS.
+        semente (Optional[int]): Semente da execução; a ilha i usa semente + i.
+        **parametros_ag: Parâmetros do GeneticAlgorithmRunner. `population_size` é o
+            total de todas as ilhas; `time_limit` vale para a execução inteira.
+    """
+    if topologia not in TOPOLOGIAS:
+        raise ValueError(f"Topologia '{topologia}' desconhecida. Use uma de {TOPOLOGIAS}.")
+    for crossover in crossovers:
+        if crossover not in CROSSOVERS:
+            raise ValueError(f"Crossover '{crossover}' desconhecido. Use um de {CROSSOVERS}.")
+    if not crossovers:
+        raise ValueError("Informe ao menos um crossover para as ilhas.")
+    for parametro in ('engine', 'on_generation', 'instrumentacao', 'crossover'):
+        if parametros_ag.pop(parametro, None) is not None:
+            print(f"AVISO: '{parametro}' é ignorado no modelo de ilhas.")
+
+    n_ilhas = n_ilhas or max(2, os.cpu_count() or 1)
+    semente = semente if semente is not None else random.getrandbits(32)
+    inicio = time.time()
+    time_limit = parametros_ag.pop('time_limit', None)
+    prazo = inicio + time_limit if time_limit is not None else None
+    populacao_total = parametros_ag.pop('population_size', POPULATION_SIZE)
+    populacao_ilha = max(parametros_ag.get('elitism_size', 2) + 2, populacao_total // n_ilhas)
+
+    cenario_compartilhado = CenarioCompartilhado(construir_arrays_cenario(vms, servidores))
+    ids_vms = ArrayCompartilhado.de_array(np.array([vm.id for vm in vms], dtype=np.int64))
+
+    # 'spawn', como no motor paralelo: não herda o estado do Tkinter e funciona em qualquer SO.
+    contexto = multiprocessing.get_context('spawn')
+    filas = [contexto.Queue() for _ in range(n_ilhas)]
+    resultados = contexto.Queue()
+    parar = contexto.Event()
+
+    print(f"--- Modelo de Ilhas: {n_ilhas} ilhas de {populacao_ilha} indivíduos, topologia '{topologia}', "
+          f"migração a cada {intervalo_migracao} gerações ({n_migrantes} migrantes) ---")
+    processos = []
+    for ilha in range(n_ilhas):
+        parametros = dict(parametros_ag, population_size=populacao_ilha, crossover=crossovers[ilha % len(crossovers)])
+        processo = contexto.Process(
+            target=_executar_ilha,
+            args=(ilha, n_ilhas, cenario_compartilhado.descritor, ids_vms.descritor, parametros, semente + ilha, prazo,
+                  topologia, intervalo_migracao, n_migrantes, filas, resultados, parar, ilha == 0),
+            name=f"DRE-Ilha-{ilha}",
+        )
+        processo.start()
+        processos.append(processo)
+
+    # Os resultados são lidos antes do join: um processo só termina depois de entregar o seu.
+    ilhas = []
+    while len(ilhas) < n_ilhas:
+        try:
+            ilhas.append(resultados.get(timeout=1.0))
+        except queue.Empty:
+            if not any(processo.is_alive() for processo in processos):
+                print("AVISO: Uma ou mais ilhas terminaram sem resultado.")
+                break
+    for processo in processos:
+        processo.join()
+    cenario_compartilhado.liberar()
+    ids_vms.liberar()
+
+    ilhas.sort(key=lambda resumo: resumo['ilha'])
+    tempo_total = time.time() - inicio
+    if not ilhas:
+        return ResultadoIlhas([], float('inf'), [], tempo_total)
+    melhor = min(ilhas, key=lambda resumo: resumo['melhor_fitness'])
+
+    print("\n--- Resultado das Ilhas ---")
+    for resumo in ilhas:
+        estatisticas = resumo['estatisticas']
+        print(f"Ilha {resumo['ilha']} ({resumo['crossover']}): Fitness {resumo['melhor_fitness']:.4f} | "
+              f"Gerações: {estatisticas['geracoes']} | Parada: {estatisticas['motivo_parada']} | "
+              f"Migrantes enviados/aceitos: {resumo['enviados']}/{resumo['recebidos']}")
+    print(f"Melhor: ilha {melhor['ilha']} com fitness {melhor['melhor_fitness']:.4f} em {tempo_total:.2f}s")
+    return ResultadoIlhas(melhor['melhor_solucao'], melhor['melhor_fitness'], ilhas, tempo_total)
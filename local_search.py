@@ -0,0 +1,139 @@
+# Arquivo [local_search.py]
+
+"""
+Busca local (operador memético) do projeto DRE.
+
+A única forma de o AG reduzir o número de servidores era por trocas aleatórias
+e pela etapa "anticâncer" do D.O.A.C. A busca local abaixo ataca o problema
+diretamente: escolhe o servidor ativo menos carregado e tenta realocar todas as
+suas VMs nos demais servidores ativos. Se todas couberem, o servidor é
+esvaziado e a busca recomeça com o próximo menos carregado.
+
+As cargas são mantidas incrementalmente por um EstadoIndividuo e os destinos
+são encontrados por um IndiceCapacidade montado uma única vez sobre as
+capacidades livres (sem criar objetos ServidorFisico) e atualizado a cada
+evacuação. O trabalho é limitado por um orçamento de
+movimentos e/ou de tempo.
+
+Este módulo define:
+- ResultadoBuscaLocal: O resultado de uma busca local.
+- esvaziar_servidores: O operador de busca local.
+"""
+
+# Importando
+import time
+from typing import List, Optional
+
+from fitness_engine import CenarioArrays, EstadoIndividuo
+from capacity_index import IndiceCapacidade
+from instrumentation import contar
+
+
+
+# ===[ 1. Resultado ]=====================================================================
+
+class ResultadoBuscaLocal:
+    """
+    O resultado de `esvaziar_servidores`.
+    """
+    def __init__(self, individual: List[int], esvaziados: int, movimentos: int, tentativas: int):
+        """
+        Args:
+            individual (List[int]): O cromossomo resultante (uma cópia; o original não é alterado).
+            esvaziados (int): Servidores esvaziados, ou seja, quanto o fitness diminuiu.
+            movimentos (int): VMs movidas.
+            tentativas (int): Servidores cuja evacuação foi tentada.
+        """
+        self.individual = individual
+        self.esvaziados = esvaziados
+        self.movimentos = movimentos
+        self.tentativas = tentativas
+
+    def __repr__(self) -> str:
+        """Retorna uma representação em string do objeto, útil para debug."""
+        return f"ResultadoBuscaLocal(Esvaziados: {self.esvaziados}, Movimentos: {self.movimentos}, Tentativas: {self.tentativas})"
+
+
+# ===[ 2. Busca Local: Esvaziamento de Servidores ]=======================================
+
+def esvaziar_servidores(individual: List[int], cenario: CenarioArrays, max_movimentos: Optional[int] = 1000, tempo_limite: Optional[float] = None) -> ResultadoBuscaLocal:
+    """
+    Tenta esvaziar, um a um, os servidores ativos menos carregados, realocando
+    suas VMs (maiores primeiro) no servidor ativo com mais RAM livre que as comporte.
+    Uma evacuação só é aplicada se todas as VMs do servidor couberem, então o
+    fitness nunca piora e a solução continua viável.
+
+    Args:
+        individual (List[int]): Cromossomo viável (com IDs válidos). Não é alterado.
+        cenario (CenarioArrays): O cenário em arrays.
+        max_movimentos (Optional[int]): Máximo de VMs movidas. None = sem limite.
+        tempo_limite (Optional[float]): Tempo máximo, em segundos. None = sem limite.
+    """
+    novo = list(individual)
+    try:
+        estado = EstadoIndividuo(novo, cenario)
+    except ValueError:
+        return ResultadoBuscaLocal(list(individual), 0, 0, 0)
+    if estado.sobrecarregados:
+        # A busca só preserva a viabilidade; um indivíduo inviável não é tocado.
+        return ResultadoBuscaLocal(novo, 0, 0, 0)
+
+    prazo = time.perf_counter() + tempo_limite if tempo_limite is not None else None
+    vms_no_servidor = {}
+    for vm_idx, s_id in enumerate(novo):
+        vms_no_servidor.setdefault(s_id, []).append(vm_idx)
+
+    def carga(s_id: int):
+        # Menos VMs primeiro; no empate, a menor fração de CPU/RAM ocupada.
+        return (estado.vms_por_servidor[s_id],
+                max(estado.cpu_usada[s_id] / estado.cpu_total[s_id] if estado.cpu_total[s_id] else 1.0,
+                    estado.ram_usada[s_id] / estado.ram_total[s_id] if estado.ram_total[s_id] else 1.0))
+
+    # Esvaziar um servidor só enche os demais, então um servidor que não pôde
+    # ser esvaziado também não poderá depois: cada servidor é tentado uma vez.
+    # Ordem decrescente: pop() retira o menos carregado.
+    candidatos = sorted(vms_no_servidor, key=carga, reverse=True)
+
+    # Índice sobre as capacidades livres dos servidores ativos, montado uma vez e
+    # mantido com ajustar()/remover() a cada evacuação (o alvo é excluído da busca).
+    ativos = list(vms_no_servidor)
+    indice = IndiceCapacidade.de_capacidades(
+        ativos,
+        [estado.cpu_total[s] - estado.cpu_usada[s] for s in ativos],
+        [estado.ram_total[s] - estado.ram_usada[s] for s in ativos],
+    )
+    esvaziados = movimentos = tentativas = 0
+
+    while len(candidatos) > 0 and estado.servidores_usados > 1:
+        if prazo is not None and time.perf_counter() >= prazo:
+            break
+        alvo = candidatos.pop()
+        vms_alvo = vms_no_servidor[alvo]
+        if max_movimentos is not None and movimentos + len(vms_alvo) > max_movimentos:
+            break
+        tentativas += 1
+
+        # O plano reserva a capacidade no índice; se alguma VM não couber, a reserva é desfeita.
+        plano = []
+        for vm_idx in sorted(vms_alvo, key=lambda v: (estado.ram_req[v], estado.cpu_req[v]), reverse=True):
+            destino = indice.encontrar_id(estado.cpu_req[vm_idx], estado.ram_req[vm_idx], excluir=alvo)
+            if destino is None:
+                break
+            indice.ajustar(destino, -estado.cpu_req[vm_idx], -estado.ram_req[vm_idx])
+            plano.append((vm_idx, destino))
+
+        if len(plano) < len(vms_alvo):
+            for vm_idx, destino in plano:
+                indice.ajustar(destino, estado.cpu_req[vm_idx], estado.ram_req[vm_idx])
+            continue
+
+        indice.remover(alvo)
+        for vm_idx, destino in plano:
+            estado.aplicar_move(vm_idx, destino)
+            vms_no_servidor[destino].append(vm_idx)
+        vms_no_servidor[alvo] = []
+        movimentos += len(plano)
+        esvaziados += 1
+
+    contar('servidores_esvaziados', esvaziados)
+    return ResultadoBuscaLocal(novo, esvaziados, movimentos, tentativas)
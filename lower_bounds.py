@@ -0,0 +1,141 @@
+# Arquivo [lower_bounds.py]
+
+"""
+Limites inferiores (admissíveis) para o número de servidores do projeto DRE.
+
+Nenhuma alocação viável usa menos servidores que qualquer um dos limites
+abaixo, então, quando o melhor fitness do AG alcança o maior deles, a
+solução é ótima e a execução pode parar. A distância até o limite
+("gap de otimalidade") também indica o quanto ainda pode ser ganho.
+
+Limites calculados, para CPU e RAM separadamente:
+- Contínuo heterogêneo: o menor k tal que os k servidores de maior
+  capacidade (os modelos do HARDWARE_MAP podem ser diferentes) somam a
+  demanda total. Considera as capacidades reais de cada servidor.
+- Itens grandes: o maior conjunto de VMs que, duas a duas, não cabem juntas
+  nem no maior servidor; cada uma exige um servidor próprio.
+- Martello-Toth (L2): combina itens grandes e o volume dos itens médios,
+  usando a capacidade do maior servidor (admissível para servidores
+  heterogêneos, pois nenhum servidor comporta mais que o maior).
+
+Este módulo define:
+- LimiteInferior: Os limites calculados e o melhor deles.
+- calcular_limite_inferior: Calcula os limites a partir do CenarioArrays.
+"""
+
+# Importando
+import numpy as np
+from typing import Dict
+
+from fitness_engine import CenarioArrays
+
+
+
+# ===[ 1. Limites por Dimensão ]=========================================================
+
+def _limite_continuo(demanda: np.ndarray, capacidades: np.ndarray) -> int:
+    """Menor k tal que as k maiores capacidades somam a demanda total."""
+    total = int(demanda.sum())
+    if total <= 0:
+        return 0
+    acumulado = np.cumsum(np.sort(capacidades)[::-1])
+    k = int(np.searchsorted(acumulado, total, side='left')) + 1
+    # Se nem todos os servidores juntos comportam a demanda, não há solução com os servidores existentes.
+    return min(k, len(capacidades) + 1)
+
+
+def _limite_itens_grandes(demanda: np.ndarray, capacidade_max: int) -> int:
+    """
+    Tamanho do maior prefixo (itens em ordem decrescente) em que as duas
+    menores VMs já não cabem juntas: todas as VMs do prefixo são incompatíveis
+    duas a duas.
+    """
+    if demanda.size == 0:
+        return 0
+    itens = np.sort(demanda)[::-1]
+    if itens[0] <= 0:
+        return 0
+    # pares[m] = itens[m] + itens[m + 1]; o prefixo de tamanho m + 2 é incompatível se pares[m] > capacidade.
+    pares = itens[:-1] + itens[1:]
+    incompativeis = np.flatnonzero(pares <= capacidade_max)
+    return int(incompativeis[0]) + 1 if incompativeis.size else int(itens.size)
+
+
+def _limite_martello_toth(demanda: np.ndarray, capacidade: int) -> int:
+    """
+    Limite L2 de Martello e Toth para bin packing com capacidade `capacidade`,
+    avaliado para todo parâmetro alfa (os tamanhos distintos até C/2) de uma só vez.
+    """
+    itens = np.sort(demanda[demanda > 0])
+    if itens.size == 0 or capacidade <= 0:
+        return 0
+    acumulado = np.concatenate(([0], np.cumsum(itens)))
+
+    def soma_ate(limite, lado):
+        idx = np.searchsorted(itens, limite, side=lado)
+        return idx, acumulado[idx]
+
+    # Alfas candidatos: 0 e os tamanhos distintos que não passam de C/2.
+    alfas = np.unique(np.concatenate(([0], itens[2 * itens <= capacidade])))
+
+    n = itens.size
+    idx_meio, soma_meio = soma_ate(capacidade // 2, 'right')      # itens <= C/2
+    idx_alto, soma_alto = soma_ate(capacidade - alfas, 'right')   # itens <= C - alfa
+    idx_alfa, soma_alfa = soma_ate(alfas, 'left')                 # itens < alfa
+
+    j1 = n - idx_alto                                   # itens > C - alfa
+    j2 = idx_alto - idx_meio                            # C/2 < itens <= C - alfa
+    soma_j2 = soma_alto - soma_meio
+    soma_j3 = soma_meio - soma_alfa                     # alfa <= itens <= C/2
+    sobra_j2 = j2 * capacidade - soma_j2
+    extra = np.maximum(0, -(-(soma_j3 - sobra_j2) // capacidade))
+    return int((j1 + j2 + extra).max())
+
+
+# ===[ 2. Limite Inferior do Cenário ]===================================================
+
+class LimiteInferior:
+    """
+    Os limites inferiores do número de servidores e o melhor (maior) deles.
+    """
+    def __init__(self, limites: Dict[str, int]):
+        """
+        Args:
+            limites (Dict[str, int]): Nome do limite -> valor.
+        """
+        self.limites = limites
+        self.valor = max(limites.values()) if limites else 0
+
+    def gap(self, fitness: float) -> float:
+        """Gap de otimalidade relativo: (fitness - limite) / fitness. 0.0 = ótimo comprovado."""
+        if not np.isfinite(fitness):
+            return float('inf')
+        if fitness <= 0:
+            return 0.0
+        return max(0.0, (fitness - self.valor) / fitness)
+
+    def otimo(self, fitness: float) -> bool:
+        """Verifica se o fitness já alcançou o limite (solução comprovadamente ótima)."""
+        return np.isfinite(fitness) and fitness <= self.valor
+
+    def __repr__(self) -> str:
+        """Retorna uma representação em string do objeto, útil para debug."""
+        return f"LimiteInferior(Valor: {self.valor}, Limites: {self.limites})"
+
+
+def calcular_limite_inferior(cenario: CenarioArrays) -> LimiteInferior:
+    """
+    Calcula os limites inferiores admissíveis do número de servidores do cenário.
+    """
+    if cenario.num_vms == 0 or cenario.num_servidores == 0:
+        return LimiteInferior({})
+    cpu_max = int(cenario.cpu_total.max())
+    ram_max = int(cenario.ram_total.max())
+    return LimiteInferior({
+        'continuo_cpu': _limite_continuo(cenario.cpu_req, cenario.cpu_total),
+        'continuo_ram': _limite_continuo(cenario.ram_req, cenario.ram_total),
+        'itens_grandes_cpu': _limite_itens_grandes(cenario.cpu_req, cpu_max),
+        'itens_grandes_ram': _limite_itens_grandes(cenario.ram_req, ram_max),
+        'martello_toth_cpu': _limite_martello_toth(cenario.cpu_req, cpu_max),
+        'martello_toth_ram': _limite_martello_toth(cenario.ram_req, ram_max),
+    })
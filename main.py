@@ -4,19 +4,12 @@
 Arquivo Principal do D.R.E.
 '''
 
+import random
+import threading
 import tkinter as tk
-from datacenter_model import carregar_cenario_vmware, carregar_cenario
-from genetic_algorithm import (
-    generate_round_robin_population,
-    swap_mutation,
-    ffd_crossover,
-    crossover_por_consenso,
-    doac_cross,
-    calculate_fitness,
-    select_parents
-)
-from visualization import DatacenterVisualizer
-from relatorio import relatorio_json, relatorio_logico_json, gerar_relatorio_excel
+from ga_runner import GeneticAlgorithmRunner, carregar_datacenter
+from parallel_engine import ParallelGenerationEngine
+from visualization import DatacenterVisualizer, ThrottledRenderer, MAX_FPS
 
 #===[ Constantes Globais ]================================================================
 CENARIO_ATIVO = 'vmware' # NOTE: Troque para 'no_vmware' para executar com um cenário fictício.
@@ -29,109 +22,93 @@ N_GENERATIONS = 1000
 MAX_GENS_NO_IMPROVEMENT = 200
 MUTATION_PROBABILITY = 0.2
 ELITISM_SIZE = 2
+FITNESS_CACHE_SIZE = 50000
+FITNESS_SECUNDARIO = None # NOTE: Desempate do fitness: None, 'concentracao' ou 'menor_servidor'.
+INITIAL_POPULATION_MIX = None # NOTE: Heurísticas da população inicial, ex.: {'round_robin': 1}. None = mistura padrão.
+TIME_LIMIT = None # NOTE: Prazo (segundos) da execução. None = sem prazo.
+LOCAL_SEARCH_ELITES = 0 # NOTE: Melhores soluções que passam pela busca local a cada geração (0 = desativada; ex.: 1).
+# NOTE: Crossover: 'doac' (D.O.A.C.), 'cpc' (Por Consenso) ou 'ffd' (First Fit Decreasing).
+CROSSOVER = 'doac'
 
-#===[ Classe para Orquestrar o Algoritmo Genético ]=======================================
-class GeneticAlgorithmRunner:
-    """
-    Esta classe encapsula toda a lógica e o estado da simulação do AG.
-    """
-    def __init__(self, root, app, vms, servidores):
-        self.root = root # Referência a janela principal da aplicação Tkinter. (Tempo)
-        self.app = app # Referência ao objeto da interface gráfica. (Conteúdo)
-        self.vms = vms
-        self.servidores = servidores
+# NOTE: Motor de execução: 'serial' (um núcleo) ou 'paralelo' (ProcessPoolExecutor).
+ENGINE = 'serial'
+N_WORKERS = None # None = todos os núcleos disponíveis.
+RANDOM_SEED = None # Defina um inteiro para execuções reprodutíveis.
 
-        # Inicializa o estado do AG
-        # NOTE: Gerando a população inicial:
-        self.population = generate_round_robin_population(self.vms, self.servidores, POPULATION_SIZE)
-        self.generation_count = 0
-        self.last_best_fitness = float('inf')
-        self.generations_without_improvement = 0
-        self.best_solution_final = self.population[0]
-        self.best_fitness_history = []
+# NOTE: Para rodar sem interface gráfica (servidores sem display), use:
+#       python -m dre run --headless
 
-    def start(self):
-        """Inicia o loop da simulação."""
-        print("--- Iniciando Simulação do Algoritmo Genético ---")
-        self._run_generation()
+#===[ Execução com Interface Gráfica ]====================================================
+def _executar_ag(runner: GeneticAlgorithmRunner, renderer: ThrottledRenderer):
+    """Roda o AG inteiro fora da thread da interface, em velocidade máxima."""
+    try:
+        runner.executar()
+    finally:
+        renderer.encerrar()
 
-    def _run_generation(self):
-        """Executa uma única geração do AG e agenda a próxima."""
-        if self.generation_count < N_GENERATIONS and self.generations_without_improvement < MAX_GENS_NO_IMPROVEMENT:
-            # NOTE: Calculando o fitness:
-            population_fitness = [calculate_fitness(individual, self.vms, self.servidores) for individual in self.population]
-            sorted_pairs = sorted(zip(population_fitness, self.population), key=lambda pair: pair[0])
-            sorted_population = [pair[1] for pair in sorted_pairs]
-            
-            best_solution_this_gen = sorted_population[0]
-            best_fitness_this_gen = sorted_pairs[0][0]
-            self.best_fitness_history.append(best_fitness_this_gen)
-            
-            if self.generation_count % 10 == 0:
-                print(f"Geração {self.generation_count}: Melhor Fitness = {best_fitness_this_gen:.0f}")
+def executar_gui(vms, servidores, engine_mode: str = ENGINE, n_workers=N_WORKERS, max_fps: float = MAX_FPS, **parametros_ag):
+    """
+    Cria a janela, o visualizador e o runner, e inicia o loop do Tkinter.
+    O AG roda em uma thread separada e publica cada geração no ThrottledRenderer,
+    que desenha no máximo `max_fps` quadros por segundo, descartando os atrasados.
+    `parametros_ag` são repassados ao GeneticAlgorithmRunner.
+    Retorna False (sem abrir a janela) se o motor não puder ser criado.
+    """
+    engine = None
+    if engine_mode == 'paralelo':
+        try:
+            engine = ParallelGenerationEngine(vms, servidores, n_workers, parametros_ag.get('crossover', CROSSOVER), parametros_ag.get('fitness_cache_size', FITNESS_CACHE_SIZE), parametros_ag.get('fitness_secundario', FITNESS_SECUNDARIO))
+        except ValueError as e:
+            print(f"ERRO: {e}")
+            return False
+    root = tk.Tk()
+    app = DatacenterVisualizer(root, servidores, vms)
+    renderer = ThrottledRenderer(root, app, max_fps)
+    runner = GeneticAlgorithmRunner(vms, servidores, engine=engine, on_generation=renderer.publicar, **parametros_ag)
+    app.limite_inferior = runner.limite_inferior.valor
 
-            if best_fitness_this_gen < self.last_best_fitness:
-                self.last_best_fitness = best_fitness_this_gen
-                self.best_solution_final = best_solution_this_gen
-                self.generations_without_improvement = 0
-            else:
-                self.generations_without_improvement += 1
+    def _ao_fechar():
+        # Pede ao AG para parar; a thread termina a geração atual e gera os relatórios.
+        runner.parar()
+        root.destroy()
+    root.protocol("WM_DELETE_WINDOW", _ao_fechar)
 
-            self.app.update_view(best_solution_this_gen, self.generation_count, best_fitness_this_gen, self.best_fitness_history)
+    thread_ag = threading.Thread(target=_executar_ag, args=(runner, renderer), name="DRE-AG", daemon=True)
+    renderer.iniciar()
+    thread_ag.start()
+    root.mainloop()
+    thread_ag.join()
+    return True
 
-            # NOTE: Elitismo:
-            new_population = sorted_population[:ELITISM_SIZE]
-            while len(new_population) < POPULATION_SIZE:
-                parent1, parent2 = select_parents(sorted_population)
-                # NOTE: Crossover por consendo: 
-                # child1, child2 = crossover_por_consenso(parent1, parent2, self.vms, self.servidores)
-                # HACK: Crossover DOAC (Dominant Optimal Anti-Cancer - Anticâncer Ótimo Dominante):
-                child1, child2 = doac_cross(parent1, parent2, self.vms, self.servidores)
-                # NOTE: Mutação:
-                child1 = swap_mutation(child1, self.vms, self.servidores, MUTATION_PROBABILITY)
-                child2 = swap_mutation(child2, self.vms, self.servidores, MUTATION_PROBABILITY)
-                new_population.append(child1)
-                if len(new_population) < POPULATION_SIZE:
-                    new_population.append(child2)
-            
-            self.population = new_population
-            self.generation_count += 1
-            
-            self.root.after(1, self._run_generation)
-        else:
-            print("\n--- Simulação Finalizada ---")
-            print(f"Melhor solução final encontrada com fitness de: {self.last_best_fitness:.0f}")
-            relatorio_json(self.best_solution_final, self.vms, self.servidores, "solucao_final_detalhada.json")
-            relatorio_logico_json(self.best_solution_final, "solucao_final_logica.json")
-            gerar_relatorio_excel(self.best_solution_final, self.servidores, self.vms)
-            
 #===[ Função Principal ]=================================================================
 def main():
     """
     Função principal que inicializa os componentes e inicia a aplicação.
     """
-    print("--- Carregando Cenário ---")
-    if CENARIO_ATIVO == 'vmware':
-        datacenter_info = carregar_cenario_vmware(ARQUIVO_SERVIDORES_VMWARE, ARQUIVO_VMS_VMWARE)
-    else:
-        datacenter_info = carregar_cenario(CENARIO_FILE)
+    if RANDOM_SEED is not None:
+        random.seed(RANDOM_SEED)
 
-    if not datacenter_info or not datacenter_info.get('servidores'):
-        print("Falha ao carregar o cenário. Encerrando o programa.")
+    cenario = carregar_datacenter(CENARIO_ATIVO, CENARIO_FILE, ARQUIVO_SERVIDORES_VMWARE, ARQUIVO_VMS_VMWARE)
+    if cenario is None:
         return
-        
-    vms = datacenter_info['vms']
-    servidores = datacenter_info['servidores']
-    servidores.sort(key=lambda s: s.id)
-    vms.sort(key=lambda vm: vm.id)
-    print("--- Cenário Carregado com Sucesso ---\n")
+    vms, servidores = cenario
 
-    root = tk.Tk()
-    app = DatacenterVisualizer(root, servidores, vms)
-    runner = GeneticAlgorithmRunner(root, app, vms, servidores)
-
-    runner.start()
-    root.mainloop()
+    executar_gui(
+        vms, servidores,
+        engine_mode=ENGINE,
+        n_workers=N_WORKERS,
+        population_size=POPULATION_SIZE,
+        n_generations=N_GENERATIONS,
+        max_gens_no_improvement=MAX_GENS_NO_IMPROVEMENT,
+        mutation_probability=MUTATION_PROBABILITY,
+        elitism_size=ELITISM_SIZE,
+        crossover=CROSSOVER,
+        fitness_cache_size=FITNESS_CACHE_SIZE,
+        fitness_secundario=FITNESS_SECUNDARIO,
+        initial_population_mix=INITIAL_POPULATION_MIX,
+        local_search_elites=LOCAL_SEARCH_ELITES,
+        time_limit=TIME_LIMIT,
+    )
 
 # --- Ponto de Entrada do Programa ---
 if __name__ == '__main__':
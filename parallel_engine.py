@@ -0,0 +1,234 @@
+# Arquivo [parallel_engine.py]
+
+"""
+Motor paralelo de gerações para o Algoritmo Genético do projeto DRE.
+
+Os operadores de crossover e mutação alteram o estado da lista `servidores`
+("Lousa Limpa"), então não podem rodar em threads sobre os mesmos objetos.
+Aqui cada processo do pool monta, uma única vez, os seus próprios objetos
+(VMs e servidores) e passa a produzir filhos de forma independente.
+
+Memória compartilhada (ver shared_buffers): os arrays do cenário, a matriz
+da população e os filhos ficam em blocos de `multiprocessing.shared_memory`.
+As tarefas levam apenas descritores e índices de linhas: os workers leem os
+pais e escrevem os filhos direto nos buffers, sem serializar cromossomos.
+
+Reprodutibilidade: o processo principal faz a seleção dos pais e sorteia uma
+semente para cada par. O worker re-semeia o `random` antes de cada par, então
+o resultado depende apenas da semente do runner, e não do número de workers
+nem da ordem em que as tarefas são executadas.
+"""
+
+# Importando
+import os
+import random
+import multiprocessing
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from datacenter_model import MaquinaVirtual, ServidorFisico
+from fitness_engine import construir_arrays_cenario, calculate_population_fitness, FitnessCache
+from genetic_algorithm import doac_cross, crossover_por_consenso, swap_mutation
+from instrumentation import contar, coletar_contadores, somar_contadores
+from shared_buffers import ArrayCompartilhado, CenarioCompartilhado, anexar_cenario
+
+
+
+# ===[ 1. Estado de Cada Worker ]========================================================
+
+# Cenário do processo (anexado à memória compartilhada), criado uma vez no initializer.
+_worker_estado = {}
+
+CROSSOVERS_PARALELOS = ('doac', 'cpc')
+
+
+def _inicializar_worker(descritor_cenario: Tuple, descritor_ids: Tuple, cache_size: int, secundario: Optional[str] = None):
+    """
+    Anexa o worker ao cenário em memória compartilhada. Os objetos VM/servidor,
+    usados pelos operadores de crossover, são montados a partir dos arrays.
+    """
+    cenario, blocos = anexar_cenario(descritor_cenario)
+    ids_vms = ArrayCompartilhado.anexar(descritor_ids)
+    vms = [MaquinaVirtual(vm_id, cpu, ram) for vm_id, cpu, ram in zip(ids_vms.array.tolist(), cenario.cpu_req.tolist(), cenario.ram_req.tolist())]
+    servidores = [ServidorFisico(s_id, cpu, ram) for s_id, (cpu, ram) in enumerate(zip(cenario.cpu_total.tolist(), cenario.ram_total.tolist()))]
+    _worker_estado['blocos'] = blocos + (ids_vms,)
+    _worker_estado['vms'] = vms
+    _worker_estado['servidores'] = servidores
+    _worker_estado['cenario'] = cenario
+    _worker_estado['secundario'] = secundario
+    _worker_estado['cache'] = FitnessCache(cenario, cache_size, secundario)
+    _worker_estado['anexos'] = {}
+
+
+def _anexo(descritor: Tuple, vivos: Sequence[str]) -> np.ndarray:
+    """
+    O array de um buffer do motor, anexado uma única vez por worker. Os anexos
+    de buffers que o motor já descartou (fora de `vivos`) são fechados.
+    """
+    anexos = _worker_estado['anexos']
+    for nome in [nome for nome in anexos if nome not in vivos]:
+        anexos.pop(nome).fechar()
+    if descritor[0] not in anexos:
+        anexos[descritor[0]] = ArrayCompartilhado.anexar(descritor)
+    return anexos[descritor[0]].array
+
+
+def _avaliar_bloco(tarefa: Tuple) -> np.ndarray:
+    """Avalia as linhas [inicio, fim) do buffer da população dentro do worker."""
+    vivos, descritor, inicio, fim = tarefa
+    bloco = _anexo(descritor, vivos)[inicio:fim]
+    return calculate_population_fitness(bloco, _worker_estado['cenario'], _worker_estado['secundario']).fitness
+
+
+def _produzir_filhos(tarefa: Tuple) -> Dict[str, int]:
+    """
+    Executa crossover + mutação para uma lista de pares de pais.
+    Os pais são linhas do buffer da população (por índice) e os dois filhos de
+    cada par são escritos nas suas posições do buffer de filhos. Cada par
+    carrega a sua própria semente. Retorna os contadores de instrumentação
+    (reparos etc.) do worker.
+    """
+    vivos, descritor_pais, descritor_filhos, pares, crossover, mutation_probability = tarefa
+    populacao = _anexo(descritor_pais, vivos)
+    filhos = _anexo(descritor_filhos, vivos)
+    vms = _worker_estado['vms']
+    servidores = _worker_estado['servidores']
+    cache = _worker_estado['cache']
+    acertos, faltas = cache.hits, cache.misses
+
+    for semente, i, j, posicao in pares:
+        random.seed(semente)
+        # Os operadores percorrem os genes um a um, mais rápido em listas.
+        parent1, parent2 = populacao[i].tolist(), populacao[j].tolist()
+        if crossover == 'cpc':
+            child1, child2 = crossover_por_consenso(parent1, parent2, vms, servidores)
+        else:
+            child1, child2 = doac_cross(parent1, parent2, vms, servidores, cache)
+        filhos[posicao] = swap_mutation(child1, vms, servidores, mutation_probability)
+        filhos[posicao + 1] = swap_mutation(child2, vms, servidores, mutation_probability)
+    contar('acertos_cache', cache.hits - acertos)
+    contar('avaliacoes', cache.misses - faltas)
+    return coletar_contadores()
+
+
+# ===[ 2. Motor Paralelo ]================================================================
+
+class ParallelGenerationEngine:
+    """
+    Distribui a avaliação de fitness e a produção de filhos em um
+    ProcessPoolExecutor. Deve ser encerrado com `encerrar()` ao fim da simulação.
+    """
+    def __init__(self, vms: List[MaquinaVirtual], servidores: List[ServidorFisico], n_workers: Optional[int] = None, crossover: str = 'doac', cache_size: int = 50000, secundario: Optional[str] = None):
+        """
+        Args:
+            vms (List[MaquinaVirtual]): VMs do cenário.
+            servidores (List[ServidorFisico]): Servidores do cenário.
+            n_workers (Optional[int]): Número de processos. Padrão: todos os núcleos.
+            crossover (str): 'doac' (D.O.A.C.) ou 'cpc' (Crossover por Consenso).
+            cache_size (int): Tamanho do cache de fitness local de cada worker.
+            secundario (Optional[str]): Critério secundário do fitness composto
+                (ver fitness_engine.SECUNDARIOS). Deve ser o mesmo do runner.
+        """
+        if crossover not in CROSSOVERS_PARALELOS:
+            raise ValueError(f"Crossover '{crossover}' não suportado no modo paralelo. Use um de {CROSSOVERS_PARALELOS}.")
+        self.crossover = crossover
+        self.n_workers = n_workers or os.cpu_count() or 1
+
+        # O cenário vai uma única vez para a memória compartilhada; os workers recebem só os descritores.
+        self._cenario = CenarioCompartilhado(construir_arrays_cenario(vms, servidores))
+        self._ids_vms = ArrayCompartilhado.de_array(np.array([vm.id for vm in vms], dtype=np.int64))
+        # Buffers da população (pais / avaliação) e dos filhos, recriados apenas quando precisam crescer.
+        self._buffers: Dict[str, ArrayCompartilhado] = {}
+
+        # 'spawn' evita herdar o estado do Tkinter e funciona igual em Linux, Mac e Windows.
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.n_workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_inicializar_worker,
+            initargs=(self._cenario.descritor, self._ids_vms.descritor, cache_size, secundario),
+        )
+
+    def _buffer(self, nome: str, linhas: int, num_vms: int, dtype) -> ArrayCompartilhado:
+        """O buffer `nome` com ao menos `linhas` linhas do tipo pedido (recriado se necessário)."""
+        atual = self._buffers.get(nome)
+        if atual is None or atual.array.shape[0] < linhas or atual.array.shape[1] != num_vms or atual.array.dtype != np.dtype(dtype):
+            if atual is not None:
+                atual.liberar()
+            atual = self._buffers[nome] = ArrayCompartilhado.criar((max(linhas, 1), num_vms), dtype)
+        return atual
+
+    def _vivos(self) -> Tuple[str, ...]:
+        """Os nomes dos buffers atuais (os workers fecham os anexos dos demais)."""
+        return tuple(buffer.memoria.name for buffer in self._buffers.values())
+
+    def avaliar_fitness(self, population: np.ndarray) -> np.ndarray:
+        """
+        Avalia a matriz da população: as linhas são copiadas para o buffer
+        compartilhado e cada worker avalia um intervalo de linhas.
+        """
+        genes = np.asarray(population)
+        if len(genes) == 0:
+            return np.empty(0, dtype=np.float64)
+        buffer = self._buffer('populacao', len(genes), genes.shape[1], genes.dtype)
+        buffer.array[:len(genes)] = genes
+        limites = np.linspace(0, len(genes), min(self.n_workers, len(genes)) + 1).astype(int)
+        tarefas = [(self._vivos(), buffer.descritor, int(inicio), int(fim)) for inicio, fim in zip(limites[:-1], limites[1:])]
+        return np.concatenate(list(self._executor.map(_avaliar_bloco, tarefas)))
+
+    def produzir_filhos(self, populacao: np.ndarray, pares: List[Tuple[int, int]], mutation_probability: float, rng: Optional[random.Random] = None) -> np.ndarray:
+        """
+        Produz dois filhos (crossover + mutação) para cada par de pais.
+        Os filhos são retornados na mesma ordem dos pares.
+
+        Args:
+            populacao (np.ndarray): Matriz da população (P x V).
+            pares: Lista de pares (i, j) de índices de linhas de `populacao`.
+            mutation_probability (float): Probabilidade da swap_mutation.
+            rng (Optional[random.Random]): Gerador usado para sortear as sementes
+                dos pares. Padrão: o módulo `random` global.
+
+        Returns:
+            np.ndarray: Matriz (2 * len(pares) x V) dos filhos. É uma view do buffer
+            compartilhado, sobrescrita na próxima chamada: copie-a antes disso.
+        """
+        rng = rng or random
+        genes = np.asarray(populacao)
+        pais = self._buffer('populacao', len(genes), genes.shape[1], genes.dtype)
+        pais.array[:len(genes)] = genes
+        filhos = self._buffer('filhos', 2 * len(pares), genes.shape[1], genes.dtype)
+        pares_com_semente = [(rng.getrandbits(32), int(i), int(j), 2 * k) for k, (i, j) in enumerate(pares)]
+
+        # Divide os pares em blocos contíguos, um pouco mais blocos que workers
+        # para equilibrar a carga.
+        n_blocos = max(1, min(len(pares_com_semente), self.n_workers * 4))
+        tamanho = -(-len(pares_com_semente) // n_blocos)
+        tarefas = [
+            (self._vivos(), pais.descritor, filhos.descritor, pares_com_semente[i:i + tamanho], self.crossover, mutation_probability)
+            for i in range(0, len(pares_com_semente), tamanho)
+        ]
+
+        for contadores in self._executor.map(_produzir_filhos, tarefas):
+            somar_contadores(contadores)
+        return filhos.array[:2 * len(pares)]
+
+    def encerrar(self):
+        """Encerra os processos do pool e remove os blocos de memória compartilhada."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        for buffer in self._buffers.values():
+            buffer.liberar()
+        self._buffers.clear()
+        if self._cenario is not None:
+            self._cenario.liberar()
+            self._ids_vms.liberar()
+            self._cenario = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.encerrar()
+
+    def __repr__(self) -> str:
+        """Retorna uma representação em string do objeto, útil para debug."""
+        return f"ParallelGenerationEngine(Workers: {self.n_workers}, Crossover: {self.crossover})"
@@ -0,0 +1,467 @@
+# Arquivo [population_init.py]
+
+"""
+Geradores da população inicial do projeto DRE.
+
+`generate_round_robin_population` calcula uma única alocação e a copia para
+toda a população: as primeiras gerações avaliam indivíduos idênticos e
+esperam a mutação criar alguma diversidade. Este módulo gera a população com
+uma mistura de heurísticas construtivas aleatorizadas, remove os indivíduos
+repetidos e deixa a mistura ser escolhida a cada execução.
+
+As heurísticas trabalham sobre o CenarioArrays (sem tocar nos objetos
+ServidorFisico) e constroem todos os indivíduos em bloco: a cada passo, uma
+VM de cada indivíduo é alocada de uma só vez, com as capacidades livres de
+toda a população em uma matriz (indivíduos x servidores) dividida em blocos
+de servidores, para que cada passo só percorra um bloco por indivíduo.
+
+Heurísticas disponíveis (chaves de INICIALIZADORES):
+- 'round_robin': A alocação Round-Robin original (um único indivíduo).
+- 'first_fit_aleatorio': VMs e servidores em ordem aleatória, First Fit.
+- 'best_fit_decrescente': VMs por tamanho decrescente (empates sorteados), Best Fit
+  (menor sobra normalizada de CPU + RAM, empates sorteados).
+- 'ffd': O mesmo First Fit Decreasing do `ffd_crossover`; o primeiro indivíduo usa a
+  ordem original dos servidores e os demais uma ordem sorteada. O FFD é refeito aqui
+  sobre o decodificador em bloco (o `ffd_crossover` aloca nos objetos, uma VM por vez);
+  os testes conferem que o primeiro indivíduo é idêntico ao do `ffd_crossover`.
+- 'chaves_aleatorias': Decodificação de chaves aleatórias: cada VM recebe a chave
+  "tamanho normalizado + U(0, 1)" e as VMs são alocadas por chave decrescente, First Fit.
+
+Este módulo define:
+- INICIALIZADORES: Os nomes das heurísticas.
+- MISTURA_PADRAO: A mistura usada quando nenhuma é informada.
+- gerar_populacao_inicial: Gera a população inicial com uma mistura de heurísticas.
+"""
+
+# Importando
+import time
+import numpy as np
+from typing import Dict, List, Optional
+
+from datacenter_model import MaquinaVirtual, ServidorFisico
+from fitness_engine import CenarioArrays, construir_arrays_cenario, chave_cromossomo
+from genetic_algorithm import generate_round_robin_population
+
+
+
+# ===[ 1. Decodificador em Bloco ]=======================================================
+
+INICIALIZADORES = ('round_robin', 'first_fit_aleatorio', 'best_fit_decrescente', 'ffd', 'chaves_aleatorias')
+
+# Proporção de cada heurística na população inicial.
+MISTURA_PADRAO = {'ffd': 0.1, 'best_fit_decrescente': 0.3, 'first_fit_aleatorio': 0.3, 'chaves_aleatorias': 0.3}
+
+
+# Intervalo (em VMs alocadas) entre as verificações do prazo no decodificador.
+_PASSOS_ENTRE_PRAZOS = 256
+
+
+def _prazo_esgotado(prazo: Optional[float]) -> bool:
+    return prazo is not None and time.perf_counter() >= prazo
+
+
+def _tamanho_bloco(num_servidores: int) -> int:
+    """Servidores por bloco: ~raiz(S), o que equilibra a varredura dos blocos e a de dentro de um bloco."""
+    return max(8, int(np.ceil(np.sqrt(num_servidores))))
+
+
+def _primeiro_que_cabe(inicio: np.ndarray, cpu: np.ndarray, ram: np.ndarray, candidatos: np.ndarray,
+                       cpu_livre: np.ndarray, ram_livre: np.ndarray):
+    """
+    First Fit por blocos: para cada linha, o primeiro bloco candidato e a primeira
+    vaga dele que comporta (cpu, ram).
+
+    `cpu_livre`/`ram_livre` têm um bloco por linha (blocos x vagas) e `inicio` dá o
+    índice do primeiro bloco de cada linha. `candidatos` (linhas x blocos) marca os
+    blocos cujo máximo de CPU e de RAM livres comporta a VM. Como os máximos podem vir
+    de servidores diferentes, o primeiro bloco candidato pode não ter nenhum servidor
+    que comporte as duas: ele é descartado (no próprio `candidatos`) e a busca segue
+    no próximo. Retorna (bloco, vaga), com -1 onde nada cabe.
+    """
+    bloco = candidatos.argmax(axis=1)
+    linha = inicio + bloco
+    cabe = (cpu_livre.take(linha, axis=0) >= cpu[:, None]) & (ram_livre.take(linha, axis=0) >= ram[:, None])
+    vaga = cabe.argmax(axis=1)
+    achou = cabe.any(axis=1)
+    if achou.all():
+        return bloco, vaga
+
+    # Caso raro: refaz a busca só nas linhas em que o bloco escolhido não serviu.
+    falhas = np.flatnonzero(~achou)
+    falho = bloco[falhas]
+    bloco[falhas] = vaga[falhas] = -1
+    while falhas.size:
+        # Linhas cujo bloco falho nem era candidato não têm mais candidatos.
+        tinha = candidatos[falhas, falho]
+        candidatos[falhas, falho] = False
+        falhas = falhas[tinha]
+        if not falhas.size:
+            break
+        b = candidatos[falhas].argmax(axis=1)
+        linha = inicio[falhas] + b
+        cabe = (cpu_livre.take(linha, axis=0) >= cpu[falhas, None]) & (ram_livre.take(linha, axis=0) >= ram[falhas, None])
+        j = cabe.argmax(axis=1)
+        ok = cabe.any(axis=1)
+        bloco[falhas[ok]], vaga[falhas[ok]] = b[ok], j[ok]
+        falhas, falho = falhas[~ok], b[~ok]
+    return bloco, vaga
+
+
+def _concluir_first_fit(vms: np.ndarray, cpu: np.ndarray, ram: np.ndarray, cpu_livre: np.ndarray, ram_livre: np.ndarray,
+                        servidores: np.ndarray, genes: np.ndarray):
+    """
+    Conclui um único indivíduo First Fit a partir do estado do decodificador (os
+    blocos de uma linha), alocando as VMs restantes (`vms`, com seus requisitos).
+    Com uma só linha, um laço em Python sobre os máximos dos blocos custa menos
+    que as chamadas ao NumPy de cada passo vetorizado.
+    """
+    tamanho = cpu_livre.shape[1]
+    max_cpu, max_ram = cpu_livre.max(axis=1).tolist(), ram_livre.max(axis=1).tolist()
+    cpu_livre, ram_livre = cpu_livre.ravel().tolist(), ram_livre.ravel().tolist()
+    servidores = servidores.tolist()
+    for vm, c, r in zip(vms.tolist(), cpu.tolist(), ram.tolist()):
+        for bloco in range(len(max_cpu)):
+            if max_cpu[bloco] < c or max_ram[bloco] < r:
+                continue
+            inicio = bloco * tamanho
+            posicao = next((p for p in range(inicio, inicio + tamanho) if cpu_livre[p] >= c and ram_livre[p] >= r), None)
+            if posicao is None:
+                continue
+            cpu_livre[posicao] -= c
+            ram_livre[posicao] -= r
+            genes[vm] = servidores[posicao]
+            max_cpu[bloco] = max(cpu_livre[inicio:inicio + tamanho])
+            max_ram[bloco] = max(ram_livre[inicio:inicio + tamanho])
+            break
+
+
+def _melhor_aberto(inicio: np.ndarray, cpu: np.ndarray, ram: np.ndarray, candidatos: np.ndarray, folga_bloco: np.ndarray,
+                   cpu_livre: np.ndarray, ram_livre: np.ndarray, folga: np.ndarray, inv_cpu: np.ndarray, inv_ram: np.ndarray):
+    """
+    Best Fit por blocos: entre os blocos com um servidor aberto que (pelos máximos)
+    comporta a VM, o de menor folga; dentro dele, o servidor aberto de menor sobra.
+    Blocos sem nenhum servidor aberto que comporte a VM são descartados e a busca
+    segue no próximo. Retorna (bloco, vaga), com -1 onde nenhum aberto comporta a VM.
+    """
+    folga_bloco = np.where(candidatos, folga_bloco, np.inf)
+
+    def buscar(linhas: np.ndarray, bloco: np.ndarray):
+        linha = inicio[linhas] + bloco
+        c, r = cpu[linhas, None], ram[linhas, None]
+        # Servidores vazios têm folga infinita: ficam de fora.
+        sobra = folga.take(linha, axis=0) - c * inv_cpu.take(linha, axis=0) - r * inv_ram.take(linha, axis=0)
+        sobra[(cpu_livre.take(linha, axis=0) < c) | (ram_livre.take(linha, axis=0) < r)] = np.inf
+        return sobra.argmin(axis=1), np.isfinite(sobra.min(axis=1))
+
+    todas = np.arange(len(inicio))
+    bloco = folga_bloco.argmin(axis=1)
+    vaga, achou = buscar(todas, bloco)
+    if achou.all():
+        return bloco, vaga
+
+    # Refaz a busca só nas linhas em que o bloco escolhido não serviu.
+    falhas = np.flatnonzero(~achou)
+    falho = bloco[falhas]
+    bloco[falhas] = vaga[falhas] = -1
+    while falhas.size:
+        # Linhas cujo bloco falho nem era candidato não têm mais candidatos.
+        tinha = np.isfinite(folga_bloco[falhas, falho])
+        folga_bloco[falhas, falho] = np.inf
+        falhas = falhas[tinha]
+        if not falhas.size:
+            break
+        b = folga_bloco[falhas].argmin(axis=1)
+        j, ok = buscar(falhas, b)
+        bloco[falhas[ok]], vaga[falhas[ok]] = b[ok], j[ok]
+        falhas, falho = falhas[~ok], b[~ok]
+    return bloco, vaga
+
+
+def _decodificar_em_bloco(ordens_vms: np.ndarray, ordens_servidores: np.ndarray, best_fit: np.ndarray, cenario: CenarioArrays,
+                          rng: np.random.Generator, prazo: Optional[float] = None) -> np.ndarray:
+    """
+    Constrói um indivíduo por linha, alocando as VMs na ordem de `ordens_vms` (P x V)
+    nos servidores na ordem de `ordens_servidores` (P x S), com First Fit ou, nas
+    linhas marcadas em `best_fit` (P), Best Fit.
+
+    First Fit: o primeiro servidor (na ordem) que comporta a VM.
+    Best Fit: um servidor já aberto de pouca sobra que comporta a VM (o de menor
+    sobra dentro do bloco de menor folga que a comporta); se nenhum aberto
+    comportar, o primeiro servidor (na ordem) que a comporta, que estará vazio.
+    VMs que não cabem em nenhum servidor ficam com -1.
+
+    Os servidores de cada linha são agrupados, na ordem, em blocos de ~raiz(S)
+    posições, com o máximo de CPU e de RAM livres de cada bloco. Cada passo olha
+    os máximos dos blocos e, depois, só as posições de um bloco: o custo por VM é
+    O(P x raiz(S)), e não O(P x S). Todas as linhas avançam juntas, uma VM por passo.
+
+    Se o `prazo` (time.perf_counter) passar, só a primeira linha é concluída (em
+    Python puro, se for First Fit) e apenas ela é retornada: a população sempre tem
+    um indivíduo completo.
+    """
+    num_individuos, num_vms = ordens_vms.shape
+    num_servidores = ordens_servidores.shape[1]
+    genes = np.full((num_individuos, num_vms), -1, dtype=np.int64)
+    if num_individuos == 0 or num_vms == 0 or num_servidores == 0:
+        return genes
+
+    # Posições completadas até um múltiplo do bloco com servidores "fantasmas"
+    # (-1 livre: nada cabe), um bloco por linha: linha = indivíduo * num_blocos + bloco.
+    # As estatísticas dos blocos são vetores indexados pela mesma linha.
+    tamanho = _tamanho_bloco(num_servidores)
+    num_blocos = -(-num_servidores // tamanho)
+
+    def em_blocos(valores: np.ndarray, vazio) -> np.ndarray:
+        extra = num_blocos * tamanho - num_servidores
+        return np.pad(valores, ((0, 0), (0, extra)), constant_values=vazio).reshape(-1, tamanho)
+
+    servidores = em_blocos(ordens_servidores, 0).ravel()
+    cpu_livre = em_blocos(cenario.cpu_total[ordens_servidores].astype(np.int64), -1)
+    ram_livre = em_blocos(cenario.ram_total[ordens_servidores].astype(np.int64), -1)
+    max_cpu, max_ram = cpu_livre.max(axis=1), ram_livre.max(axis=1)
+    usa_best_fit = bool(best_fit.any())
+    if usa_best_fit:
+        inv_cpu = 1.0 / np.maximum(cpu_livre, 1)
+        inv_ram = 1.0 / np.maximum(ram_livre, 1)
+        # Ruído menor que qualquer diferença relevante de sobra: só desempata.
+        ruido = rng.random(cpu_livre.shape) * 1e-9
+        # Folga normalizada (CPU + RAM livres) dos servidores abertos; infinita nos vazios.
+        folga = np.full(cpu_livre.shape, np.inf)
+        # Por bloco, entre os servidores abertos: máximos livres e a menor folga.
+        aberto_cpu = np.full(max_cpu.shape, -1, dtype=np.int64)
+        aberto_ram = np.full(max_ram.shape, -1, dtype=np.int64)
+        aberto_folga = np.full(max_cpu.shape, np.inf)
+
+    def grupos(best_fit: np.ndarray):
+        # Linhas First Fit e Best Fit (slice(None) = todas; None = nenhuma).
+        if not best_fit.any():
+            return slice(None), None
+        if best_fit.all():
+            return None, slice(None)
+        return np.flatnonzero(~best_fit), np.flatnonzero(best_fit)
+
+    def por_individuo(estatistica: np.ndarray, linhas) -> np.ndarray:
+        estatistica = estatistica.reshape(-1, num_blocos)
+        return estatistica if isinstance(linhas, slice) else estatistica.take(linhas, axis=0)
+
+    def candidatos(maximo_cpu: np.ndarray, maximo_ram: np.ndarray, linhas, cpu: np.ndarray, ram: np.ndarray) -> np.ndarray:
+        return (por_individuo(maximo_cpu, linhas) >= cpu[:, None]) & (por_individuo(maximo_ram, linhas) >= ram[:, None])
+
+    # Uma linha por passo: a VM de cada indivíduo e o que ela pede.
+    vms_passo = np.ascontiguousarray(ordens_vms.T)
+    cpu_passo = cenario.cpu_req[vms_passo].astype(np.int64)
+    ram_passo = cenario.ram_req[vms_passo].astype(np.int64)
+    individuos = np.arange(num_individuos)
+    inicio = individuos * num_blocos
+    linhas_ff, linhas_bf = grupos(best_fit)
+    for t in range(num_vms):
+        if t % _PASSOS_ENTRE_PRAZOS == 0 and len(individuos) > 1 and _prazo_esgotado(prazo):
+            # Prazo esgotado: conclui só o primeiro indivíduo.
+            if not best_fit[0]:
+                _concluir_first_fit(vms_passo[t:, 0], cpu_passo[t:, 0], ram_passo[t:, 0], cpu_livre[:num_blocos],
+                                    ram_livre[:num_blocos], servidores[:num_blocos * tamanho], genes[0])
+                return genes[:1]
+            individuos, inicio, genes = individuos[:1], inicio[:1], genes[:1]
+            linhas_ff, linhas_bf = grupos(best_fit[:1])
+            vms_passo, cpu_passo, ram_passo = vms_passo[:, :1], cpu_passo[:, :1], ram_passo[:, :1]
+            servidores = servidores[:num_blocos * tamanho]
+            cpu_livre, ram_livre = cpu_livre[:num_blocos], ram_livre[:num_blocos]
+            max_cpu, max_ram = max_cpu[:num_blocos], max_ram[:num_blocos]
+            if usa_best_fit:
+                inv_cpu, inv_ram = inv_cpu[:num_blocos], inv_ram[:num_blocos]
+                ruido, folga = ruido[:num_blocos], folga[:num_blocos]
+                aberto_cpu, aberto_ram, aberto_folga = aberto_cpu[:num_blocos], aberto_ram[:num_blocos], aberto_folga[:num_blocos]
+
+        vm, cpu, ram = vms_passo[t], cpu_passo[t], ram_passo[t]
+        if linhas_bf is None:
+            bloco, vaga = _primeiro_que_cabe(inicio, cpu, ram, candidatos(max_cpu, max_ram, linhas_ff, cpu, ram), cpu_livre, ram_livre)
+        else:
+            bloco = np.empty(len(individuos), dtype=np.int64)
+            vaga = np.empty(len(individuos), dtype=np.int64)
+            if linhas_ff is not None:
+                c, r = cpu[linhas_ff], ram[linhas_ff]
+                bloco[linhas_ff], vaga[linhas_ff] = _primeiro_que_cabe(
+                    inicio[linhas_ff], c, r, candidatos(max_cpu, max_ram, linhas_ff, c, r), cpu_livre, ram_livre)
+            c, r = cpu[linhas_bf], ram[linhas_bf]
+            bloco_bf, vaga_bf = _melhor_aberto(
+                inicio[linhas_bf], c, r, candidatos(aberto_cpu, aberto_ram, linhas_bf, c, r),
+                por_individuo(aberto_folga, linhas_bf), cpu_livre, ram_livre, folga, inv_cpu, inv_ram)
+            # Nenhum aberto comporta: o primeiro que comporta (necessariamente vazio).
+            sem_aberto = np.flatnonzero(bloco_bf < 0)
+            if sem_aberto.size:
+                linhas = individuos[linhas_bf][sem_aberto]
+                c, r = cpu[linhas], ram[linhas]
+                bloco_bf[sem_aberto], vaga_bf[sem_aberto] = _primeiro_que_cabe(
+                    inicio[linhas], c, r, candidatos(max_cpu, max_ram, linhas, c, r), cpu_livre, ram_livre)
+            bloco[linhas_bf], vaga[linhas_bf] = bloco_bf, vaga_bf
+
+        alocada = bloco >= 0
+        alocados = individuos
+        if not alocada.all():
+            if not alocada.any():
+                continue
+            alocados, bloco, vaga = individuos[alocada], bloco[alocada], vaga[alocada]
+            vm, cpu, ram = vm[alocada], cpu[alocada], ram[alocada]
+        linha = inicio[alocados] + bloco
+        posicao = linha * tamanho + vaga
+        cpu_livre.ravel()[posicao] -= cpu
+        ram_livre.ravel()[posicao] -= ram
+        genes.ravel()[alocados * num_vms + vm] = servidores[posicao]
+
+        # Recalcula as estatísticas dos blocos alterados (as do Best Fit também nas
+        # linhas First Fit, que não as consultam: evita separar as linhas aqui).
+        cpu_bloco, ram_bloco = cpu_livre.take(linha, axis=0), ram_livre.take(linha, axis=0)
+        max_cpu[linha] = cpu_bloco.max(axis=1)
+        max_ram[linha] = ram_bloco.max(axis=1)
+        if usa_best_fit:
+            folga.ravel()[posicao] = (cpu_livre.ravel()[posicao] * inv_cpu.ravel()[posicao] +
+                                      ram_livre.ravel()[posicao] * inv_ram.ravel()[posicao] + ruido.ravel()[posicao])
+            folga_bloco = folga.take(linha, axis=0)
+            aberto = np.isfinite(folga_bloco)
+            aberto_folga[linha] = folga_bloco.min(axis=1)
+            aberto_cpu[linha] = np.where(aberto, cpu_bloco, -1).max(axis=1)
+            aberto_ram[linha] = np.where(aberto, ram_bloco, -1).max(axis=1)
+
+    return genes
+
+
+# ===[ 2. Heurísticas ]==================================================================
+
+def _ordem_decrescente(cenario: CenarioArrays, desempate: np.ndarray) -> np.ndarray:
+    """
+    Ordena as VMs por (RAM, CPU) decrescente, como o `ffd_crossover`. `desempate`
+    (P x V, valores em [0, 1)) ordena as VMs de mesmo tamanho; zeros mantêm a ordem original.
+    """
+    base = cenario.ram_req.astype(np.float64) * (int(cenario.cpu_req.max(initial=0)) + 1) + cenario.cpu_req
+    return np.argsort(-(base[None, :] + desempate), axis=1, kind='stable')
+
+
+def _ordens_servidores_aleatorias(quantidade: int, num_servidores: int, rng: np.random.Generator) -> np.ndarray:
+    return np.argsort(rng.random((quantidade, num_servidores)), axis=1)
+
+
+def _ordens(heuristica: str, quantidade: int, cenario: CenarioArrays, rng: np.random.Generator):
+    """
+    As ordens de VMs e de servidores (matrizes P x V e P x S) de `quantidade`
+    indivíduos de uma heurística e se eles são decodificados com Best Fit.
+    """
+    num_vms, num_servidores = cenario.num_vms, cenario.num_servidores
+    servidores = _ordens_servidores_aleatorias(quantidade, num_servidores, rng)
+
+    if heuristica == 'first_fit_aleatorio':
+        return np.argsort(rng.random((quantidade, num_vms)), axis=1), servidores, False
+
+    if heuristica == 'best_fit_decrescente':
+        return _ordem_decrescente(cenario, rng.random((quantidade, num_vms)) * 0.5), servidores, True
+
+    if heuristica == 'ffd':
+        servidores[0] = np.arange(num_servidores) # O FFD original, na ordem dos IDs.
+        return _ordem_decrescente(cenario, np.zeros((quantidade, num_vms))), servidores, False
+
+    if heuristica == 'chaves_aleatorias':
+        tamanho = (cenario.ram_req / max(int(cenario.ram_req.max(initial=0)), 1) +
+                   cenario.cpu_req / max(int(cenario.cpu_req.max(initial=0)), 1)) / 2.0
+        chaves = tamanho[None, :] + rng.random((quantidade, num_vms))
+        return np.argsort(-chaves, axis=1, kind='stable'), servidores, False
+
+    raise ValueError(f"Inicializador '{heuristica}' desconhecido. Use um de {INICIALIZADORES}.")
+
+
+def _gerar(cotas: Dict[str, int], cenario: CenarioArrays, rng: np.random.Generator,
+           prazo: Optional[float] = None) -> Dict[str, np.ndarray]:
+    """
+    Gera os indivíduos (matriz P x V por heurística) das `cotas` de uma só vez: as
+    ordens de todas as heurísticas de array são decodificadas juntas. Se o `prazo`
+    passar, só o primeiro indivíduo é gerado.
+    """
+    nomes = [nome for nome, cota in cotas.items() if cota > 0]
+    if not nomes:
+        return {}
+    ordens = [_ordens(nome, cotas[nome], cenario, rng) for nome in nomes]
+    best_fit = np.repeat([bf for _, _, bf in ordens], [cotas[nome] for nome in nomes])
+    genes = _decodificar_em_bloco(np.concatenate([vms for vms, _, _ in ordens]),
+                                  np.concatenate([servidores for _, servidores, _ in ordens]),
+                                  best_fit, cenario, rng, prazo)
+    fim = np.cumsum([cotas[nome] for nome in nomes])
+    return {nome: genes[f - cotas[nome]:f] for nome, f in zip(nomes, fim)}
+
+
+# ===[ 3. População Inicial ]============================================================
+
+def _dividir_cotas(mistura: Dict[str, float], size: int) -> Dict[str, int]:
+    """Divide `size` entre as heurísticas proporcionalmente aos pesos (maiores restos)."""
+    total = sum(mistura.values())
+    if total <= 0:
+        raise ValueError("A mistura da população inicial precisa de ao menos um peso positivo.")
+    exatas = {nome: size * peso / total for nome, peso in mistura.items()}
+    cotas = {nome: int(valor) for nome, valor in exatas.items()}
+    restos = sorted(mistura, key=lambda nome: exatas[nome] - cotas[nome], reverse=True)
+    for nome in restos[:size - sum(cotas.values())]:
+        cotas[nome] += 1
+    return cotas
+
+
+def gerar_populacao_inicial(
+    vms: List[MaquinaVirtual],
+    servidores: List[ServidorFisico],
+    size: int,
+    mistura: Optional[Dict[str, float]] = None,
+    rng: Optional[np.random.Generator] = None,
+    cenario: Optional[CenarioArrays] = None,
+    max_rodadas: int = 3,
+    prazo: Optional[float] = None
+) -> List[List[int]]:
+    """
+    Gera a população inicial com uma mistura de heurísticas, sem indivíduos repetidos.
+
+    Args:
+        vms, servidores: O cenário (servidores ordenados por ID, como nos cromossomos).
+        size (int): Tamanho da população.
+        mistura (Optional[Dict[str, float]]): Heurística -> peso. Padrão: MISTURA_PADRAO.
+        rng (Optional[np.random.Generator]): Gerador aleatório (para reprodutibilidade).
+        cenario (Optional[CenarioArrays]): O cenário em arrays, se já construído.
+        max_rodadas (int): Quantas vezes as cotas incompletas (por repetição) são
+            geradas novamente. Se ainda faltarem indivíduos, os únicos são repetidos.
+        prazo (Optional[float]): Instante (time.perf_counter) a partir do qual nenhuma
+            rodada nova é iniciada e a que está em andamento conclui um só indivíduo.
+    """
+    mistura = dict(MISTURA_PADRAO if mistura is None else mistura)
+    for nome in mistura:
+        if nome not in INICIALIZADORES:
+            raise ValueError(f"Inicializador '{nome}' desconhecido. Use um de {INICIALIZADORES}.")
+    if size <= 0:
+        return []
+    rng = rng if rng is not None else np.random.default_rng()
+    cenario = cenario if cenario is not None else construir_arrays_cenario(vms, servidores)
+
+    population: List[List[int]] = []
+    vistos = set()
+    nao_alocadas = 0
+
+    def adicionar(individuo: List[int]) -> bool:
+        chave = chave_cromossomo(individuo)
+        if chave in vistos:
+            return False
+        vistos.add(chave)
+        population.append(individuo)
+        return True
+
+    faltando = _dividir_cotas(mistura, size)
+    if faltando.pop('round_robin', 0):
+        # Determinística: gera um único indivíduo (as cópias seriam descartadas).
+        adicionar(generate_round_robin_population(vms, servidores, 1)[0])
+    for _ in range(max_rodadas):
+        if not any(cota > 0 for cota in faltando.values()) or (population and _prazo_esgotado(prazo)):
+            break
+        for nome, genes in _gerar(faltando, cenario, rng, prazo).items():
+            nao_alocadas += int((genes < 0).sum())
+            faltando[nome] -= sum(adicionar(linha) for linha in genes.tolist())
+
+    if nao_alocadas:
+        print(f"AVISO EM POPULAÇÃO INICIAL: {nao_alocadas} alocações de VM falharam (VMs maiores que os servidores livres).")
+
+    # Poucas soluções distintas possíveis (cenários pequenos): completa repetindo as únicas.
+    unicos = len(population)
+    while len(population) < size:
+        population.append(list(population[int(rng.integers(unicos))]))
+    return population[:size]
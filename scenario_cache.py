@@ -0,0 +1,145 @@
+# Arquivo [scenario_cache.py]
+
+"""
+Cache compilado do cenário VMware do projeto DRE.
+
+A cada execução, os CSVs exportados do VMware são relidos e interpretados
+(memória, HARDWARE_MAP, unicidade dos nomes). Este módulo compila o cenário
+com o leitor em blocos (vmware_loader) e guarda o resultado (os arrays de
+requisitos e capacidades e as tabelas de nomes) em um arquivo binário .npz;
+nas execuções seguintes, carrega os arrays direto, sem interpretar os CSVs.
+
+Invalidação: a chave do cache é um hash (SHA-256) do conteúdo dos dois CSVs,
+do HARDWARE_MAP, das taxas de superalocação (VCPU_PCPU_RATIO e
+RAM_OVERCOMMIT_RATIO) e da versão do formato. Se qualquer um deles mudar, o
+cenário é recompilado automaticamente. Calcular o hash apenas lê os bytes dos
+arquivos, o que é muito mais rápido que interpretá-los.
+
+Os arquivos ficam em `.dre_cache/`, ao lado do CSV de VMs, um por par de CSVs.
+
+Este módulo define:
+- DIRETORIO_CACHE: O diretório padrão dos cenários compilados.
+- chave_cenario_vmware: O hash que invalida o cache.
+- carregar_cenario_vmware_compilado: Carrega o cenário pelo cache (ou compila).
+"""
+
+# Importando
+import hashlib
+import json
+import os
+import numpy as np
+from typing import Any, Dict, Optional
+
+import datacenter_model
+from vmware_loader import CenarioColunar, carregar_cenario_vmware_colunar
+
+
+
+# ===[ 1. Chave do Cache ]===============================================================
+
+DIRETORIO_CACHE = '.dre_cache'
+
+# Incrementar quando a interpretação dos CSVs mudar (invalida os caches existentes).
+FORMATO_CACHE = 2
+
+_TAMANHO_LEITURA = 1 << 20
+
+
+def chave_cenario_vmware(caminho_servidores: str, caminho_vms: str) -> str:
+    """
+    Hash do conteúdo dos CSVs e dos parâmetros que mudam a interpretação deles.
+    Lança FileNotFoundError se algum dos arquivos não existir.
+    """
+    h = hashlib.sha256()
+    parametros = {
+        'formato': FORMATO_CACHE,
+        'hardware_map': datacenter_model.HARDWARE_MAP,
+        'vcpu_pcpu_ratio': datacenter_model.VCPU_PCPU_RATIO,
+        'ram_overcommit_ratio': datacenter_model.RAM_OVERCOMMIT_RATIO,
+    }
+    h.update(json.dumps(parametros, sort_keys=True).encode('utf-8'))
+    for caminho in (caminho_servidores, caminho_vms):
+        h.update(b'\0arquivo\0')
+        with open(caminho, 'rb') as f:
+            for bloco in iter(lambda: f.read(_TAMANHO_LEITURA), b''):
+                h.update(bloco)
+    return h.hexdigest()
+
+
+def _caminho_cache(caminho_servidores: str, caminho_vms: str, diretorio_cache: Optional[str]) -> str:
+    """O arquivo de cache deste par de CSVs (o nome depende só dos caminhos)."""
+    diretorio = diretorio_cache or os.path.join(os.path.dirname(os.path.abspath(caminho_vms)), DIRETORIO_CACHE)
+    caminhos = f"{os.path.abspath(caminho_servidores)}\0{os.path.abspath(caminho_vms)}"
+    return os.path.join(diretorio, f"vmware_{hashlib.sha1(caminhos.encode('utf-8')).hexdigest()[:12]}.npz")
+
+
+# ===[ 2. Gravação e Leitura ]===========================================================
+
+def _gravar(caminho: str, chave: str, cenario: CenarioColunar):
+    """Grava o cenário compilado (escrita atômica: arquivo temporário + rename)."""
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+    temporario = f"{caminho}.{os.getpid()}.tmp.npz"
+    np.savez(
+        temporario,
+        chave=np.array(chave),
+        cpu_total=cenario.cpu_total,
+        ram_total=cenario.ram_total,
+        servidor_nome=np.array(cenario.servidor_nomes, dtype=str),
+        cpu_req=cenario.cpu_req,
+        ram_req=cenario.ram_req,
+        vm_nome=np.array(cenario.vm_nomes, dtype=str),
+    )
+    os.replace(temporario, caminho)
+
+
+def _ler(caminho: str, chave: str) -> Optional[CenarioColunar]:
+    """Lê o cenário compilado, ou None se não existir, estiver corrompido ou a chave for outra."""
+    try:
+        with np.load(caminho) as dados:
+            if str(dados['chave']) != chave:
+                return None
+            return CenarioColunar(
+                dados['cpu_req'], dados['ram_req'], dados['vm_nome'].tolist(),
+                dados['cpu_total'], dados['ram_total'], dados['servidor_nome'].tolist(),
+            )
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def carregar_cenario_vmware_compilado(caminho_servidores: str, caminho_vms: str, diretorio_cache: Optional[str] = None, recompilar: bool = False) -> Dict[str, Any]:
+    """
+    Carrega o cenário VMware pelo cache compilado; se ele não existir ou estiver
+    desatualizado, interpreta os CSVs (em blocos, ver vmware_loader) e grava o cache.
+    Retorna o mesmo formato de `carregar_cenario_vmware`.
+
+    Args:
+        caminho_servidores, caminho_vms (str): Os CSVs exportados do VMware.
+        diretorio_cache (Optional[str]): Onde guardar o cache. Padrão: DIRETORIO_CACHE
+            ao lado do CSV de VMs.
+        recompilar (bool): Ignora o cache existente e o regrava.
+    """
+    try:
+        chave = chave_cenario_vmware(caminho_servidores, caminho_vms)
+    except FileNotFoundError:
+        # Os próprios CSVs não existem: o leitor reporta o erro.
+        cenario = carregar_cenario_vmware_colunar(caminho_servidores, caminho_vms)
+        return cenario.para_objetos() if cenario is not None else {'servidores': [], 'vms': []}
+
+    caminho = _caminho_cache(caminho_servidores, caminho_vms, diretorio_cache)
+    if not recompilar:
+        cenario = _ler(caminho, chave)
+        if cenario is not None:
+            print(f"Cenário compilado carregado de '{caminho}' (CSVs inalterados): "
+                  f"{cenario.num_servidores} servidores e {cenario.num_vms} VMs.")
+            return cenario.para_objetos()
+
+    cenario = carregar_cenario_vmware_colunar(caminho_servidores, caminho_vms)
+    if cenario is None:
+        return {'servidores': [], 'vms': []}
+    if cenario.num_servidores or cenario.num_vms:
+        try:
+            _gravar(caminho, chave, cenario)
+            print(f"Cenário compilado salvo em '{caminho}'.")
+        except OSError as e:
+            print(f"AVISO: Não foi possível salvar o cenário compilado em '{caminho}': {e}")
+    return cenario.para_objetos()
@@ -0,0 +1,253 @@
+# Arquivo [scenario_generator.py]
+
+"""
+Gerador de cenários sintéticos de grande escala para o projeto DRE.
+
+Os cenários existentes são pequenos (11 VMs no cenario_teste.json, ~730 na
+exportação do VMware). Este módulo gera cenários reprodutíveis (semente) com
+10^5 a 10^6 VMs, em dois formatos:
+
+- JSON, no mesmo esquema lido por `carregar_cenario` ('servidores' e
+  'vms_a_alocar'). As VMs são geradas e escritas em blocos, sem montar o
+  documento inteiro na memória; a lista de servidores é escrita por último,
+  pois o número de servidores depende da demanda total.
+- Binário (.npz), com os arrays de requisitos e capacidades; é lido por
+  `carregar_cenario_binario` (e por `python -m dre run --cenario json
+  --cenario-file arquivo.npz`) muito mais rápido que o JSON.
+
+Os servidores seguem os modelos do HARDWARE_MAP (vCPUs = pCPUs x VCPU_PCPU_RATIO).
+O número de servidores é calculado pelo aperto ("tightness"): a razão entre a
+demanda das VMs e a capacidade total, na dimensão (CPU ou RAM) mais apertada.
+
+Uso:
+    python -m dre gerar --vms 100000 --aperto 0.8 --saida cenario_100k.json
+    python -m dre gerar --vms 1000000 --distribuicao lognormal --saida cenario_1m.npz
+
+Gerar 10^6 VMs leva ~1 s; rodar o AG sobre elas não: cada indivíduo inicial e
+cada crossover custam segundos a dezenas de segundos. Rode esses cenários com
+população pequena e `--tempo-limite` (ver README).
+
+Este módulo define:
+- DISTRIBUICOES: As distribuições de tamanho das VMs.
+- tipos_de_host: Os modelos de servidor do HARDWARE_MAP.
+- gerar_cenario_arrays: Gera o cenário em arrays NumPy.
+- gerar_cenario: Gera o cenário como listas de MaquinaVirtual e ServidorFisico.
+- escrever_cenario_json / escrever_cenario_binario: Gravam o cenário em disco.
+- carregar_cenario_binario: Lê um cenário .npz no formato de `carregar_cenario`.
+"""
+
+# Importando
+import numpy as np
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from datacenter_model import MaquinaVirtual, ServidorFisico, HARDWARE_MAP, VCPU_PCPU_RATIO
+
+
+
+# ===[ 1. Parâmetros ]===================================================================
+
+# 'catalogo': tamanhos padronizados (flavors) comuns em nuvens privadas.
+# 'uniforme': CPU e RAM uniformes até o tamanho máximo do catálogo.
+# 'lognormal': cauda longa (poucas VMs muito grandes), RAM proporcional à CPU.
+DISTRIBUICOES = ('catalogo', 'uniforme', 'lognormal')
+
+# (vCPUs, RAM em GB) e o peso de cada tamanho na distribuição 'catalogo'.
+CATALOGO_VMS = (
+    ((1, 2), 0.12), ((1, 4), 0.10), ((2, 4), 0.16), ((2, 8), 0.18), ((4, 8), 0.12),
+    ((4, 16), 0.14), ((8, 16), 0.06), ((8, 32), 0.08), ((16, 64), 0.04),
+)
+
+# As VMs são geradas (e escritas) neste número por bloco. O valor é fixo para
+# que a mesma semente gere sempre o mesmo cenário.
+TAMANHO_BLOCO = 100_000
+
+# Extensão do formato binário.
+EXTENSAO_BINARIA = '.npz'
+
+
+def tipos_de_host() -> Dict[str, Tuple[int, int]]:
+    """Os modelos de servidor do HARDWARE_MAP: prefixo -> (vCPUs, RAM em GB)."""
+    return {prefixo: (hw['pCPUs'] * VCPU_PCPU_RATIO, hw['ram_gb']) for prefixo, hw in HARDWARE_MAP.items()}
+
+
+# ===[ 2. Geração ]======================================================================
+
+def _gerar_bloco_vms(rng: np.random.Generator, quantidade: int, distribuicao: str, cpu_max: int, ram_max: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Gera `quantidade` VMs (cpu_req, ram_req) que cabem no maior modelo de servidor."""
+    if distribuicao == 'catalogo':
+        tamanhos = np.array([tamanho for tamanho, _ in CATALOGO_VMS], dtype=np.int64)
+        pesos = np.array([peso for _, peso in CATALOGO_VMS])
+        escolhidos = tamanhos[rng.choice(len(tamanhos), size=quantidade, p=pesos / pesos.sum())]
+        cpu, ram = escolhidos[:, 0], escolhidos[:, 1]
+    elif distribuicao == 'uniforme':
+        cpu = rng.integers(1, max(t[0] for t, _ in CATALOGO_VMS) + 1, size=quantidade)
+        ram = rng.integers(1, max(t[1] for t, _ in CATALOGO_VMS) + 1, size=quantidade)
+    elif distribuicao == 'lognormal':
+        cpu = np.maximum(1, np.rint(rng.lognormal(mean=0.8, sigma=0.8, size=quantidade))).astype(np.int64)
+        ram = cpu * rng.choice([2, 4, 8], size=quantidade, p=[0.3, 0.5, 0.2])
+    else:
+        raise ValueError(f"Distribuição '{distribuicao}' desconhecida. Use uma de {DISTRIBUICOES}.")
+    return np.minimum(cpu, cpu_max).astype(np.int64), np.minimum(ram, ram_max).astype(np.int64)
+
+
+def _blocos_de_vms(semente: int, num_vms: int, distribuicao: str, cpu_max: int, ram_max: int) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """Gera as VMs em blocos de TAMANHO_BLOCO, a partir de uma semente própria."""
+    rng = np.random.default_rng([semente, 0])
+    for inicio in range(0, num_vms, TAMANHO_BLOCO):
+        yield _gerar_bloco_vms(rng, min(TAMANHO_BLOCO, num_vms - inicio), distribuicao, cpu_max, ram_max)
+
+
+def _gerar_servidores(semente: int, cpu_demanda: int, ram_demanda: int, aperto: float, num_servidores: Optional[int], pesos_tipos: Optional[Dict[str, float]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]:
+    """
+    Sorteia os modelos dos servidores. Sem `num_servidores`, usa o menor número
+    cuja capacidade esperada dá o `aperto` pedido na dimensão mais apertada.
+    Retorna (cpu_total, ram_total, índice do modelo, prefixos dos modelos).
+    """
+    tipos = tipos_de_host()
+    pesos_tipos = pesos_tipos or {prefixo: 1.0 for prefixo in tipos}
+    for prefixo in pesos_tipos:
+        if prefixo not in tipos:
+            raise ValueError(f"Modelo de host '{prefixo}' não está no HARDWARE_MAP ({', '.join(tipos)}).")
+    prefixos = list(pesos_tipos)
+    pesos = np.array([pesos_tipos[p] for p in prefixos], dtype=np.float64)
+    pesos /= pesos.sum()
+    cpu_modelos = np.array([tipos[p][0] for p in prefixos], dtype=np.int64)
+    ram_modelos = np.array([tipos[p][1] for p in prefixos], dtype=np.int64)
+
+    if num_servidores is None:
+        if not 0 < aperto <= 1:
+            raise ValueError("O aperto deve estar em (0, 1].")
+        necessarios = max(cpu_demanda / float(pesos @ cpu_modelos), ram_demanda / float(pesos @ ram_modelos))
+        num_servidores = max(1, int(np.ceil(necessarios / aperto)))
+
+    rng = np.random.default_rng([semente, 1])
+    modelo = rng.choice(len(prefixos), size=num_servidores, p=pesos)
+    return cpu_modelos[modelo], ram_modelos[modelo], modelo, prefixos
+
+
+def gerar_cenario_arrays(
+    num_vms: int,
+    aperto: float = 0.8,
+    distribuicao: str = 'catalogo',
+    semente: int = 0,
+    num_servidores: Optional[int] = None,
+    pesos_tipos: Optional[Dict[str, float]] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Gera um cenário sintético em arrays.
+
+    Args:
+        num_vms (int): Número de VMs.
+        aperto (float): Demanda / capacidade desejada, em (0, 1]. Ignorado se
+            `num_servidores` for informado.
+        distribuicao (str): Uma de DISTRIBUICOES.
+        semente (int): Semente; a mesma semente gera o mesmo cenário.
+        num_servidores (Optional[int]): Número fixo de servidores.
+        pesos_tipos (Optional[Dict[str, float]]): Modelo do HARDWARE_MAP -> peso.
+            Padrão: todos os modelos com o mesmo peso.
+
+    Returns:
+        Dict com 'cpu_req', 'ram_req' (por VM), 'cpu_total', 'ram_total' e
+        'modelo' (por servidor) e 'prefixos' (nome de cada modelo).
+    """
+    cpu_max = max(cpu for cpu, _ in tipos_de_host().values())
+    ram_max = max(ram for _, ram in tipos_de_host().values())
+    blocos = list(_blocos_de_vms(semente, num_vms, distribuicao, cpu_max, ram_max))
+    cpu_req = np.concatenate([b[0] for b in blocos]) if blocos else np.zeros(0, dtype=np.int64)
+    ram_req = np.concatenate([b[1] for b in blocos]) if blocos else np.zeros(0, dtype=np.int64)
+    cpu_total, ram_total, modelo, prefixos = _gerar_servidores(semente, int(cpu_req.sum()), int(ram_req.sum()), aperto, num_servidores, pesos_tipos)
+    return {'cpu_req': cpu_req, 'ram_req': ram_req, 'cpu_total': cpu_total, 'ram_total': ram_total, 'modelo': modelo, 'prefixos': np.array(prefixos)}
+
+
+def _para_objetos(arrays: Dict[str, np.ndarray]) -> Tuple[List[MaquinaVirtual], List[ServidorFisico]]:
+    """Converte os arrays do cenário em listas de objetos (IDs = posições)."""
+    vms = [MaquinaVirtual(i, cpu, ram) for i, (cpu, ram) in enumerate(zip(arrays['cpu_req'].tolist(), arrays['ram_req'].tolist()))]
+    prefixos = [str(p) for p in arrays['prefixos']] if 'prefixos' in arrays else None
+    servidores = []
+    for s_id, (cpu, ram) in enumerate(zip(arrays['cpu_total'].tolist(), arrays['ram_total'].tolist())):
+        nome = f"{prefixos[int(arrays['modelo'][s_id])]}-{s_id:06d}" if prefixos else None
+        servidores.append(ServidorFisico(s_id, cpu, ram, nome_real=nome))
+    return vms, servidores
+
+
+def gerar_cenario(num_vms: int, aperto: float = 0.8, distribuicao: str = 'catalogo', semente: int = 0, num_servidores: Optional[int] = None, pesos_tipos: Optional[Dict[str, float]] = None) -> Tuple[List[MaquinaVirtual], List[ServidorFisico]]:
+    """Gera um cenário sintético como listas (vms, servidores). Ver `gerar_cenario_arrays`."""
+    return _para_objetos(gerar_cenario_arrays(num_vms, aperto, distribuicao, semente, num_servidores, pesos_tipos))
+
+
+# ===[ 3. Gravação e Leitura ]===========================================================
+
+def escrever_cenario_json(caminho: str, num_vms: int, aperto: float = 0.8, distribuicao: str = 'catalogo', semente: int = 0, num_servidores: Optional[int] = None, pesos_tipos: Optional[Dict[str, float]] = None) -> Dict[str, int]:
+    """
+    Grava o cenário no esquema JSON de `carregar_cenario`, em blocos (streaming).
+    Gera exatamente o mesmo cenário que `gerar_cenario_arrays` com os mesmos parâmetros.
+    Retorna um resumo (VMs, servidores, demanda e capacidade).
+    """
+    cpu_max = max(cpu for cpu, _ in tipos_de_host().values())
+    ram_max = max(ram for _, ram in tipos_de_host().values())
+    cpu_demanda = ram_demanda = 0
+    proximo_id = 0
+    with open(caminho, 'w', encoding='utf-8') as f:
+        f.write('{\n  "vms_a_alocar": [\n')
+        for cpu, ram in _blocos_de_vms(semente, num_vms, distribuicao, cpu_max, ram_max):
+            cpu_demanda += int(cpu.sum())
+            ram_demanda += int(ram.sum())
+            linhas = ",\n".join(
+                f'    {{"id": {vm_id}, "cpu_req": {c}, "ram_req": {r}}}'
+                for vm_id, c, r in zip(range(proximo_id, proximo_id + len(cpu)), cpu.tolist(), ram.tolist())
+            )
+            f.write((",\n" if proximo_id else "") + linhas)
+            proximo_id += len(cpu)
+        f.write('\n  ],\n  "servidores": [\n')
+
+        cpu_total, ram_total, _, _ = _gerar_servidores(semente, cpu_demanda, ram_demanda, aperto, num_servidores, pesos_tipos)
+        f.write(",\n".join(
+            f'    {{"id": {s_id}, "cpu_total": {c}, "ram_total": {r}}}'
+            for s_id, (c, r) in enumerate(zip(cpu_total.tolist(), ram_total.tolist()))
+        ))
+        f.write('\n  ]\n}\n')
+
+    return {'vms': num_vms, 'servidores': len(cpu_total), 'cpu_demanda': cpu_demanda, 'ram_demanda': ram_demanda,
+            'cpu_capacidade': int(cpu_total.sum()), 'ram_capacidade': int(ram_total.sum())}
+
+
+def escrever_cenario_binario(caminho: str, num_vms: int, aperto: float = 0.8, distribuicao: str = 'catalogo', semente: int = 0, num_servidores: Optional[int] = None, pesos_tipos: Optional[Dict[str, float]] = None) -> Dict[str, int]:
+    """
+    Grava o cenário no formato binário (.npz, arrays int32). Retorna um resumo.
+    """
+    arrays = gerar_cenario_arrays(num_vms, aperto, distribuicao, semente, num_servidores, pesos_tipos)
+    np.savez(
+        caminho,
+        cpu_req=arrays['cpu_req'].astype(np.int32), ram_req=arrays['ram_req'].astype(np.int32),
+        cpu_total=arrays['cpu_total'].astype(np.int32), ram_total=arrays['ram_total'].astype(np.int32),
+        modelo=arrays['modelo'].astype(np.int16), prefixos=arrays['prefixos'],
+    )
+    return {'vms': num_vms, 'servidores': len(arrays['cpu_total']),
+            'cpu_demanda': int(arrays['cpu_req'].sum()), 'ram_demanda': int(arrays['ram_req'].sum()),
+            'cpu_capacidade': int(arrays['cpu_total'].sum()), 'ram_capacidade': int(arrays['ram_total'].sum())}
+
+
+def carregar_cenario_binario(caminho_arquivo: str) -> Dict[str, list]:
+    """
+    Carrega um cenário .npz gravado por `escrever_cenario_binario`.
+    Retorna o mesmo formato de `carregar_cenario`: {'servidores': [...], 'vms': [...]}.
+    """
+    try:
+        with np.load(caminho_arquivo) as dados:
+            arrays = {chave: dados[chave] for chave in dados.files}
+    except FileNotFoundError:
+        print(f"ERRO: Arquivo de cenário não encontrado em '{caminho_arquivo}'")
+        return {'servidores': [], 'vms': []}
+    except (KeyError, ValueError) as e:
+        print(f"ERRO: Arquivo de cenário binário inválido '{caminho_arquivo}': {e}")
+        return {'servidores': [], 'vms': []}
+    vms, servidores = _para_objetos(arrays)
+    print(f"Cenário binário '{caminho_arquivo}' carregado: {len(servidores)} servidores e {len(vms)} VMs.")
+    return {'servidores': servidores, 'vms': vms}
+
+
+def escrever_cenario(caminho: str, *args, **kwargs) -> Dict[str, int]:
+    """Grava o cenário em JSON ou, se o caminho terminar em EXTENSAO_BINARIA, em binário."""
+    if caminho.endswith(EXTENSAO_BINARIA):
+        return escrever_cenario_binario(caminho, *args, **kwargs)
+    return escrever_cenario_json(caminho, *args, **kwargs)
@@ -0,0 +1,141 @@
+# Arquivo [shared_buffers.py]
+
+"""
+Buffers em memória compartilhada para os processos do projeto DRE.
+
+Sem eles, cada processo worker recebe o cenário como listas de objetos
+(MaquinaVirtual/ServidorFisico) serializadas, e cada tarefa serializa os
+indivíduos que vai ler e os filhos que produz. Aqui os arrays ficam em blocos
+de `multiprocessing.shared_memory`: o processo principal cria e preenche os
+blocos, envia apenas um descritor pequeno (nome, formato e tipo) e os workers
+se anexam a eles sem cópia, lendo e escrevendo direto nos mesmos bytes.
+
+Quem cria um bloco é o dono: só ele o remove (`liberar`). Os workers apenas
+se anexam e se desanexam (`fechar`).
+
+Este módulo define:
+- ArrayCompartilhado: Um array NumPy sobre um bloco de memória compartilhada.
+- CenarioCompartilhado: Os arrays do CenarioArrays em memória compartilhada.
+- anexar_cenario: Reconstrói, sem cópia, o CenarioArrays em um worker.
+"""
+
+# Importando
+import numpy as np
+from multiprocessing import shared_memory
+from typing import Tuple
+
+from fitness_engine import CenarioArrays
+
+
+
+# ===[ 1. Array Compartilhado ]==========================================================
+
+class ArrayCompartilhado:
+    """
+    Um array NumPy cujos dados estão em um bloco de memória compartilhada.
+    """
+    def __init__(self, memoria: shared_memory.SharedMemory, shape: Tuple[int, ...], dtype, dono: bool):
+        """
+        Args:
+            memoria (SharedMemory): O bloco de memória.
+            shape, dtype: Formato e tipo do array.
+            dono (bool): Se este processo criou o bloco (e deve removê-lo).
+        """
+        self.memoria = memoria
+        self.dono = dono
+        self.array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=memoria.buf)
+
+    @classmethod
+    def criar(cls, shape: Tuple[int, ...], dtype) -> 'ArrayCompartilhado':
+        """Cria um bloco novo (não inicializado) com o formato e o tipo pedidos."""
+        tamanho = max(1, int(np.prod(shape)) * np.dtype(dtype).itemsize)
+        return cls(shared_memory.SharedMemory(create=True, size=tamanho), tuple(shape), dtype, dono=True)
+
+    @classmethod
+    def de_array(cls, origem: np.ndarray) -> 'ArrayCompartilhado':
+        """Cria um bloco com uma cópia de `origem`."""
+        compartilhado = cls.criar(origem.shape, origem.dtype)
+        compartilhado.array[...] = origem
+        return compartilhado
+
+    @classmethod
+    def anexar(cls, descritor: Tuple) -> 'ArrayCompartilhado':
+        """Anexa-se (sem cópia) a um bloco criado por outro processo."""
+        nome, shape, dtype = descritor
+        return cls(shared_memory.SharedMemory(name=nome), shape, dtype, dono=False)
+
+    @property
+    def descritor(self) -> Tuple:
+        """(nome, formato, tipo): o suficiente para outro processo se anexar."""
+        return (self.memoria.name, self.array.shape, self.array.dtype.str)
+
+    def fechar(self):
+        """
+        Desanexa este processo do bloco. Todas as views do array (inclusive as
+        de um CenarioArrays de `anexar_cenario`) precisam ter sido descartadas
+        antes: o NumPy não impede a leitura de uma view depois do fechamento, e
+        ela derruba o processo (falha de segmentação).
+        """
+        self.array = None
+        self.memoria.close()
+
+    def liberar(self):
+        """Desanexa e, se este processo for o dono, remove o bloco."""
+        self.fechar()
+        if self.dono:
+            self.memoria.unlink()
+
+    def __repr__(self) -> str:
+        """Retorna uma representação em string do objeto, útil para debug."""
+        formato = self.array.shape if self.array is not None else 'fechado'
+        return f"ArrayCompartilhado(Nome: {self.memoria.name}, Formato: {formato}, Dono: {self.dono})"
+
+
+# ===[ 2. Cenário Compartilhado ]========================================================
+
+class CenarioCompartilhado:
+    """
+    Os requisitos das VMs (2 x V) e as capacidades dos servidores (2 x S) de um
+    CenarioArrays, copiados uma vez para a memória compartilhada.
+    """
+    def __init__(self, cenario: CenarioArrays):
+        """
+        Args:
+            cenario (CenarioArrays): O cenário a compartilhar.
+        """
+        self.vms = ArrayCompartilhado.de_array(np.stack([cenario.cpu_req, cenario.ram_req]))
+        self.servidores = ArrayCompartilhado.de_array(np.stack([cenario.cpu_total, cenario.ram_total]))
+
+    @property
+    def descritor(self) -> Tuple:
+        return (self.vms.descritor, self.servidores.descritor)
+
+    def liberar(self):
+        """Remove os blocos (chamado pelo processo que criou o cenário)."""
+        self.vms.liberar()
+        self.servidores.liberar()
+
+    def __repr__(self) -> str:
+        """Retorna uma representação em string do objeto, útil para debug."""
+        return f"CenarioCompartilhado(VMs: {self.vms.array.shape[1]}, Servidores: {self.servidores.array.shape[1]})"
+
+
+def anexar_cenario(descritor: Tuple, copiar: bool = False) -> Tuple[CenarioArrays, Tuple[ArrayCompartilhado, ...]]:
+    """
+    Reconstrói o CenarioArrays a partir do descritor de um CenarioCompartilhado.
+    Os arrays do cenário são views dos blocos compartilhados (nenhuma cópia);
+    os blocos retornados devem permanecer abertos enquanto o cenário for usado.
+
+    Com `copiar`, o cenário recebe cópias dos arrays e os blocos já são fechados
+    aqui (a tupla de blocos retornada é vazia): para quem só precisa do cenário
+    por pouco tempo ou quer passá-lo adiante sem gerenciar os blocos.
+    """
+    vms = ArrayCompartilhado.anexar(descritor[0])
+    servidores = ArrayCompartilhado.anexar(descritor[1])
+    if not copiar:
+        cenario = CenarioArrays(vms.array[0], vms.array[1], servidores.array[0], servidores.array[1])
+        return cenario, (vms, servidores)
+    cenario = CenarioArrays(vms.array[0].copy(), vms.array[1].copy(), servidores.array[0].copy(), servidores.array[1].copy())
+    vms.fechar()
+    servidores.fechar()
+    return cenario, ()
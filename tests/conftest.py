@@ -0,0 +1,14 @@
+# Arquivo [tests/conftest.py]
+
+"""
+Configuração comum dos testes: os módulos do projeto ficam na raiz do
+repositório (sem pacote), então a raiz entra no sys.path.
+"""
+
+# Importando
+import os
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if RAIZ not in sys.path:
+    sys.path.insert(0, RAIZ)
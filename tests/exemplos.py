@@ -0,0 +1,21 @@
+# Arquivo [tests/exemplos.py]
+
+"""Cenários de exemplo (os JSON da raiz do repositório) usados pelos testes."""
+
+# Importando
+import os
+
+from ga_runner import carregar_datacenter
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def carregar_exemplo(nome: str):
+    """Carrega um dos cenários JSON da raiz (ex.: 'cenario_teste.json') como (vms, servidores)."""
+    return carregar_datacenter('json', os.path.join(RAIZ, nome), '', '')
+
+
+def carregar_exemplo_vmware():
+    """Carrega o cenário VMware da raiz (os CSV ExportList--*) como (vms, servidores), sem o cache compilado."""
+    return carregar_datacenter('vmware', '', os.path.join(RAIZ, 'ExportList--servidores.csv'),
+                               os.path.join(RAIZ, 'ExportList--VMs.csv'), usar_cache=False)
@@ -0,0 +1,41 @@
+# Arquivo [tests/test_fitness_cache.py]
+
+"""Testes do FitnessCache e do seu uso no runner."""
+
+# Importando
+import random
+import numpy as np
+
+from exemplos import carregar_exemplo
+from fitness_engine import FitnessCache, calculate_population_fitness, construir_arrays_cenario
+from ga_runner import GeneticAlgorithmRunner
+
+
+def test_consultar_populacao_conta_duplicatas_como_acertos():
+    vms, servidores = carregar_exemplo('cenario_teste.json')
+    cenario = construir_arrays_cenario(vms, servidores)
+    cache = FitnessCache(cenario)
+    individuo = np.arange(len(vms)) % len(servidores)
+    populacao = np.array([individuo, individuo, np.roll(individuo, 1)])
+
+    fitness = cache.avaliar_populacao(populacao)
+    assert (cache.hits, cache.misses) == (1, 2)
+    np.testing.assert_allclose(fitness, calculate_population_fitness(populacao, cenario).fitness)
+
+    fitness, pendentes = cache.consultar_populacao(populacao)
+    assert not pendentes and cache.hits == 4
+    np.testing.assert_allclose(fitness, calculate_population_fitness(populacao, cenario).fitness)
+
+
+def test_filhos_repetidos_sao_atendidos_pelo_cache():
+    # O ffd_crossover é determinístico: a partir da segunda geração, todo filho é repetido.
+    vms, servidores = carregar_exemplo('cenario_teste.json')
+    random.seed(1)
+    runner = GeneticAlgorithmRunner(vms, servidores, population_size=10, n_generations=4, crossover='ffd',
+                                    local_search_elites=0, stop_at_lower_bound=False)
+    while runner.executar_geracao():
+        pass
+    assert runner.fitness_cache.hits > 0
+    # O fitness guardado para a população continua igual ao recalculado.
+    np.testing.assert_allclose(runner.fitness_cache.avaliar_populacao(runner.population),
+                               calculate_population_fitness(runner.population, runner.cenario, runner.fitness_secundario).fitness)
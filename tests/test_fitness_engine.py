@@ -0,0 +1,56 @@
+# Arquivo [tests/test_fitness_engine.py]
+
+"""Testes do fitness vetorizado e do EstadoIndividuo contra o modelo de objetos."""
+
+# Importando
+import random
+import numpy as np
+import pytest
+
+from exemplos import carregar_exemplo
+from fitness_engine import EstadoIndividuo, calculate_fitness_arrays, calculate_population_fitness, construir_arrays_cenario
+from genetic_algorithm import calculate_fitness, ffd_crossover
+
+CENARIOS = ('cenario_teste.json', 'cenario_desafiador.json')
+
+
+def _populacao(vms, servidores, rng: random.Random) -> np.ndarray:
+    """Indivíduos viáveis (FFD e variações) e inviáveis (sorteados)."""
+    ffd = ffd_crossover(vms, servidores)[0]
+    individuos = [ffd, list(reversed(ffd))]
+    individuos += [[rng.randrange(len(servidores)) for _ in vms] for _ in range(20)]
+    return np.array(individuos)
+
+
+@pytest.mark.parametrize('nome', CENARIOS)
+def test_calculate_population_fitness_igual_ao_modelo_de_objetos(nome):
+    vms, servidores = carregar_exemplo(nome)
+    cenario = construir_arrays_cenario(vms, servidores)
+    populacao = _populacao(vms, servidores, random.Random(1))
+
+    esperado = [calculate_fitness(individuo, vms, servidores) for individuo in populacao.tolist()]
+    assert np.isfinite(esperado).any() and np.isinf(esperado).any()
+    assert calculate_population_fitness(populacao, cenario).fitness.tolist() == esperado
+    assert [calculate_fitness_arrays(individuo, cenario) for individuo in populacao] == esperado
+
+
+@pytest.mark.parametrize('nome', CENARIOS)
+def test_estado_individuo_acompanha_o_fitness_completo(nome):
+    vms, servidores = carregar_exemplo(nome)
+    cenario = construir_arrays_cenario(vms, servidores)
+    rng = random.Random(2)
+    for individuo in _populacao(vms, servidores, rng)[:4].tolist():
+        estado = EstadoIndividuo(individuo, cenario)
+        for _ in range(300):
+            if rng.random() < 0.5:
+                vm_idx, destino = rng.randrange(len(vms)), rng.randrange(len(servidores))
+                viavel, previsto = estado.avaliar_move(vm_idx, destino)
+                estado.aplicar_move(vm_idx, destino)
+            else:
+                vm_a, vm_b = rng.randrange(len(vms)), rng.randrange(len(vms))
+                viavel, previsto = estado.avaliar_swap(vm_a, vm_b)
+                estado.aplicar_swap(vm_a, vm_b)
+            fitness = calculate_fitness(estado.individual, vms, servidores)
+            assert estado.fitness == previsto == fitness
+            assert viavel == np.isfinite(fitness)
+        assert estado.fitness == calculate_fitness_arrays(estado.individual, cenario)
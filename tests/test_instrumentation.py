@@ -0,0 +1,29 @@
+# Arquivo [tests/test_instrumentation.py]
+
+"""Testes da instrumentação do laço do AG."""
+
+# Importando
+import random
+
+import pytest
+
+from ga_runner import GeneticAlgorithmRunner
+from instrumentation import Instrumentacao, SaidaCallback
+from exemplos import carregar_exemplo
+
+
+def test_fases_da_inicializacao_chegam_ao_resumo():
+    random.seed(1)
+    vms, servidores = carregar_exemplo('cenario_teste.json')
+    registros, resumos = [], []
+    instrumentacao = Instrumentacao([SaidaCallback(registros.append, resumos.append)])
+    runner = GeneticAlgorithmRunner(vms, servidores, population_size=10, n_generations=3, stop_at_lower_bound=False, instrumentacao=instrumentacao)
+    while runner.executar_geracao():
+        pass
+    runner.finalizar(gerar_relatorios=False)
+
+    resumo = resumos[0]
+    assert set(resumo['preparacao']) == {'inicializacao', 'avaliacao'}
+    assert resumo['preparacao'] == pytest.approx({fase: runner.tempo_fases[fase] - resumo['fases'].get(fase, 0.0) for fase in resumo['preparacao']})
+    assert all(registro['fases']['selecao'] <= registro['tempo'] for registro in registros)
+    assert sum(resumo['fases'].values()) + sum(resumo['preparacao'].values()) == pytest.approx(sum(runner.tempo_fases.values()))
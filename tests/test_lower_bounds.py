@@ -0,0 +1,29 @@
+# Arquivo [tests/test_lower_bounds.py]
+
+"""Testes dos limites inferiores do número de servidores."""
+
+# Importando
+import random
+import pytest
+
+from exemplos import carregar_exemplo
+from fitness_engine import construir_arrays_cenario, fitness_primario
+from ga_runner import GeneticAlgorithmRunner
+from genetic_algorithm import calculate_fitness, ffd_crossover
+from lower_bounds import calcular_limite_inferior
+
+
+@pytest.mark.parametrize('nome', ('cenario_teste.json', 'cenario_desafiador.json'))
+def test_limite_inferior_nao_passa_da_melhor_alocacao_conhecida(nome):
+    vms, servidores = carregar_exemplo(nome)
+    limite = calcular_limite_inferior(construir_arrays_cenario(vms, servidores))
+    assert limite.valor > 0
+
+    ffd = calculate_fitness(ffd_crossover(vms, servidores)[0], vms, servidores)
+    random.seed(3)
+    runner = GeneticAlgorithmRunner(vms, servidores, population_size=20, n_generations=20, stop_at_lower_bound=False)
+    while runner.executar_geracao():
+        pass
+    melhor = min(ffd, fitness_primario(runner.last_best_fitness))
+    assert limite.valor <= melhor
+    assert all(valor <= melhor for valor in limite.limites.values())
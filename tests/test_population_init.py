@@ -0,0 +1,19 @@
+# Arquivo [tests/test_population_init.py]
+
+"""Testes dos geradores da população inicial."""
+
+# Importando
+import numpy as np
+import pytest
+
+from exemplos import carregar_exemplo, carregar_exemplo_vmware
+from genetic_algorithm import ffd_crossover
+from population_init import gerar_populacao_inicial
+
+
+@pytest.mark.parametrize('nome', ('cenario_teste.json', 'cenario_desafiador.json', 'vmware'))
+def test_primeiro_individuo_ffd_igual_ao_ffd_crossover(nome):
+    # O inicializador 'ffd' refaz o FFD no decodificador em bloco: os dois não podem divergir.
+    vms, servidores = carregar_exemplo_vmware() if nome == 'vmware' else carregar_exemplo(nome)
+    populacao = gerar_populacao_inicial(vms, servidores, 1, {'ffd': 1.0}, np.random.default_rng(0))
+    assert list(populacao[0]) == ffd_crossover(vms, servidores)[0]
@@ -0,0 +1,37 @@
+# Arquivo [tests/test_shared_buffers.py]
+
+"""Testes dos buffers em memória compartilhada."""
+
+# Importando
+import numpy as np
+
+from fitness_engine import CenarioArrays
+from shared_buffers import CenarioCompartilhado, anexar_cenario
+
+
+def _cenario() -> CenarioArrays:
+    return CenarioArrays(np.array([1, 2, 3]), np.array([4, 5, 6]), np.array([10, 20]), np.array([30, 40]))
+
+
+def test_anexar_cenario_sem_copia_compartilha_os_blocos():
+    compartilhado = CenarioCompartilhado(_cenario())
+    try:
+        cenario, blocos = anexar_cenario(compartilhado.descritor)
+        assert len(blocos) == 2 and cenario.cpu_req.tolist() == [1, 2, 3]
+        compartilhado.vms.array[0, 0] = 7
+        assert cenario.cpu_req[0] == 7
+        del cenario # As views saem de escopo antes do fechamento.
+        for bloco in blocos:
+            bloco.fechar()
+    finally:
+        compartilhado.liberar()
+
+
+def test_anexar_cenario_com_copia_sobrevive_aos_blocos():
+    compartilhado = CenarioCompartilhado(_cenario())
+    try:
+        cenario, blocos = anexar_cenario(compartilhado.descritor, copiar=True)
+    finally:
+        compartilhado.liberar()
+    assert blocos == ()
+    assert cenario.ram_req.tolist() == [4, 5, 6] and cenario.ram_total.tolist() == [30, 40]
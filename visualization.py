@@ -1,6 +1,7 @@
 # Arquivo: visualization4.py
 # VERSÃO 4 FINAL: Polimento da interface, com importação direta e overflow corrigido.
 
+import queue
 import tkinter as tk
 from tkinter import ttk
 from typing import List, Dict
@@ -17,27 +18,83 @@ SERVER_FRAME_HEIGHT = 200
 VM_GRID_COLUMNS = 4
 VM_BOX_WIDTH = 60
 VM_BOX_HEIGHT = 20
+MAX_FPS = 10 # Limite de quadros por segundo da interface.
+GRID_COLUMNS = 3
+TILE_PADDING = 10
+TILE_WIDTH = SERVER_FRAME_WIDTH + 2 * TILE_PADDING
+TILE_HEIGHT = SERVER_FRAME_HEIGHT + 2 * TILE_PADDING
+SERVIDOR_VAZIO = ((), 0, 0)
+HEATMAP_CELL = 10 # Lado (px) de cada servidor na visão geral.
+HEATMAP_AUTO_THRESHOLD = 300 # Acima deste número de servidores, abre na visão geral.
+HEATMAP_COR_VAZIO = "#D0D0D0"
+HEATMAP_COR_FUNDO = "#FFFFFF"
 
 # --- Classe auxiliar para o Gráfico ---
 class FitnessPlot:
+    """
+    Gráfico da evolução do fitness com atualização por "blitting": a linha é
+    atualizada com set_data e só ela é redesenhada sobre o fundo guardado.
+    O gráfico completo só é redesenhado quando os eixos precisam crescer.
+    """
     def __init__(self, parent_frame):
         self.fig = Figure(figsize=(4, 3), dpi=100)
         self.ax = self.fig.add_subplot(111)
+        self.ax.set_title("Evolução do Fitness"); self.ax.set_xlabel("Geração")
+        self.ax.set_ylabel("Nº de Servidores"); self.ax.grid(True)
+        self.ax.set_xlim(0, 10); self.ax.set_ylim(0, 1)
+        # 'animated' exclui a linha do desenho completo; ela é desenhada só no blit.
+        self.linha, = self.ax.plot([], [], animated=True)
+        self.fig.tight_layout(pad=1.0)
         self.canvas = FigureCanvasTkAgg(self.fig, master=parent_frame)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self._fundo = None
+        # Todo desenho completo (inclusive redimensionamento) recaptura o fundo.
+        self.canvas.mpl_connect('draw_event', self._ao_desenhar)
+
+    def _ao_desenhar(self, event):
+        self._fundo = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.ax.draw_artist(self.linha)
 
     def update_plot(self, history: List[float]):
-        self.ax.clear()
-        self.ax.plot(history)
-        self.ax.set_title("Evolução do Fitness"); self.ax.set_xlabel("Geração")
-        self.ax.set_ylabel("Nº de Servidores"); self.ax.grid(True)
-        self.fig.tight_layout(pad=1.0); self.canvas.draw()
+        if not history:
+            return
+        valores_finitos = [v for v in history if v != float('inf')]
+        self.linha.set_data(range(len(history)), history)
+
+        # Os eixos crescem em "degraus" (dobrando), para que o redesenho
+        # completo aconteça poucas vezes ao longo da simulação.
+        x_max = self.ax.get_xlim()[1]
+        y_max = self.ax.get_ylim()[1]
+        redesenhar = self._fundo is None
+        if len(history) > x_max:
+            self.ax.set_xlim(0, max(10, 2 * len(history)))
+            redesenhar = True
+        if valores_finitos and max(valores_finitos) > y_max:
+            self.ax.set_ylim(0, max(valores_finitos) * 1.2 + 1)
+            redesenhar = True
+
+        if redesenhar:
+            self.canvas.draw()
+        else:
+            self.canvas.restore_region(self._fundo)
+            self.ax.draw_artist(self.linha)
+        self.canvas.blit(self.ax.bbox)
 
 class DatacenterVisualizer:
+    """
+    Painel principal. A grade de servidores é "virtualizada": apenas os
+    cartões visíveis na área rolável existem como widgets, e são reciclados
+    (reatribuídos a outros servidores) conforme o usuário rola a tela.
+    O modo "Visão geral" desenha o datacenter inteiro como uma única imagem
+    (heatmap de utilização), útil para milhares de hosts.
+    """
     def __init__(self, root: tk.Tk, servidores: List[ServidorFisico], vms: List[MaquinaVirtual]):
         self.root = root
         self.servidores_base = servidores
+        self._servidor_por_id = {s.id: s for s in servidores}
         self.vms_base = vms
+        # Limite inferior do número de servidores (definido pelo runner), para exibir o gap.
+        self.limite_inferior = None
         self.root.title("DRE - Datacenter Resource Emulator (Tkinter)")
         self.root.geometry("1280x740")
 
@@ -46,19 +103,27 @@ class DatacenterVisualizer:
 
         left_frame = ttk.Frame(main_frame)
         left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.left_frame = left_frame
 
+        # --- Grade virtualizada ---
         self.canvas = tk.Canvas(left_frame)
-        scrollbar = ttk.Scrollbar(left_frame, orient="vertical", command=self.canvas.yview)
-        scrollable_frame = ttk.Frame(self.canvas)
-        scrollable_frame.bind("<Configure>", lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
-        self.canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        self.canvas.configure(yscrollcommand=scrollbar.set)
+        self.scrollbar = ttk.Scrollbar(left_frame, orient="vertical", command=self._on_scroll)
+        self.canvas.configure(yscrollcommand=self.scrollbar.set)
         self.canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        self.scrollbar.pack(side="right", fill="y")
+        self.canvas.bind("<Configure>", lambda e: self._atualizar_cartoes_visiveis())
         self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
         self.canvas.bind_all("<Button-4>", self._on_mousewheel)
         self.canvas.bind_all("<Button-5>", self._on_mousewheel)
 
+        # --- Visão geral (heatmap) ---
+        self.heatmap_canvas = tk.Canvas(left_frame, background="#FFFFFF")
+        self.heatmap_canvas.bind("<Configure>", lambda e: self._desenhar_heatmap())
+        self.heatmap_canvas.bind("<Button-1>", self._on_heatmap_click)
+        self._heatmap_imagem = None
+        self._heatmap_item = None
+        self._heatmap_colunas = 1
+
         right_frame = ttk.Frame(main_frame, width=420, padding=10)
         right_frame.pack(side=tk.RIGHT, fill=tk.Y, expand=False)
         right_frame.pack_propagate(False)
@@ -69,95 +134,342 @@ class DatacenterVisualizer:
         self.gen_label.pack(anchor="w")
         self.fitness_label = ttk.Label(status_frame, text="Melhor Fitness: N/A")
         self.fitness_label.pack(anchor="w")
+        self.modo_heatmap = tk.BooleanVar(value=len(servidores) > HEATMAP_AUTO_THRESHOLD)
+        ttk.Checkbutton(status_frame, text="Visão geral (heatmap)", variable=self.modo_heatmap, command=self._alternar_modo).pack(anchor="w", pady=(5, 0))
 
         plot_frame = ttk.Frame(right_frame, padding=(0, 10, 0, 0))
         plot_frame.pack(fill=tk.BOTH, expand=True)
         self.fitness_plot = FitnessPlot(plot_frame)
-        
-        self.server_widgets = {}
-        for i, servidor in enumerate(self.servidores_base):
-            server_frame = ttk.LabelFrame(scrollable_frame, text=f"Servidor ID: {servidor.id}", width=SERVER_FRAME_WIDTH, height=SERVER_FRAME_HEIGHT, padding=5)
-            server_frame.grid(row=i // 3, column=i % 3, padx=10, pady=10, sticky="nsew")
-            server_frame.grid_propagate(False)
-            
-            cpu_label = ttk.Label(server_frame, text=f"CPU: 0/{servidor.cpu_total}")
-            cpu_label.pack(anchor="w")
-            cpu_canvas = tk.Canvas(server_frame, width=250, height=18, bg="#E0E0E0", highlightthickness=1, highlightbackground="grey")
-            cpu_canvas.pack(anchor="w", pady=(0, 5))
-
-            ram_label = ttk.Label(server_frame, text=f"RAM: 0/{servidor.ram_total} GB")
-            ram_label.pack(anchor="w")
-            ram_canvas = tk.Canvas(server_frame, width=250, height=18, bg="#E0E0E0", highlightthickness=1, highlightbackground="grey")
-            ram_canvas.pack(anchor="w", pady=(0, 5))
-
-            vm_canvas = tk.Canvas(server_frame, background="#FFFFFF", highlightthickness=0)
-            vm_canvas.pack(fill="both", expand=True, pady=(5,0))
-
-            self.server_widgets[servidor.id] = {
-                "cpu_label": cpu_label, "cpu_canvas": cpu_canvas,
-                "ram_label": ram_label, "ram_canvas": ram_canvas,
-                "vm_canvas": vm_canvas
-            }
-    
+
+        # Estado atual de cada servidor: (vms, cpu, ram). Servidores vazios não aparecem.
+        self._estado: Dict[int, tuple] = {}
+        # Cartões reciclados e o servidor que cada um mostra no momento.
+        self._cartoes: List[Dict] = []
+        self._cartao_por_servidor: Dict[int, Dict] = {}
+
+        linhas = -(-len(self.servidores_base) // GRID_COLUMNS)
+        self.canvas.configure(scrollregion=(0, 0, GRID_COLUMNS * TILE_WIDTH, max(1, linhas) * TILE_HEIGHT))
+        self._alternar_modo()
+
+    # --- Grade virtualizada ---------------------------------------------------------------
+
+    def _criar_cartao(self) -> Dict:
+        """Cria um cartão de servidor (sem servidor associado) dentro do canvas rolável."""
+        server_frame = ttk.LabelFrame(self.canvas, text="", width=SERVER_FRAME_WIDTH, height=SERVER_FRAME_HEIGHT, padding=5)
+        server_frame.pack_propagate(False)
+
+        cpu_label = ttk.Label(server_frame, text="")
+        cpu_label.pack(anchor="w")
+        cpu_canvas = tk.Canvas(server_frame, width=250, height=18, bg="#E0E0E0", highlightthickness=1, highlightbackground="grey")
+        cpu_canvas.pack(anchor="w", pady=(0, 5))
+
+        ram_label = ttk.Label(server_frame, text="")
+        ram_label.pack(anchor="w")
+        ram_canvas = tk.Canvas(server_frame, width=250, height=18, bg="#E0E0E0", highlightthickness=1, highlightbackground="grey")
+        ram_canvas.pack(anchor="w", pady=(0, 5))
+
+        vm_canvas = tk.Canvas(server_frame, background="#FFFFFF", highlightthickness=0)
+        vm_canvas.pack(fill="both", expand=True, pady=(5,0))
+
+        # Itens persistentes: as barras são apenas movidas (coords) a cada atualização.
+        cpu_bar = cpu_canvas.create_rectangle(0, 0, 0, 18, fill="#FF6464", outline="")
+        ram_bar = ram_canvas.create_rectangle(0, 0, 0, 18, fill="#6464FF", outline="")
+        overflow_text = vm_canvas.create_text(0, 0, text="", anchor="w", state="hidden")
+
+        cartao = {
+            "frame": server_frame, "janela": self.canvas.create_window(0, 0, window=server_frame, anchor="nw", state="hidden"),
+            "cpu_label": cpu_label, "cpu_canvas": cpu_canvas, "cpu_bar": cpu_bar,
+            "ram_label": ram_label, "ram_canvas": ram_canvas, "ram_bar": ram_bar,
+            "vm_canvas": vm_canvas, "vm_items": [], "overflow_text": overflow_text,
+            "vm_canvas_size": (0, 0), "servidor_id": None, "desenhado": None
+        }
+        vm_canvas.bind("<Configure>", lambda e, c=cartao: self._on_vm_canvas_resize(c, e))
+        self._cartoes.append(cartao)
+        return cartao
+
+    def _atualizar_cartoes_visiveis(self):
+        """
+        Calcula quais servidores estão na área visível e associa um cartão a
+        cada um, reaproveitando os cartões que saíram da tela.
+        """
+        if self.modo_heatmap.get():
+            return
+        topo = self.canvas.canvasy(0)
+        altura = max(1, self.canvas.winfo_height())
+        primeira_linha = max(0, int(topo // TILE_HEIGHT))
+        ultima_linha = int((topo + altura) // TILE_HEIGHT)
+        inicio = primeira_linha * GRID_COLUMNS
+        fim = min(len(self.servidores_base), (ultima_linha + 1) * GRID_COLUMNS)
+        visiveis = {self.servidores_base[i].id: i for i in range(inicio, fim)}
+
+        # Libera os cartões de servidores que saíram da tela.
+        livres = [c for c in self._cartoes if c["servidor_id"] not in visiveis]
+        for cartao in livres:
+            if cartao["servidor_id"] is not None:
+                del self._cartao_por_servidor[cartao["servidor_id"]]
+                cartao["servidor_id"] = None
+            self.canvas.itemconfigure(cartao["janela"], state="hidden")
+
+        for servidor_id, indice in visiveis.items():
+            if servidor_id in self._cartao_por_servidor:
+                continue
+            cartao = livres.pop() if livres else self._criar_cartao()
+            servidor = self.servidores_base[indice]
+            cartao["servidor_id"] = servidor_id
+            cartao["desenhado"] = None
+            cartao["frame"].configure(text=f"Servidor ID: {servidor.id}")
+            linha, coluna = divmod(indice, GRID_COLUMNS)
+            self.canvas.coords(cartao["janela"], coluna * TILE_WIDTH + TILE_PADDING, linha * TILE_HEIGHT + TILE_PADDING)
+            self.canvas.itemconfigure(cartao["janela"], state="normal")
+            self._cartao_por_servidor[servidor_id] = cartao
+            self._desenhar_servidor(cartao, servidor)
+
+    def _on_scroll(self, *args):
+        self.canvas.yview(*args)
+        self._atualizar_cartoes_visiveis()
+
     def _on_mousewheel(self, event):
+        if self.modo_heatmap.get():
+            return
         if hasattr(event, 'delta') and event.delta != 0:
              self.canvas.yview_scroll(-1 * (event.delta // 120), "units")
         elif event.num == 4: self.canvas.yview_scroll(-1, "units")
         elif event.num == 5: self.canvas.yview_scroll(1, "units")
+        self._atualizar_cartoes_visiveis()
+
+    def _on_vm_canvas_resize(self, cartao: Dict, event):
+        """Guarda o novo tamanho do canvas de VMs e redesenha apenas aquele cartão."""
+        cartao["vm_canvas_size"] = (event.width, event.height)
+        if cartao["desenhado"] is not None:
+            self._desenhar_vms(cartao, cartao["desenhado"][0])
+
+    def _alternar_modo(self):
+        """Alterna entre a grade de cartões e a visão geral (heatmap)."""
+        if self.modo_heatmap.get():
+            self.canvas.pack_forget()
+            self.scrollbar.pack_forget()
+            self.heatmap_canvas.pack(side="left", fill="both", expand=True)
+            self._desenhar_heatmap()
+        else:
+            self.heatmap_canvas.pack_forget()
+            self.canvas.pack(side="left", fill="both", expand=True)
+            self.scrollbar.pack(side="right", fill="y")
+            self._atualizar_cartoes_visiveis()
+
+    # --- Atualização ----------------------------------------------------------------------
 
     def update_view(self, best_solution: List[int], generation: int, best_fitness: float, history: List[float]):
-        uso_servidores = {s.id: {'cpu': 0, 'ram': 0, 'vms': []} for s in self.servidores_base}
+        uso_servidores: Dict[int, Dict] = {}
         for vm_idx, s_id in enumerate(best_solution):
-            if s_id != -1 and s_id in uso_servidores:
+            if s_id != -1:
                 vm = self.vms_base[vm_idx]
-                uso_servidores[s_id]['cpu'] += vm.cpu_req
-                uso_servidores[s_id]['ram'] += vm.ram_req
-                uso_servidores[s_id]['vms'].append(vm.id)
-
-        for servidor in self.servidores_base:
-            widgets = self.server_widgets[servidor.id]
-            uso = uso_servidores[servidor.id]
-            
-            widgets["cpu_label"].config(text=f"CPU: {uso['cpu']}/{servidor.cpu_total}")
-            cpu_canvas = widgets["cpu_canvas"]
-            cpu_canvas.delete("all")
-            cpu_percent = (uso['cpu'] / servidor.cpu_total) if servidor.cpu_total > 0 else 0
-            cpu_canvas.create_rectangle(0, 0, 250 * cpu_percent, 18, fill="#FF6464", outline="")
-            
-            widgets["ram_label"].config(text=f"RAM: {uso['ram']}/{servidor.ram_total} GB")
-            ram_canvas = widgets["ram_canvas"]
-            ram_canvas.delete("all")
-            ram_percent = (uso['ram'] / servidor.ram_total) if servidor.ram_total > 0 else 0
-            ram_canvas.create_rectangle(0, 0, 250 * ram_percent, 18, fill="#6464FF", outline="")
-
-            vm_canvas = widgets["vm_canvas"]
-            vm_canvas.delete("all")
-            vms_alocadas = sorted(uso['vms'])
-            
-            vm_canvas.update_idletasks()
-            canvas_height = vm_canvas.winfo_height()
-            vms_por_linha = max(1, (vm_canvas.winfo_width() - 4) // (VM_BOX_WIDTH + 5))
-            max_linhas = max(0, canvas_height // (VM_BOX_HEIGHT + 5))
-            max_vms_visiveis = max_linhas * vms_por_linha
-
-            x, y = 2, 2
-            for i, vm_id in enumerate(vms_alocadas):
-                # <<< CORREÇÃO DO OVERFLOW: Reserva espaço para a mensagem "e mais..." >>>
-                if max_vms_visiveis > 0 and i >= (max_vms_visiveis - 1) and len(vms_alocadas) > max_vms_visiveis:
-                    vms_restantes = len(vms_alocadas) - i
-                    vm_canvas.create_text(x, y + 10, text=f"...e mais {vms_restantes}", anchor="w")
-                    break
-                
-                vm_canvas.create_rectangle(x, y, x + VM_BOX_WIDTH, y + VM_BOX_HEIGHT, fill="#6496FA", outline="")
-                vm_canvas.create_text(x + VM_BOX_WIDTH / 2, y + VM_BOX_HEIGHT / 2, text=f"VM {vm_id}", fill="#FFFFFF")
-                x += VM_BOX_WIDTH + 5
-                if x + VM_BOX_WIDTH > vm_canvas.winfo_width():
-                    x = 2; y += VM_BOX_HEIGHT + 5
-        
+                uso = uso_servidores.setdefault(s_id, {'cpu': 0, 'ram': 0, 'vms': []})
+                uso['cpu'] += vm.cpu_req
+                uso['ram'] += vm.ram_req
+                uso['vms'].append(vm.id)
+        self._estado = {s_id: (tuple(sorted(uso['vms'])), uso['cpu'], uso['ram']) for s_id, uso in uso_servidores.items()}
+
+        if self.modo_heatmap.get():
+            self._desenhar_heatmap()
+        else:
+            # Só os cartões visíveis cujo conjunto de VMs mudou são redesenhados.
+            for servidor_id, cartao in self._cartao_por_servidor.items():
+                self._desenhar_servidor(cartao, self._servidor_por_id[servidor_id])
+
         self.gen_label.config(text=f"Geração Atual: {generation}")
-        self.fitness_label.config(text=f"Melhor Fitness: {best_fitness:.2f}")
+        texto_fitness = f"Melhor Fitness: {best_fitness:.2f}"
+        if self.limite_inferior is not None and best_fitness != float('inf'):
+            servidores_usados = int(best_fitness) # Sem o desempate do fitness composto, se houver.
+            gap = max(0.0, (servidores_usados - self.limite_inferior) / servidores_usados) if servidores_usados > 0 else 0.0
+            texto_fitness += f" (Limite: {self.limite_inferior}, Gap: {gap:.1%})"
+        self.fitness_label.config(text=texto_fitness)
 
         if self.fitness_plot and history:
             self.fitness_plot.update_plot(history)
 
-        self.root.update()
+    def _desenhar_servidor(self, cartao: Dict, servidor: ServidorFisico):
+        """Atualiza barras, rótulos e VMs de um cartão reaproveitando os itens do canvas."""
+        estado = self._estado.get(servidor.id, SERVIDOR_VAZIO)
+        if cartao["desenhado"] == estado:
+            return
+        cartao["desenhado"] = estado
+        vms_alocadas, cpu, ram = estado
+
+        cartao["cpu_label"].config(text=f"CPU: {cpu}/{servidor.cpu_total}")
+        cpu_percent = (cpu / servidor.cpu_total) if servidor.cpu_total > 0 else 0
+        cartao["cpu_canvas"].coords(cartao["cpu_bar"], 0, 0, 250 * cpu_percent, 18)
+
+        cartao["ram_label"].config(text=f"RAM: {ram}/{servidor.ram_total} GB")
+        ram_percent = (ram / servidor.ram_total) if servidor.ram_total > 0 else 0
+        cartao["ram_canvas"].coords(cartao["ram_bar"], 0, 0, 250 * ram_percent, 18)
+
+        self._desenhar_vms(cartao, vms_alocadas)
+
+    def _desenhar_vms(self, cartao: Dict, vms_alocadas: tuple):
+        """
+        Posiciona as caixas de VM. Os pares (retângulo, texto) já criados são
+        reaproveitados com coords/itemconfig; os que sobram ficam ocultos.
+        """
+        vm_canvas = cartao["vm_canvas"]
+        vm_items = cartao["vm_items"]
+        overflow_text = cartao["overflow_text"]
+        canvas_width, canvas_height = cartao["vm_canvas_size"]
+
+        vms_por_linha = max(1, (canvas_width - 4) // (VM_BOX_WIDTH + 5))
+        max_linhas = max(0, canvas_height // (VM_BOX_HEIGHT + 5))
+        max_vms_visiveis = max_linhas * vms_por_linha
+
+        vm_canvas.itemconfigure(overflow_text, state="hidden")
+        x, y = 2, 2
+        usados = 0
+        for i, vm_id in enumerate(vms_alocadas):
+            # <<< CORREÇÃO DO OVERFLOW: Reserva espaço para a mensagem "e mais..." >>>
+            if max_vms_visiveis > 0 and i >= (max_vms_visiveis - 1) and len(vms_alocadas) > max_vms_visiveis:
+                vms_restantes = len(vms_alocadas) - i
+                vm_canvas.coords(overflow_text, x, y + 10)
+                vm_canvas.itemconfigure(overflow_text, text=f"...e mais {vms_restantes}", state="normal")
+                break
+
+            if usados == len(vm_items):
+                rect = vm_canvas.create_rectangle(0, 0, 0, 0, fill="#6496FA", outline="")
+                text = vm_canvas.create_text(0, 0, fill="#FFFFFF")
+                vm_items.append((rect, text))
+            rect, text = vm_items[usados]
+            vm_canvas.coords(rect, x, y, x + VM_BOX_WIDTH, y + VM_BOX_HEIGHT)
+            vm_canvas.coords(text, x + VM_BOX_WIDTH / 2, y + VM_BOX_HEIGHT / 2)
+            vm_canvas.itemconfigure(rect, state="normal")
+            vm_canvas.itemconfigure(text, text=f"VM {vm_id}", state="normal")
+            usados += 1
+
+            x += VM_BOX_WIDTH + 5
+            if x + VM_BOX_WIDTH > canvas_width:
+                x = 2; y += VM_BOX_HEIGHT + 5
+
+        for rect, text in vm_items[usados:]:
+            vm_canvas.itemconfigure(rect, state="hidden")
+            vm_canvas.itemconfigure(text, state="hidden")
+
+    # --- Visão geral (heatmap) ------------------------------------------------------------
+
+    def _desenhar_heatmap(self):
+        """
+        Desenha todos os servidores como uma única imagem: um pixel por
+        servidor, ampliado com PhotoImage.zoom. A cor é a maior utilização
+        (CPU ou RAM) do servidor; servidores vazios ficam em cinza.
+        """
+        if not self.modo_heatmap.get() or not self.servidores_base:
+            return
+        largura = max(HEATMAP_CELL, self.heatmap_canvas.winfo_width())
+        colunas = max(1, largura // HEATMAP_CELL)
+        linhas = -(-len(self.servidores_base) // colunas)
+        self._heatmap_colunas = colunas
+
+        pixels = []
+        for inicio in range(0, len(self.servidores_base), colunas):
+            linha = []
+            for servidor in self.servidores_base[inicio:inicio + colunas]:
+                estado = self._estado.get(servidor.id)
+                if estado is None:
+                    linha.append(HEATMAP_COR_VAZIO)
+                    continue
+                cpu_percent = (estado[1] / servidor.cpu_total) if servidor.cpu_total > 0 else 0
+                ram_percent = (estado[2] / servidor.ram_total) if servidor.ram_total > 0 else 0
+                linha.append(_cor_utilizacao(max(cpu_percent, ram_percent)))
+            linha.extend([HEATMAP_COR_FUNDO] * (colunas - len(linha)))
+            pixels.append("{" + " ".join(linha) + "}")
+
+        base = tk.PhotoImage(width=colunas, height=linhas)
+        base.put(" ".join(pixels), to=(0, 0))
+        self._heatmap_imagem = base.zoom(HEATMAP_CELL, HEATMAP_CELL)
+        if self._heatmap_item is None:
+            self._heatmap_item = self.heatmap_canvas.create_image(0, 0, image=self._heatmap_imagem, anchor="nw")
+        else:
+            self.heatmap_canvas.itemconfigure(self._heatmap_item, image=self._heatmap_imagem)
+
+    def _on_heatmap_click(self, event):
+        """Clicar em uma célula do heatmap abre a grade já rolada até aquele servidor."""
+        indice = (event.y // HEATMAP_CELL) * self._heatmap_colunas + (event.x // HEATMAP_CELL)
+        if not (0 <= indice < len(self.servidores_base)):
+            return
+        self.modo_heatmap.set(False)
+        self._alternar_modo()
+        linhas = -(-len(self.servidores_base) // GRID_COLUMNS)
+        self.canvas.yview_moveto((indice // GRID_COLUMNS) / max(1, linhas))
+        self._atualizar_cartoes_visiveis()
+
+
+def _cor_utilizacao(fracao: float) -> str:
+    """Converte uma utilização (0 a 1) em uma cor: verde (baixa) até vermelho (cheio)."""
+    fracao = min(1.0, max(0.0, fracao))
+    vermelho = int(255 * min(1.0, 2 * fracao))
+    verde = int(255 * min(1.0, 2 * (1 - fracao)))
+    return f"#{vermelho:02x}{verde:02x}40"
+
+
+# --- Ponte entre a thread do AG e a interface ---
+class ThrottledRenderer:
+    """
+    Recebe "fotografias" (snapshots) de cada geração, publicadas pela thread
+    do AG, e as desenha no loop do Tkinter com uma taxa máxima de quadros.
+    Snapshots que chegam entre dois quadros são descartados: só o mais
+    recente é desenhado, então a interface nunca segura o AG.
+    """
+    _FIM = object()
+
+    def __init__(self, root: tk.Tk, app: 'DatacenterVisualizer', max_fps: float = MAX_FPS):
+        self.root = root
+        self.app = app
+        self.intervalo_ms = max(1, int(1000 / max_fps))
+        self.fila = queue.Queue(maxsize=2)
+        self.snapshots_descartados = 0
+        self.quadros_desenhados = 0
+        self._finalizado = False
+
+    def publicar(self, best_solution: List[int], generation: int, best_fitness: float, history: List[float]):
+        """
+        Chamado pela thread do AG (on_generation). Não bloqueia: se a fila
+        estiver cheia, o snapshot mais antigo é descartado.
+        """
+        self._colocar((list(best_solution), generation, best_fitness, list(history)))
+
+    def encerrar(self):
+        """Avisa a interface que o AG terminou (chamado pela thread do AG)."""
+        self._colocar(self._FIM)
+
+    def _colocar(self, item):
+        while True:
+            try:
+                self.fila.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self.fila.get_nowait()
+                    self.snapshots_descartados += 1
+                except queue.Empty:
+                    pass
+
+    def iniciar(self):
+        """Inicia o ciclo de desenho no loop de eventos do Tkinter."""
+        self.root.after(0, self._renderizar)
+
+    def _renderizar(self):
+        """Desenha apenas o snapshot mais recente e agenda o próximo quadro."""
+        ultimo = None
+        while True:
+            try:
+                item = self.fila.get_nowait()
+            except queue.Empty:
+                break
+            if item is self._FIM:
+                self._finalizado = True
+                continue
+            if ultimo is not None:
+                self.snapshots_descartados += 1
+            ultimo = item
+
+        if ultimo is not None:
+            self.app.update_view(*ultimo)
+            self.quadros_desenhados += 1
+
+        if not self._finalizado:
+            self.root.after(self.intervalo_ms, self._renderizar)
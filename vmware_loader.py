@@ -0,0 +1,275 @@
+# Arquivo [vmware_loader.py]
+
+"""
+Leitura em blocos (streaming) das exportações CSV do VMware para o projeto DRE.
+
+`carregar_cenario_vmware` lê o CSV de VMs com csv.DictReader (um dict por
+linha), cria um MaquinaVirtual por linha, guarda os nomes em um dict e imprime
+um AVISO por linha duplicada ou inválida; em exportações "sujas", com
+milhões de linhas, o tempo vai quase todo nesses prints e a memória nos
+objetos. Aqui:
+
+- As linhas são lidas com csv.reader (listas, colunas localizadas pelo
+  cabeçalho) e acumuladas em blocos de `tamanho_bloco` linhas, convertidos
+  em arrays NumPy (int32) ao fim de cada bloco. Nenhum objeto é criado por
+  linha; `ler_vms_em_blocos` entrega os blocos um a um para quem quiser
+  processar o inventário sem montá-lo inteiro.
+- A memória e as vCPUs de cada linha são convertidas por tabelas (dict do
+  texto para o valor): uma exportação tem poucas dezenas de valores
+  distintos ("4 GB", "8,192.00 MB", ...), cada um interpretado uma única vez.
+- Os nomes são internados (sys.intern) e a unicidade é verificada por um
+  conjunto (set) desses nomes; a lista de nomes e o conjunto compartilham as
+  mesmas strings.
+- Os avisos viram contadores ('duplicadas', 'invalidas', 'sem_nome',
+  'hosts_desconhecidos'), impressos uma vez ao final com alguns exemplos.
+
+A interpretação é a mesma de `carregar_cenario_vmware` (mesmas VMs, IDs,
+requisitos e capacidades); só os avisos mudam de forma.
+
+Este módulo define:
+- TAMANHO_BLOCO: Linhas por bloco.
+- CenarioColunar: O cenário VMware em arrays (e a conversão para objetos).
+- ler_vms_em_blocos: Lê o CSV de VMs bloco a bloco.
+- carregar_cenario_vmware_colunar: Lê os dois CSVs para um CenarioColunar.
+"""
+
+# Importando
+import csv
+import sys
+import numpy as np
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import datacenter_model
+from datacenter_model import MaquinaVirtual, ServidorFisico, _parse_memory_string_to_gb
+
+
+
+# ===[ 1. Parâmetros ]===================================================================
+
+TAMANHO_BLOCO = 65_536 # Linhas de VMs por bloco.
+
+# Padrões de `carregar_cenario_vmware` para hosts fora do HARDWARE_MAP.
+PCPUS_HOST_DESCONHECIDO = 32
+RAM_HOST_DESCONHECIDO = 128
+
+# Quantos nomes de exemplo guardar por tipo de aviso.
+_EXEMPLOS_AVISO = 3
+
+
+def _registrar_aviso(avisos: Dict[str, int], exemplos: Dict[str, List[str]], tipo: str, exemplo: str):
+    """Soma um aviso do `tipo` e guarda os primeiros exemplos."""
+    avisos[tipo] = avisos.get(tipo, 0) + 1
+    lista = exemplos.setdefault(tipo, [])
+    if len(lista) < _EXEMPLOS_AVISO:
+        lista.append(exemplo)
+
+
+# ===[ 2. Cenário Colunar ]==============================================================
+
+class CenarioColunar:
+    """
+    O cenário VMware em colunas: requisitos das VMs e capacidades dos
+    servidores em arrays, e os nomes em listas (IDs = posições).
+    """
+    def __init__(self, cpu_req: np.ndarray, ram_req: np.ndarray, vm_nomes: List[str],
+                 cpu_total: np.ndarray, ram_total: np.ndarray, servidor_nomes: List[str],
+                 avisos: Optional[Dict[str, int]] = None):
+        """
+        Args:
+            cpu_req, ram_req (np.ndarray): Requisitos das VMs.
+            vm_nomes (List[str]): Nome de cada VM.
+            cpu_total, ram_total (np.ndarray): Capacidades dos servidores (com superalocação).
+            servidor_nomes (List[str]): Nome de cada servidor.
+            avisos (Optional[Dict[str, int]]): Contadores de avisos da leitura.
+        """
+        self.cpu_req = cpu_req
+        self.ram_req = ram_req
+        self.vm_nomes = vm_nomes
+        self.cpu_total = cpu_total
+        self.ram_total = ram_total
+        self.servidor_nomes = servidor_nomes
+        self.avisos = avisos or {}
+
+    @property
+    def num_vms(self) -> int:
+        return len(self.cpu_req)
+
+    @property
+    def num_servidores(self) -> int:
+        return len(self.cpu_total)
+
+    def para_objetos(self) -> Dict[str, list]:
+        """Converte para o formato de `carregar_cenario_vmware` ('servidores' e 'vms')."""
+        servidores = [
+            ServidorFisico(s_id, cpu, ram, nome_real=nome or None)
+            for s_id, (cpu, ram, nome) in enumerate(zip(self.cpu_total.tolist(), self.ram_total.tolist(), self.servidor_nomes))
+        ]
+        vms = [
+            MaquinaVirtual(vm_id, cpu, ram, nome_real=nome or None)
+            for vm_id, (cpu, ram, nome) in enumerate(zip(self.cpu_req.tolist(), self.ram_req.tolist(), self.vm_nomes))
+        ]
+        return {'servidores': servidores, 'vms': vms}
+
+    def __repr__(self) -> str:
+        """Retorna uma representação em string do objeto, útil para debug."""
+        return f"CenarioColunar(VMs: {self.num_vms}, Servidores: {self.num_servidores}, Avisos: {self.avisos})"
+
+
+# ===[ 3. Leitura ]======================================================================
+
+def _colunas(cabecalho: List[str], nomes: Tuple[str, ...], caminho: str) -> Tuple[int, ...]:
+    """Posições das colunas `nomes` no cabeçalho. Lança ValueError se faltar alguma."""
+    cabecalho = [coluna.strip() for coluna in cabecalho]
+    faltando = [nome for nome in nomes if nome not in cabecalho]
+    if faltando:
+        raise ValueError(f"Colunas {faltando} ausentes no cabeçalho de '{caminho}'.")
+    return tuple(cabecalho.index(nome) for nome in nomes)
+
+
+def _ler_servidores(caminho: str, avisos: Dict[str, int], exemplos: Dict[str, List[str]]) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+    """Capacidades dos hosts pelo HARDWARE_MAP (a mesma regra de `carregar_cenario_vmware`)."""
+    # Lidos na chamada, para respeitar alterações feitas em tempo de execução.
+    hardware_map = datacenter_model.HARDWARE_MAP
+    vcpu_pcpu_ratio = datacenter_model.VCPU_PCPU_RATIO
+    cpu_total, ram_total, nomes = [], [], []
+    with open(caminho, mode='r', encoding='utf-8-sig', newline='') as csvfile:
+        reader = csv.reader(csvfile)
+        (i_nome,) = _colunas(next(reader, []), ('Name',), caminho)
+        for row in reader:
+            if not row:
+                continue
+            hostname = row[i_nome].strip() if i_nome < len(row) else ''
+            hardware_info = next((hw for prefix, hw in hardware_map.items() if hostname.startswith(prefix)), None)
+            if hardware_info is None:
+                _registrar_aviso(avisos, exemplos, 'hosts_desconhecidos', hostname)
+                cpu_total.append(PCPUS_HOST_DESCONHECIDO * vcpu_pcpu_ratio)
+                ram_total.append(RAM_HOST_DESCONHECIDO)
+            else:
+                cpu_total.append(hardware_info['pCPUs'] * vcpu_pcpu_ratio)
+                ram_total.append(hardware_info['ram_gb'])
+            nomes.append(sys.intern(hostname))
+    return np.array(cpu_total, dtype=np.int64), np.array(ram_total, dtype=np.int64), nomes
+
+
+def ler_vms_em_blocos(
+    caminho: str,
+    tamanho_bloco: int = TAMANHO_BLOCO,
+    avisos: Optional[Dict[str, int]] = None,
+    exemplos: Optional[Dict[str, List[str]]] = None
+) -> Iterator[Tuple[np.ndarray, np.ndarray, List[str]]]:
+    """
+    Lê o CSV de VMs e entrega blocos (cpu_req, ram_req, nomes) de até
+    `tamanho_bloco` VMs únicas, na ordem do arquivo.
+
+    Linhas sem nome, com nome repetido ou inválidas (CPUs não inteiro, colunas
+    faltando) são ignoradas e contadas em `avisos`. Como em
+    `carregar_cenario_vmware`, um nome só é reservado quando a linha é válida.
+    Lança FileNotFoundError se o arquivo não existir e ValueError se faltar
+    alguma coluna no cabeçalho.
+    """
+    avisos = avisos if avisos is not None else {}
+    exemplos = exemplos if exemplos is not None else {}
+    vistos = set()
+    ram_por_texto: Dict[str, int] = {}
+    cpu_por_texto: Dict[str, int] = {}
+
+    with open(caminho, mode='r', encoding='utf-8-sig', newline='') as csvfile:
+        reader = csv.reader(csvfile)
+        i_nome, i_memoria, i_cpus = _colunas(next(reader, []), ('Name', 'Memory Size', 'CPUs'), caminho)
+        ultima_coluna = max(i_nome, i_memoria, i_cpus)
+
+        cpus, rams, nomes = [], [], []
+        for row in reader:
+            if not row:
+                continue
+            if len(row) <= ultima_coluna:
+                _registrar_aviso(avisos, exemplos, 'invalidas', ",".join(row))
+                continue
+            nome = row[i_nome].strip()
+            if not nome:
+                avisos['sem_nome'] = avisos.get('sem_nome', 0) + 1
+                continue
+            if nome in vistos:
+                _registrar_aviso(avisos, exemplos, 'duplicadas', nome)
+                continue
+
+            texto_ram = row[i_memoria]
+            ram = ram_por_texto.get(texto_ram)
+            if ram is None:
+                ram = ram_por_texto[texto_ram] = _parse_memory_string_to_gb(texto_ram)
+            texto_cpu = row[i_cpus]
+            cpu = cpu_por_texto.get(texto_cpu)
+            if cpu is None:
+                try:
+                    cpu = cpu_por_texto[texto_cpu] = int(texto_cpu)
+                except ValueError:
+                    _registrar_aviso(avisos, exemplos, 'invalidas', ",".join(row))
+                    continue
+
+            nome = sys.intern(nome)
+            vistos.add(nome)
+            cpus.append(cpu)
+            rams.append(ram)
+            nomes.append(nome)
+            if len(cpus) >= tamanho_bloco:
+                yield np.array(cpus, dtype=np.int32), np.array(rams, dtype=np.int32), nomes
+                cpus, rams, nomes = [], [], []
+        if cpus:
+            yield np.array(cpus, dtype=np.int32), np.array(rams, dtype=np.int32), nomes
+
+
+def _imprimir_avisos(avisos: Dict[str, int], exemplos: Dict[str, List[str]]):
+    """Um AVISO por tipo (e não por linha), com alguns exemplos."""
+    descricoes = {
+        'hosts_desconhecidos': f"host(s) de modelo desconhecido (usando {PCPUS_HOST_DESCONHECIDO} pCPUs e {RAM_HOST_DESCONHECIDO} GB)",
+        'duplicadas': "VM(s) com nome duplicado ignorada(s)",
+        'invalidas': "linha(s) de VM inválida(s) ignorada(s)",
+        'sem_nome': "linha(s) de VM sem nome ignorada(s)",
+    }
+    for tipo, descricao in descricoes.items():
+        if avisos.get(tipo):
+            amostra = exemplos.get(tipo)
+            sufixo = f" Ex.: {', '.join(repr(e) for e in amostra)}" if amostra else ""
+            print(f"AVISO: {avisos[tipo]} {descricao}.{sufixo}")
+
+
+def carregar_cenario_vmware_colunar(caminho_servidores: str, caminho_vms: str, tamanho_bloco: int = TAMANHO_BLOCO) -> Optional[CenarioColunar]:
+    """
+    Lê as exportações do VMware em blocos para um CenarioColunar.
+    Retorna None (após imprimir o erro) se algum arquivo não existir ou não
+    tiver as colunas esperadas.
+
+    Args:
+        caminho_servidores, caminho_vms (str): Os CSVs exportados do VMware.
+        tamanho_bloco (int): Linhas de VMs por bloco.
+    """
+    avisos: Dict[str, int] = {}
+    exemplos: Dict[str, List[str]] = {}
+    try:
+        cpu_total, ram_total, servidor_nomes = _ler_servidores(caminho_servidores, avisos, exemplos)
+    except FileNotFoundError:
+        print(f"ERRO: Arquivo de servidores não encontrado em '{caminho_servidores}'")
+        return None
+    except ValueError as e:
+        print(f"ERRO: {e}")
+        return None
+    print(f"Lidos {len(servidor_nomes)} servidores. Capacidade calculada com superalocação.")
+
+    blocos_cpu, blocos_ram, vm_nomes = [], [], []
+    try:
+        for cpus, rams, nomes in ler_vms_em_blocos(caminho_vms, tamanho_bloco, avisos, exemplos):
+            blocos_cpu.append(cpus)
+            blocos_ram.append(rams)
+            vm_nomes.extend(nomes)
+    except FileNotFoundError:
+        print(f"ERRO: Arquivo de VMs não encontrado em '{caminho_vms}'")
+        return None
+    except ValueError as e:
+        print(f"ERRO: {e}")
+        return None
+
+    cpu_req = np.concatenate(blocos_cpu).astype(np.int64) if blocos_cpu else np.zeros(0, dtype=np.int64)
+    ram_req = np.concatenate(blocos_ram).astype(np.int64) if blocos_ram else np.zeros(0, dtype=np.int64)
+    _imprimir_avisos(avisos, exemplos)
+    print(f"Lidas {len(vm_nomes)} VMs únicas.")
+    return CenarioColunar(cpu_req, ram_req, vm_nomes, cpu_total, ram_total, servidor_nomes, avisos)